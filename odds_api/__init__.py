@@ -5,15 +5,54 @@ Official Python client for the Odds-API.io sports betting odds API.
 
 __version__ = "1.0.0"
 
-from .client import OddsAPIClient
+from .arbitrage import ArbitrageScanner
 from .async_client import AsyncOddsAPIClient
+from .book import OddsBook
+from .cache import ResponseCache, SQLiteCache
+from .client import OddsAPIClient
 from .exceptions import (
-    OddsAPIError,
     InvalidAPIKeyError,
-    RateLimitExceededError,
     NotFoundError,
+    OddsAPIError,
+    RateLimitExceededError,
+    TransportError,
     ValidationError,
 )
+from .export import OddsWriter
+from .hooks import RequestRecord
+from .metrics import MetricsCollector
+from .models import (
+    ArbitrageBet,
+    BookmakerOdds,
+    Event,
+    Market,
+    Outcome,
+    Participant,
+    ValueBet,
+)
+from .pool import PoolConfig
+from .prefetch import PrefetchProgress
+from .quota import Quota
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .stream import OddsStream, StreamMessage
+from .sync_engine import (
+    AsyncOddsSyncEngine,
+    CursorStore,
+    FileCursorStore,
+    OddsSyncEngine,
+)
+from .timeseries import OddsHistory
+from .tracker import OpportunityTracker
+from .transport import (
+    AiohttpTransport,
+    AsyncHTTPXTransport,
+    AsyncTransport,
+    HTTPXTransport,
+    RequestsTransport,
+    Transport,
+)
+from .value import ValueScanner
 
 __all__ = [
     "OddsAPIClient",
@@ -23,5 +62,40 @@ __all__ = [
     "RateLimitExceededError",
     "NotFoundError",
     "ValidationError",
+    "TransportError",
+    "RetryPolicy",
+    "RateLimiter",
+    "Quota",
+    "ResponseCache",
+    "SQLiteCache",
+    "Event",
+    "Participant",
+    "BookmakerOdds",
+    "Market",
+    "Outcome",
+    "ArbitrageBet",
+    "ValueBet",
+    "OddsSyncEngine",
+    "AsyncOddsSyncEngine",
+    "CursorStore",
+    "FileCursorStore",
+    "OddsStream",
+    "StreamMessage",
+    "OddsBook",
+    "ArbitrageScanner",
+    "ValueScanner",
+    "OpportunityTracker",
+    "OddsHistory",
+    "OddsWriter",
+    "PrefetchProgress",
+    "PoolConfig",
+    "Transport",
+    "AsyncTransport",
+    "RequestsTransport",
+    "AiohttpTransport",
+    "HTTPXTransport",
+    "AsyncHTTPXTransport",
+    "RequestRecord",
+    "MetricsCollector",
     "__version__",
 ]
@@ -1,16 +1,57 @@
 """Asynchronous client for the Odds-API.io API."""
 
-from typing import Any, Dict, Optional, List
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
 import aiohttp
 
-from .constants import BASE_API_URL, DEFAULT_TIMEOUT, Endpoints
+from .book import OddsBook
+from .cache import BaseCache, ValidatorStore
+from .coalesce import AsyncSingleFlight
+from .constants import (
+    BASE_API_URL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    MAX_EVENT_IDS_PER_REQUEST,
+    Endpoints,
+)
+from .decoders import JSONDecoder, get_decoder
 from .exceptions import (
     InvalidAPIKeyError,
     NotFoundError,
     OddsAPIError,
     RateLimitExceededError,
+    TransportError,
     ValidationError,
 )
+from .hooks import RequestHook, RequestRecord, track
+from .models import ArbitrageBet, Event, Participant, ValueBet
+from .pool import PoolConfig, origin
+from .prefetch import Leagues, PrefetchProgress, ProgressCallback, league_list
+from .quota import Quota
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .streaming import JSONArrayParser
+from .transport import AiohttpTransport, AsyncTransport, Response
+from .utils import (
+    EventIds,
+    RequestKey,
+    chunked,
+    gather_or_cancel,
+    normalize_ids,
+    request_key,
+)
 
 
 class AsyncOddsAPIClient:
@@ -21,6 +62,41 @@ class AsyncOddsAPIClient:
         api_key: Your Odds-API.io API key
         timeout: Request timeout in seconds (default: 10)
         base_url: Base API URL (default: https://api2.odds-api.io/v3)
+        retry_policy: Backoff policy for 429s, 5xx responses and connection
+            errors (default: ``RetryPolicy()``; pass
+            ``RetryPolicy(max_retries=0)`` to disable retries)
+        rate_limiter: Optional ``RateLimiter`` consulted before every
+            request; one instance may be shared between several clients
+        quota: Optional ``Quota`` tracking the plan's remaining requests
+            from the API's rate-limit headers, or from a configured budget,
+            and slowing requests down as it runs out; exposed as
+            ``client.quota`` (default: None, no tracking or throttling)
+        coalesce_requests: If True, identical GET requests made while one is
+            already in flight share its result instead of hitting the API
+            again (default: False). Shared results must not be mutated.
+        cache: Optional ``ResponseCache`` or ``SQLiteCache`` for GET
+            responses; TTLs are set per endpoint, so reference data is cached
+            and odds are not. Stale entries are refreshed in the background.
+        conditional_requests: If True, remember ``ETag``/``Last-Modified``
+            validators per request and send conditional requests; a
+            ``304 Not Modified`` returns the previously decoded object
+            (default: False)
+        json_decoder: ``"orjson"``, ``"msgspec"``, ``"json"`` or a callable
+            decoding bytes; by default the fastest installed decoder is used
+        return_models: If True, events, odds, participants, arbitrage and
+            value bets are returned as compact ``__slots__`` models from
+            ``odds_api.models`` instead of dicts (default: False)
+        pool: ``PoolConfig`` with connection pool, keep-alive and DNS cache
+            settings (default: ``PoolConfig()``); set ``prewarm`` to open
+            connections when the client starts. Ignored if ``transport``
+            is given.
+        transport: ``AsyncTransport`` sending the requests (default:
+            ``AiohttpTransport``); ``AsyncHTTPXTransport`` multiplexes
+            requests over HTTP/2
+        hooks: Callables receiving a ``RequestRecord`` with the timings,
+            status, size and retries of every finished request; more can be
+            appended to ``client.hooks`` later. With no hooks nothing is
+            recorded.
 
     Example:
         >>> async with AsyncOddsAPIClient(api_key="your_api_key") as client:
@@ -33,29 +109,58 @@ class AsyncOddsAPIClient:
         api_key: str,
         timeout: int = DEFAULT_TIMEOUT,
         base_url: str = BASE_API_URL,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        quota: Optional[Quota] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[BaseCache] = None,
+        conditional_requests: bool = False,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        return_models: bool = False,
+        pool: Optional[PoolConfig] = None,
+        transport: Optional[AsyncTransport] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
     ):
         """Initialize the async Odds API client."""
         if not api_key:
             raise ValueError("API key is required")
 
         self.api_key = api_key
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = timeout
         self.base_url = base_url
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.quota = quota
+        self.cache = cache
+        self.json_decoder = get_decoder(json_decoder)
+        self.return_models = return_models
+        self.validators = ValidatorStore() if conditional_requests else None
+        self._revalidating: Dict[RequestKey, "asyncio.Task[Any]"] = {}
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.transport = transport or AiohttpTransport(timeout, pool)
+        self.pool = self.transport.pool
+        self.hooks: List[RequestHook] = list(hooks or ())
 
     @property
-    def session(self) -> aiohttp.ClientSession:
-        """Get or create the aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
-        return self._session
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """The aiohttp session of the default transport, if used."""
+        return getattr(self.transport, "session", None)
 
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
+    def _handle_response(
+        self, response: Response, record: Optional[RequestRecord] = None
+    ) -> Any:
         """Handle API response and raise appropriate exceptions."""
-        if response.status == 200:
-            return await response.json()
-
-        text = await response.text()
+        if response.ok:
+            started = time.perf_counter()
+            try:
+                data = self.json_decoder(response.body)
+            except ValueError as e:
+                raise OddsAPIError(f"Invalid JSON response: {e}") from e
+            if record is not None:
+                record.decode = time.perf_counter() - started
+            return data
+
+        text = response.text
         status = response.status
 
         if status == 400:
@@ -71,29 +176,198 @@ class AsyncOddsAPIClient:
         else:
             raise OddsAPIError(f"API error {status}: {text}")
 
-    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """Make a GET request to the API."""
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        record: Optional[RequestRecord] = None,
+    ) -> Response:
+        """
+        Send a request, retrying transient failures per the retry policy.
+
+        With ``stream=True`` the body is not downloaded up front and the
+        caller must close the response. The outcome is noted in ``record``
+        if given.
+        """
+        path = endpoint.format(**path_params) if path_params else endpoint
         url = f"{self.base_url}/{path}"
-        params = params or {}
+        params = dict(params or {})
         params["apiKey"] = self.api_key
 
-        try:
-            async with self.session.get(url, params=params) as response:
-                return await self._handle_response(response)
-        except aiohttp.ClientError as e:
-            raise OddsAPIError(f"Request failed: {e}") from e
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            waited = time.perf_counter()
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+            if self.quota is not None:
+                await self.quota.acquire_async()
+            if record is not None:
+                record.wait += time.perf_counter() - waited
+            try:
+                response = await self.transport.request(
+                    method, url, params, headers, stream
+                )
+            except TransportError as e:
+                delay = policy.get_delay(attempt, time.monotonic() - started)
+                if delay is None:
+                    if record is not None:
+                        record.retries = attempt
+                    raise OddsAPIError(f"Request failed: {e}") from e
+            else:
+                if self.quota is not None:
+                    self.quota.update(response.headers)
+                delay = None
+                if policy.is_retryable_status(response.status):
+                    delay = policy.get_delay(
+                        attempt,
+                        time.monotonic() - started,
+                        parse_retry_after(response.headers.get("Retry-After")),
+                    )
+                if delay is None:
+                    if record is not None:
+                        record.set_response(response, attempt)
+                    return response
+                await response.aclose()
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Send a request and decode the response."""
+        if not self.hooks:
+            response = await self._send(method, endpoint, params, path_params)
+            return self._handle_response(response)
+        with track(self.hooks, method, endpoint, params) as record:
+            response = await self._send(
+                method, endpoint, params, path_params, record=record
+            )
+            return self._handle_response(response, record)
 
-    async def _put(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make a GET request to the API, via the cache when enabled."""
+        cache = self.cache
+        ttl = cache.ttl_for(endpoint) if cache is not None else 0
+        validators = self.validators
+        if ttl <= 0 and self._single_flight is None and validators is None:
+            return await self._request("GET", endpoint, params, path_params)
+
+        key = request_key(endpoint, params, path_params)
+
+        async def load() -> Any:
+            with track(self.hooks, "GET", endpoint, params) as record:
+                stored = validators.get(key) if validators is not None else None
+                response = await self._send(
+                    "GET",
+                    endpoint,
+                    params,
+                    path_params,
+                    stored.headers() if stored is not None else None,
+                    record=record,
+                )
+                if stored is not None and response.status == 304:
+                    validators.record_not_modified()
+                    data, size = stored.value, stored.size
+                else:
+                    data = self._handle_response(response, record)
+                    size = len(response.body)
+                    if validators is not None:
+                        validators.update(key, response.headers, data, size)
+            if ttl > 0:
+                cache.set(key, data, size, ttl)
+            return data
+
+        if ttl > 0:
+            entry = cache.get(key)
+            if entry is not None:
+                if self.hooks:
+                    with track(self.hooks, "GET", endpoint, params) as record:
+                        record.cache_hit = True  # type: ignore[union-attr]
+                if not entry.is_fresh():
+                    self._revalidate(key, load)
+                return entry.value
+
+        if self._single_flight is None:
+            return await load()
+        return await self._single_flight.do(key, load)
+
+    def _revalidate(self, key: RequestKey, load: Callable[[], Awaitable[Any]]) -> None:
+        """Refresh a stale cache entry in a background task."""
+        if key in self._revalidating:
+            return
+
+        task = asyncio.ensure_future(load())
+        self._revalidating[key] = task
+
+        def done(t: "asyncio.Task[Any]") -> None:
+            self._revalidating.pop(key, None)
+            # The stale entry stays usable until its stale window ends
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(done)
+
+    async def _put(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Make a PUT request to the API."""
-        url = f"{self.base_url}/{path}"
-        params = params or {}
-        params["apiKey"] = self.api_key
-
-        try:
-            async with self.session.put(url, params=params) as response:
-                return await self._handle_response(response)
-        except aiohttp.ClientError as e:
-            raise OddsAPIError(f"Request failed: {e}") from e
+        return await self._request("PUT", endpoint, params)
+
+    async def _iter(
+        self, endpoint: str, params: Dict[str, Any], model: Any
+    ) -> AsyncIterator[Any]:
+        """Stream a list response, yielding items as they are parsed."""
+        with track(self.hooks, "GET", endpoint, params) as record:
+            response = await self._send(
+                "GET", endpoint, params, stream=True, record=record
+            )
+            started = time.perf_counter()
+            try:
+                if not response.ok:
+                    await response.aread()
+                    self._handle_response(response)
+
+                parser = JSONArrayParser()
+                convert = model.from_dict if self.return_models else None
+                try:
+                    async for chunk in response.chunks:  # type: ignore[union-attr]
+                        if record is not None:
+                            record.bytes += len(chunk)
+                        for item in parser.feed(chunk):
+                            yield convert(item) if convert else item
+                    for item in parser.close():
+                        yield convert(item) if convert else item
+                except TransportError as e:
+                    raise OddsAPIError(f"Request failed: {e}") from e
+                except ValueError as e:
+                    raise OddsAPIError(f"Invalid JSON response: {e}") from e
+            finally:
+                await response.aclose()
+                if record is not None:
+                    record.streamed = True
+                    record.transfer = time.perf_counter() - started
+
+    def _parse(self, data: Any, model: Any) -> Any:
+        """Convert a decoded response into ``model`` instances if enabled."""
+        if not self.return_models or data is None:
+            return data
+        if isinstance(data, list):
+            return [model.from_dict(item) for item in data]
+        return model.from_dict(data)
 
     @staticmethod
     def _build_params(**kwargs) -> Dict[str, Any]:
@@ -109,6 +383,33 @@ class AsyncOddsAPIClient:
                 params[k] = v
         return params
 
+    @classmethod
+    def _events_params(
+        cls,
+        sport: str,
+        league: Optional[str],
+        participant_id: Optional[int],
+        status: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        bookmaker: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build the query parameters shared by get_events and iter_events."""
+        params = cls._build_params(
+            sport=sport,
+            league=league,
+            participantId=participant_id,
+            status=status,
+            bookmaker=bookmaker,
+        )
+
+        # Map start/end to from/to
+        if start:
+            params["from"] = start
+        if end:
+            params["to"] = end
+        return params
+
     # Sports & Leagues
 
     async def get_sports(self) -> List[Dict[str, Any]]:
@@ -152,7 +453,7 @@ class AsyncOddsAPIClient:
         start: Optional[str] = None,
         end: Optional[str] = None,
         bookmaker: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get events with optional filters.
 
@@ -175,23 +476,51 @@ class AsyncOddsAPIClient:
             ...     status="upcoming"
             ... )
         """
-        params = self._build_params(
-            sport=sport,
-            league=league,
-            participantId=participant_id,
-            status=status,
-            bookmaker=bookmaker,
+        params = self._events_params(
+            sport, league, participant_id, status, start, end, bookmaker
         )
+        data = await self._get(Endpoints.GET_EVENTS, params)
+        return self._parse(data, Event)
 
-        # Map start/end to from/to
-        if start:
-            params["from"] = start
-        if end:
-            params["to"] = end
+    def iter_events(
+        self,
+        sport: str,
+        league: Optional[str] = None,
+        participant_id: Optional[int] = None,
+        status: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        bookmaker: Optional[str] = None,
+    ) -> AsyncIterator[Union[Dict[str, Any], Event]]:
+        """
+        Stream events with optional filters.
+
+        Like ``get_events``, but the response is parsed incrementally and
+        events are yielded as they arrive, so memory use does not grow with
+        the number of events. Responses are never cached.
+
+        Args:
+            sport: Sport identifier (required)
+            league: League identifier
+            participant_id: Filter by participant ID
+            status: Event status (e.g., "upcoming", "live", "finished")
+            start: Start date/time filter (ISO 8601 format)
+            end: End date/time filter (ISO 8601 format)
+            bookmaker: Filter by bookmaker
 
-        return await self._get(Endpoints.GET_EVENTS, params)
+        Yields:
+            Events matching the filters
 
-    async def get_event_by_id(self, event_id: int) -> Dict[str, Any]:
+        Example:
+            >>> async for event in client.iter_events(sport="football"):
+            ...     print(event["home"], event["away"])
+        """
+        params = self._events_params(
+            sport, league, participant_id, status, start, end, bookmaker
+        )
+        return self._iter(Endpoints.GET_EVENTS, params, Event)
+
+    async def get_event_by_id(self, event_id: int) -> Union[Dict[str, Any], Event]:
         """
         Get a specific event by ID.
 
@@ -204,10 +533,12 @@ class AsyncOddsAPIClient:
         Example:
             >>> event = await client.get_event_by_id(event_id=12345)
         """
-        path = Endpoints.GET_EVENT_BY_ID.format(id=event_id)
-        return await self._get(path)
+        data = await self._get(Endpoints.GET_EVENT_BY_ID, path_params={"id": event_id})
+        return self._parse(data, Event)
 
-    async def get_live_events(self, sport: str) -> List[Dict[str, Any]]:
+    async def get_live_events(
+        self, sport: str
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get currently live events for a sport.
 
@@ -221,9 +552,12 @@ class AsyncOddsAPIClient:
             >>> live_events = await client.get_live_events(sport="basketball")
         """
         params = self._build_params(sport=sport)
-        return await self._get(Endpoints.GET_LIVE_EVENTS, params)
+        data = await self._get(Endpoints.GET_LIVE_EVENTS, params)
+        return self._parse(data, Event)
 
-    async def search_events(self, query: str) -> List[Dict[str, Any]]:
+    async def search_events(
+        self, query: str
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Search for events by keyword.
 
@@ -237,13 +571,14 @@ class AsyncOddsAPIClient:
             >>> events = await client.search_events(query="Lakers")
         """
         params = self._build_params(query=query)
-        return await self._get(Endpoints.SEARCH_EVENTS, params)
+        data = await self._get(Endpoints.SEARCH_EVENTS, params)
+        return self._parse(data, Event)
 
     # Odds
 
     async def get_event_odds(
         self, event_id: str, bookmakers: str
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], Event]:
         """
         Get odds for a specific event.
 
@@ -261,7 +596,8 @@ class AsyncOddsAPIClient:
             ... )
         """
         params = self._build_params(eventId=event_id, bookmakers=bookmakers)
-        return await self._get(Endpoints.GET_EVENT_ODDS, params)
+        data = await self._get(Endpoints.GET_EVENT_ODDS, params)
+        return self._parse(data, Event)
 
     async def get_odds_movement(
         self,
@@ -298,30 +634,138 @@ class AsyncOddsAPIClient:
         return await self._get(Endpoints.GET_ODDS_MOVEMENT, params)
 
     async def get_odds_for_multiple_events(
-        self, event_ids: str, bookmakers: str
-    ) -> List[Dict[str, Any]]:
+        self,
+        event_ids: EventIds,
+        bookmakers: str,
+        chunk_size: int = MAX_EVENT_IDS_PER_REQUEST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get odds for multiple events at once.
 
+        The IDs are split into chunks the API accepts in one request and the
+        chunks are fetched concurrently, at most ``max_concurrency`` at a time.
+        Results are merged in the order of the input IDs. If a chunk fails,
+        the chunks still in flight are cancelled before the error is raised.
+
         Args:
-            event_ids: Comma-separated event IDs
+            event_ids: Comma-separated event IDs or any iterable of IDs
             bookmakers: Comma-separated bookmaker slugs
+            chunk_size: Maximum event IDs per request (default: 10)
+            max_concurrency: Maximum chunks in flight at once (default: 8)
 
         Returns:
             Odds data for multiple events
 
         Example:
             >>> odds = await client.get_odds_for_multiple_events(
-            ...     event_ids="12345,67890",
+            ...     event_ids=[12345, 67890],
             ...     bookmakers="singbet,bet365"
             ... )
         """
-        params = self._build_params(eventIds=event_ids, bookmakers=bookmakers)
-        return await self._get(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS, params)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+            params = self._build_params(eventIds=",".join(chunk), bookmakers=bookmakers)
+            async with semaphore:
+                return await self._get(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS, params)
+
+        chunks = chunked(normalize_ids(event_ids), chunk_size)
+        results = await gather_or_cancel(*[fetch(chunk) for chunk in chunks])
+
+        merged: List[Dict[str, Any]] = []
+        for result in results:
+            merged.extend(result or [])
+        return self._parse(merged, Event)
+
+    async def prefetch_snapshot(
+        self,
+        sport: str,
+        leagues: Leagues = None,
+        status: Optional[str] = None,
+        bookmakers: Optional[str] = None,
+        book: Optional[OddsBook] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = MAX_EVENT_IDS_PER_REQUEST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> OddsBook:
+        """
+        Load the current odds of a whole sport, or of some of its leagues,
+        into an ``OddsBook``.
+
+        League listings and odds batches run as one pipeline with at most
+        ``max_concurrency`` requests in flight: a league's odds batches
+        start as soon as its events are listed, while other leagues are
+        still being listed. The listed events' fields (teams, sport,
+        league, ...) are recorded in the book as well, so ``book.event(id)``
+        returns them even for events without prices. ``book.event_ids``
+        lists only the events that have prices.
+
+        Args:
+            sport: Sport identifier
+            leagues: League slugs, comma-separated or as an iterable
+                (default: the whole sport in one listing)
+            status: Event status filter (e.g. "pending", "live")
+            bookmakers: Comma-separated bookmaker slugs (default: None,
+                the parameter is not sent)
+            book: Book to load into (default: a new ``OddsBook``)
+            progress: Optional callback receiving a ``PrefetchProgress``
+                after every completed request
+            chunk_size: Maximum event IDs per odds request (default: 10)
+            max_concurrency: Maximum requests in flight at once (default: 8)
+
+        Returns:
+            The populated ``OddsBook``
+
+        Example:
+            >>> book = await client.prefetch_snapshot(
+            ...     "football",
+            ...     leagues="england-premier-league,spain-laliga",
+            ...     status="pending",
+            ...     bookmakers="Bet365,SingBet",
+            ...     progress=lambda p: print(p.batches_done, "/", p.batches_total),
+            ... )
+        """
+        book = book if book is not None else OddsBook()
+        slugs = league_list(leagues)
+        state = PrefetchProgress(len(slugs))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def report() -> None:
+            if progress is not None:
+                progress(state)
+
+        async def fetch_odds(chunk: List[str]) -> None:
+            params = self._build_params(eventIds=",".join(chunk), bookmakers=bookmakers)
+            async with semaphore:
+                data = await self._get(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS, params)
+            book.load(data or [])
+            state.batches_done += 1
+            state.quotes = len(book)
+            report()
+
+        async def fetch_league(league: Optional[str]) -> None:
+            params = self._events_params(sport, league, None, status, None, None, None)
+            async with semaphore:
+                events = await self._get(Endpoints.GET_EVENTS, params) or []
+            listed = [e for e in events if e.get("id") is not None]
+            for event in listed:
+                book.set_event(event["id"], **event)
+            ids = normalize_ids(e["id"] for e in listed)
+            chunks = list(chunked(ids, chunk_size))
+            state.leagues_done += 1
+            state.events += len(ids)
+            state.batches_total += len(chunks)
+            report()
+            await gather_or_cancel(*[fetch_odds(chunk) for chunk in chunks])
+
+        # A failure cancels every league, and each league its odds batches
+        await gather_or_cancel(*[fetch_league(league) for league in slugs])
+        return book
 
     async def get_updated_odds_since_timestamp(
         self, since: int, bookmaker: str, sport: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get odds updated since a given timestamp.
 
@@ -341,13 +785,40 @@ class AsyncOddsAPIClient:
             ... )
         """
         params = self._build_params(since=since, bookmaker=bookmaker, sport=sport)
-        return await self._get(Endpoints.GET_UPDATED_ODDS_SINCE_TIMESTAMP, params)
+        data = await self._get(Endpoints.GET_UPDATED_ODDS_SINCE_TIMESTAMP, params)
+        return self._parse(data, Event)
+
+    def iter_updated_odds(
+        self, since: int, bookmaker: str, sport: str
+    ) -> AsyncIterator[Union[Dict[str, Any], Event]]:
+        """
+        Stream odds updated since a given timestamp.
+
+        Like ``get_updated_odds_since_timestamp``, but items are yielded as
+        they are parsed instead of after the whole body has been decoded.
+
+        Args:
+            since: Unix timestamp
+            bookmaker: Bookmaker slug
+            sport: Sport identifier
+
+        Yields:
+            Updated odds, one event at a time
+
+        Example:
+            >>> async for update in client.iter_updated_odds(
+            ...     since=1640000000, bookmaker="singbet", sport="basketball"
+            ... ):
+            ...     process(update)
+        """
+        params = self._build_params(since=since, bookmaker=bookmaker, sport=sport)
+        return self._iter(Endpoints.GET_UPDATED_ODDS_SINCE_TIMESTAMP, params, Event)
 
     # Participants
 
     async def get_participants(
         self, sport: str, search: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[Participant]]:
         """
         Get participants (teams/players) for a sport.
 
@@ -365,9 +836,35 @@ class AsyncOddsAPIClient:
             ... )
         """
         params = self._build_params(sport=sport, search=search)
-        return await self._get(Endpoints.GET_PARTICIPANTS, params)
+        data = await self._get(Endpoints.GET_PARTICIPANTS, params)
+        return self._parse(data, Participant)
+
+    def iter_participants(
+        self, sport: str, search: Optional[str] = None
+    ) -> AsyncIterator[Union[Dict[str, Any], Participant]]:
+        """
+        Stream participants (teams/players) for a sport.
+
+        Like ``get_participants``, but participants are yielded as they are
+        parsed instead of after the whole body has been decoded.
+
+        Args:
+            sport: Sport identifier
+            search: Optional search query
+
+        Yields:
+            Participants, one at a time
+
+        Example:
+            >>> async for participant in client.iter_participants(sport="tennis"):
+            ...     print(participant["name"])
+        """
+        params = self._build_params(sport=sport, search=search)
+        return self._iter(Endpoints.GET_PARTICIPANTS, params, Participant)
 
-    async def get_participant_by_id(self, participant_id: int) -> Dict[str, Any]:
+    async def get_participant_by_id(
+        self, participant_id: int
+    ) -> Union[Dict[str, Any], Participant]:
         """
         Get a specific participant by ID.
 
@@ -380,8 +877,10 @@ class AsyncOddsAPIClient:
         Example:
             >>> participant = await client.get_participant_by_id(participant_id=3428)
         """
-        path = Endpoints.GET_PARTICIPANT_BY_ID.format(id=participant_id)
-        return await self._get(path)
+        data = await self._get(
+            Endpoints.GET_PARTICIPANT_BY_ID, path_params={"id": participant_id}
+        )
+        return self._parse(data, Participant)
 
     # Bookmakers
 
@@ -444,7 +943,7 @@ class AsyncOddsAPIClient:
         bookmakers: str,
         limit: Optional[int] = None,
         include_event_details: Optional[bool] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[ArbitrageBet]]:
         """
         Find arbitrage betting opportunities.
 
@@ -468,13 +967,14 @@ class AsyncOddsAPIClient:
             limit=limit,
             includeEventDetails=include_event_details,
         )
-        return await self._get(Endpoints.GET_ARBITRAGE_BETS, params)
+        data = await self._get(Endpoints.GET_ARBITRAGE_BETS, params)
+        return self._parse(data, ArbitrageBet)
 
     async def get_value_bets(
         self,
         bookmaker: str,
         include_event_details: Optional[bool] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[ValueBet]]:
         """
         Find value betting opportunities.
 
@@ -495,15 +995,39 @@ class AsyncOddsAPIClient:
             bookmaker=bookmaker,
             includeEventDetails=include_event_details,
         )
-        return await self._get(Endpoints.GET_VALUE_BETS, params)
+        data = await self._get(Endpoints.GET_VALUE_BETS, params)
+        return self._parse(data, ValueBet)
+
+    async def prewarm(self, connections: Optional[int] = None) -> int:
+        """
+        Open connections to the API host ahead of the first requests.
+
+        Sends concurrent ``HEAD`` requests to the host root, which carry no
+        API key and do not count against the rate limit, so that many
+        keep-alive connections sit in the pool when real requests start.
+        Called by ``async with`` when ``pool.prewarm`` is set.
+
+        Args:
+            connections: Connections to open (default: ``pool.prewarm``)
+
+        Returns:
+            Number of connections opened successfully
+        """
+        count = self.pool.prewarm if connections is None else connections
+        if count <= 0:
+            return 0
+        return await self.transport.prewarm(origin(self.base_url), count)
 
     async def close(self) -> None:
         """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        for task in list(self._revalidating.values()):
+            task.cancel()
+        await self.transport.close()
 
     async def __aenter__(self):
         """Async context manager entry."""
+        if self.pool.prewarm:
+            await self.prewarm()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,539 @@
+"""Indexed in-memory store of the latest odds."""
+
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .models import _LINE_KEYS, Model, _slug, _to_float
+from .stream import CREATED, DELETED, NO_MARKETS, UPDATED, StreamMessage
+from .utils import markets_timestamp
+
+# (event_id, bookmaker, market, hdp, outcome)
+QuoteKey = Tuple[str, str, str, Optional[float], str]
+# (event_id, market, hdp): the prices of every bookmaker on one line
+Group = Tuple[str, str, Optional[float]]
+
+_NAN = float("nan")
+
+# Distinguishes "any line" from ``hdp=None`` (markets without a line)
+_ANY: Any = object()
+
+
+class Quote(Model):
+    """One outcome price of one bookmaker."""
+
+    __slots__ = ("event_id", "bookmaker", "market", "hdp", "outcome", "price")
+
+    def __init__(
+        self,
+        event_id: str,
+        bookmaker: str,
+        market: str,
+        hdp: Optional[float],
+        outcome: str,
+        price: float,
+    ):
+        self.event_id = event_id
+        self.bookmaker = bookmaker
+        self.market = market
+        self.hdp = hdp
+        self.outcome = outcome
+        self.price = price
+
+
+class _Vocabulary:
+    """Interns names as dense integer codes."""
+
+    __slots__ = ("names", "codes")
+
+    def __init__(self) -> None:
+        self.names: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+
+    def code(self, name: Any) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class BookColumns:
+    """
+    Columnar view of an ``OddsBook`` for vectorized analytics.
+
+    ``prices``, ``groups``, ``outcomes`` and ``bookmakers`` are parallel
+    per-slot arrays; freed slots have group code -1. Group codes index
+    ``group_keys`` and ``group_markets``, the other codes index the
+    matching name lists. The arrays are the book's own storage, not
+    copies: wrap them with ``numpy.frombuffer`` for zero-copy access, and
+    release such views before the book is updated again, as a buffer
+    export prevents the arrays from growing.
+    """
+
+    __slots__ = (
+        "prices",
+        "groups",
+        "outcomes",
+        "bookmakers",
+        "group_keys",
+        "group_markets",
+        "market_names",
+        "outcome_names",
+        "bookmaker_names",
+    )
+
+    def __init__(self, book: "OddsBook"):
+        self.prices = book._prices
+        self.groups = book._group_codes
+        self.outcomes = book._outcome_codes
+        self.bookmakers = book._bookmaker_codes
+        self.group_keys = book._group_keys
+        self.group_markets = book._group_markets
+        self.market_names = book._markets.names
+        self.outcome_names = book._outcomes.names
+        self.bookmaker_names = book._bookmakers.names
+
+
+def _index_add(index: Dict[Any, Set[int]], key: Hashable, slot: int) -> None:
+    slots = index.get(key)
+    if slots is None:
+        index[key] = {slot}
+    else:
+        slots.add(slot)
+
+
+def _index_remove(index: Dict[Any, Set[int]], key: Hashable, slot: int) -> None:
+    slots = index.get(key)
+    if slots is not None:
+        slots.discard(slot)
+        if not slots:
+            del index[key]
+
+
+class OddsBook:
+    """
+    Latest price of every (event, bookmaker, market, line, outcome).
+
+    Prices live in a flat ``array('d')`` (``prices``); a dict maps each
+    quote key to its slot, so lookups and upserts are O(1). Slots freed by
+    removed quotes are reused. Secondary indexes map events, bookmakers,
+    market names, lines (``hdp``), sports, leagues and groups (one line of
+    one market of one event, across bookmakers) to their slots.
+
+    Feed it ``created``/``updated``/``deleted``/``no_markets`` messages
+    with ``apply`` and REST odds responses with ``load``. Each
+    (event, bookmaker) keeps the timestamp of the last update applied, and
+    older data is ignored, so REST snapshots and stream messages can be
+    mixed in any order.
+
+    The book is not thread-safe; feed and query it from one thread or
+    event loop.
+
+    Example:
+        >>> book = OddsBook()
+        >>> book.load(client.get_odds_for_multiple_events(ids, "Bet365,SingBet"))
+        >>> async for message in feed:
+        ...     book.apply(message)
+        ...     book.price(message.id, "Bet365", "ML", "home")
+        1.85
+    """
+
+    def __init__(self) -> None:
+        self._prices = array("d")
+        self._keys: List[Optional[QuoteKey]] = []
+        # Per-slot codes backing ``columns()``
+        self._group_codes = array("i")
+        self._outcome_codes = array("i")
+        self._bookmaker_codes = array("i")
+        self._free: List[int] = []
+        self._slots: Dict[QuoteKey, int] = {}
+
+        self._by_book: Dict[Tuple[str, str], Set[int]] = {}
+        self._by_event: Dict[str, Set[int]] = {}
+        self._by_bookmaker: Dict[str, Set[int]] = {}
+        self._by_market: Dict[str, Set[int]] = {}
+        self._by_hdp: Dict[Optional[float], Set[int]] = {}
+        self._by_group: Dict[Group, Set[int]] = {}
+
+        # Group codes are reused once a group has no prices left
+        self._group_code: Dict[Group, int] = {}
+        self._group_keys: List[Optional[Group]] = []
+        self._group_markets = array("i")
+        self._free_groups: List[int] = []
+        self._markets = _Vocabulary()
+        self._outcomes = _Vocabulary()
+        self._bookmakers = _Vocabulary()
+
+        self._events: Dict[str, Dict[str, Any]] = {}
+        self._by_sport: Dict[str, Set[str]] = {}
+        self._by_league: Dict[str, Set[str]] = {}
+        self._versions: Dict[Tuple[str, str], float] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    @property
+    def prices(self) -> array:
+        """
+        Price of every slot; freed slots hold NaN.
+
+        The array is updated in place but may be reallocated as it grows,
+        so take a fresh reference (or buffer view) after updates.
+        """
+        return self._prices
+
+    def columns(self) -> BookColumns:
+        """Return the columnar view used by the vectorized scanners."""
+        return BookColumns(self)
+
+    def key(self, slot: int) -> Optional[QuoteKey]:
+        """Return the quote key stored in ``slot`` (None if the slot is free)."""
+        return self._keys[slot]
+
+    # Updates
+
+    def apply(self, message: Union[StreamMessage, Dict[str, Any]]) -> Set[Group]:
+        """
+        Apply a feed message.
+
+        ``created``/``updated`` replace the bookmaker's markets for the
+        event, ``deleted`` removes them and ``no_markets`` removes the
+        bookmaker's (or, without one, all) prices for the event. Other
+        messages are ignored.
+
+        Returns:
+            The groups whose prices changed
+        """
+        if isinstance(message, dict):
+            message = StreamMessage.from_dict(message)
+        event_id, bookmaker = message.id, message.bookie
+        if event_id is None:
+            return set()
+
+        if message.type == DELETED or message.type == NO_MARKETS:
+            if bookmaker is None:
+                return self.remove_event(event_id)
+            return self.replace(event_id, bookmaker, [], message.timestamp)
+        if bookmaker is None or message.type not in (CREATED, UPDATED):
+            return set()
+        return self.replace(event_id, bookmaker, message.markets, message.timestamp)
+
+    def load(self, events: Iterable[Dict[str, Any]]) -> Set[Group]:
+        """
+        Load a REST odds response (e.g. from ``get_odds`` or
+        ``get_odds_for_multiple_events``) of events with ``bookmakers``.
+
+        Event fields such as sport and league are recorded as well.
+
+        Returns:
+            The groups whose prices changed
+        """
+        if isinstance(events, dict):
+            events = [events]
+        affected: Set[Group] = set()
+        for item in events:
+            event_id = item.get("id")
+            if event_id is None:
+                continue
+            event_id = str(event_id)
+            self.set_event(
+                event_id, **{k: v for k, v in item.items() if k != "bookmakers"}
+            )
+            for bookmaker, markets in (item.get("bookmakers") or {}).items():
+                markets = markets if isinstance(markets, list) else []
+                affected |= self.replace(
+                    event_id, bookmaker, markets, markets_timestamp(markets)
+                )
+        return affected
+
+    def replace(
+        self,
+        event_id: Any,
+        bookmaker: str,
+        markets: List[Dict[str, Any]],
+        timestamp: Optional[float] = None,
+    ) -> Set[Group]:
+        """
+        Replace all prices of one bookmaker for one event.
+
+        ``markets`` uses the API format (``{"name", "updatedAt", "odds"}``).
+        Outcomes missing from ``markets`` are removed. Data older than the
+        last update applied for the pair is ignored.
+
+        Returns:
+            The groups whose prices changed
+        """
+        event_id = str(event_id)
+        book = (event_id, bookmaker)
+        if timestamp is not None:
+            previous = self._versions.get(book)
+            if previous is not None and timestamp < previous:
+                return set()
+            self._versions[book] = timestamp
+
+        quotes: Dict[QuoteKey, float] = {}
+        for market in markets:
+            name = market.get("name", "")
+            for line in market.get("odds") or []:
+                hdp = _to_float(line.get("hdp"))
+                for outcome, value in line.items():
+                    if outcome in _LINE_KEYS:
+                        continue
+                    price = _to_float(value)
+                    if price is not None:
+                        quotes[(event_id, bookmaker, name, hdp, outcome)] = price
+
+        affected: Set[Group] = set()
+        keys = self._keys
+        for slot in list(self._by_book.get(book, ())):
+            key = keys[slot]
+            if key is not None and key not in quotes:
+                self._remove(slot)
+                affected.add((key[0], key[2], key[3]))
+
+        prices = self._prices
+        slots = self._slots
+        for key, price in quotes.items():
+            slot = slots.get(key)
+            if slot is None:
+                self._add(key, price)
+            elif prices[slot] != price:
+                prices[slot] = price
+            else:
+                continue
+            affected.add((key[0], key[2], key[3]))
+        return affected
+
+    def remove_event(self, event_id: Any) -> Set[Group]:
+        """Remove every price of an event; returns the affected groups."""
+        affected: Set[Group] = set()
+        for slot in list(self._by_event.get(str(event_id), ())):
+            key = self._keys[slot]
+            if key is not None:
+                affected.add((key[0], key[2], key[3]))
+            self._remove(slot)
+        return affected
+
+    def set_event(self, event_id: Any, **fields: Any) -> None:
+        """Record event fields (``sport`` and ``league`` are indexed)."""
+        event_id = str(event_id)
+        meta = self._events.setdefault(event_id, {})
+        for field, index in (("sport", self._by_sport), ("league", self._by_league)):
+            if field not in fields:
+                continue
+            old, new = _slug(meta.get(field)), _slug(fields[field])
+            if old != new and old is not None:
+                index[old].discard(event_id)
+                if not index[old]:
+                    del index[old]
+            if new is not None:
+                index.setdefault(new, set()).add(event_id)
+        meta.update(fields)
+
+    def _group_code_for(self, group: Group) -> int:
+        code = self._group_code.get(group)
+        if code is not None:
+            return code
+        market = self._markets.code(group[1])
+        if self._free_groups:
+            code = self._free_groups.pop()
+            self._group_keys[code] = group
+            self._group_markets[code] = market
+        else:
+            code = len(self._group_keys)
+            self._group_keys.append(group)
+            self._group_markets.append(market)
+        self._group_code[group] = code
+        return code
+
+    def _add(self, key: QuoteKey, price: float) -> int:
+        event_id, bookmaker, market, hdp, outcome = key
+        group_code = self._group_code_for((event_id, market, hdp))
+        outcome_code = self._outcomes.code(outcome)
+        bookmaker_code = self._bookmakers.code(bookmaker)
+        if self._free:
+            slot = self._free.pop()
+            self._prices[slot] = price
+            self._keys[slot] = key
+            self._group_codes[slot] = group_code
+            self._outcome_codes[slot] = outcome_code
+            self._bookmaker_codes[slot] = bookmaker_code
+        else:
+            slot = len(self._keys)
+            self._prices.append(price)
+            self._keys.append(key)
+            self._group_codes.append(group_code)
+            self._outcome_codes.append(outcome_code)
+            self._bookmaker_codes.append(bookmaker_code)
+        self._slots[key] = slot
+
+        _index_add(self._by_book, (event_id, bookmaker), slot)
+        _index_add(self._by_event, event_id, slot)
+        _index_add(self._by_bookmaker, bookmaker, slot)
+        _index_add(self._by_market, market, slot)
+        _index_add(self._by_hdp, hdp, slot)
+        _index_add(self._by_group, (event_id, market, hdp), slot)
+        return slot
+
+    def _remove(self, slot: int) -> None:
+        key = self._keys[slot]
+        if key is None:
+            return
+        del self._slots[key]
+        self._keys[slot] = None
+        self._prices[slot] = _NAN
+        self._group_codes[slot] = -1
+        self._free.append(slot)
+
+        event_id, bookmaker, market, hdp, _ = key
+        group = (event_id, market, hdp)
+        _index_remove(self._by_book, (event_id, bookmaker), slot)
+        _index_remove(self._by_event, event_id, slot)
+        _index_remove(self._by_bookmaker, bookmaker, slot)
+        _index_remove(self._by_market, market, slot)
+        _index_remove(self._by_hdp, hdp, slot)
+        _index_remove(self._by_group, group, slot)
+        if group not in self._by_group:
+            code = self._group_code.pop(group)
+            self._group_keys[code] = None
+            self._group_markets[code] = -1
+            self._free_groups.append(code)
+
+    # Queries
+
+    def price(
+        self,
+        event_id: Any,
+        bookmaker: str,
+        market: str,
+        outcome: str,
+        hdp: Any = None,
+    ) -> Optional[float]:
+        """
+        Return the current price of one outcome, or None if not offered.
+
+        ``hdp`` is normalized like stored lines, so ``2``, ``2.0`` and
+        ``"2"`` select the same line.
+
+        Example:
+            >>> book.price(12345, "Bet365", "Totals", "over", hdp=2.5)
+            1.91
+        """
+        key = (str(event_id), bookmaker, market, _to_float(hdp), outcome)
+        slot = self._slots.get(key)
+        return None if slot is None else self._prices[slot]
+
+    def required_outcomes(self, group: Group) -> Set[str]:
+        """
+        Return the outcomes any bookmaker prices in ``group``, e.g.
+        home/draw/away for a 3-way ML and home/away for a 2-way one.
+        """
+        keys, slots = self._keys, self.group_slots(group)
+        return {keys[slot][4] for slot in slots}  # type: ignore[index]
+
+    def is_complete(self, group: Group, outcomes: Iterable[str]) -> bool:
+        """
+        Return True if ``outcomes`` cover the whole market of ``group``.
+
+        The outcome set of a market comes from the group itself: every
+        outcome a bookmaker prices on that event, market and line is
+        required (see ``required_outcomes``). A 3-way market with the draw
+        missing is thus never taken for a 2-way one, whatever other events
+        of the same sport are in the book.
+        """
+        outcomes = set(outcomes)
+        return len(outcomes) >= 2 and self.required_outcomes(group) <= outcomes
+
+    def event(self, event_id: Any) -> Optional[Dict[str, Any]]:
+        """Return the recorded fields of an event, if any."""
+        return self._events.get(str(event_id))
+
+    def event_ids(
+        self, sport: Optional[str] = None, league: Optional[str] = None
+    ) -> Set[str]:
+        """Return the IDs of events with prices, optionally filtered."""
+        ids = set(self._by_event)
+        if sport is not None:
+            ids &= self._by_sport.get(sport, set())
+        if league is not None:
+            ids &= self._by_league.get(league, set())
+        return ids
+
+    def groups(self, market: Optional[str] = None) -> List[Group]:
+        """Return the ``(event_id, market, hdp)`` groups with prices."""
+        if market is None:
+            return list(self._by_group)
+        return [group for group in self._by_group if group[1] == market]
+
+    def group_slots(self, group: Group) -> Set[int]:
+        """Return the slots of every bookmaker's outcomes in ``group``."""
+        return self._by_group.get(group, set())
+
+    def slots(
+        self,
+        event_id: Any = None,
+        bookmaker: Optional[str] = None,
+        market: Optional[str] = None,
+        hdp: Any = _ANY,
+        sport: Optional[str] = None,
+        league: Optional[str] = None,
+    ) -> Set[int]:
+        """
+        Return the slots matching every given filter.
+
+        ``hdp=None`` selects markets without a line; leave it out to match
+        any line. Index sets are intersected smallest first.
+        """
+        candidates: List[Set[int]] = []
+        if event_id is not None:
+            candidates.append(self._by_event.get(str(event_id), set()))
+        if bookmaker is not None:
+            candidates.append(self._by_bookmaker.get(bookmaker, set()))
+        if market is not None:
+            candidates.append(self._by_market.get(market, set()))
+        if hdp is not _ANY:
+            candidates.append(self._by_hdp.get(_to_float(hdp), set()))
+        if sport is not None or league is not None:
+            event_slots: Set[int] = set()
+            for eid in self.event_ids(sport, league):
+                event_slots |= self._by_event.get(eid, set())
+            candidates.append(event_slots)
+
+        if not candidates:
+            return set(self._slots.values())
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for other in candidates[1:]:
+            if not result:
+                break
+            result &= other
+        return result
+
+    def quotes(self, **filters: Any) -> List[Quote]:
+        """
+        Return the quotes matching the filters accepted by ``slots``.
+
+        Example:
+            >>> for q in book.quotes(event_id=12345, market="ML"):
+            ...     print(q.bookmaker, q.outcome, q.price)
+        """
+        keys, prices = self._keys, self._prices
+        result = []
+        for slot in self.slots(**filters):
+            key = keys[slot]
+            if key is not None:
+                result.append(Quote(*key, prices[slot]))
+        return result
@@ -0,0 +1,117 @@
+"""Gap-free hand-off from a REST odds snapshot to the real-time feed."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from .book import OddsBook
+from .exceptions import OddsAPIError
+from .stream import WELCOME, OddsStream, StreamMessage
+
+Snapshot = Callable[[], Awaitable[Union[Iterable[Dict[str, Any]], OddsBook]]]
+
+# Seconds to wait for the feed's welcome message before giving up
+DEFAULT_CONNECT_TIMEOUT = 30.0
+
+
+def replay_order(messages: List[StreamMessage]) -> List[StreamMessage]:
+    """
+    Order buffered messages by update timestamp.
+
+    Messages without a timestamp keep their position relative to the
+    message received before them, and ties keep arrival order.
+    """
+    keyed = []
+    last = float("-inf")
+    for position, message in enumerate(messages):
+        if message.timestamp is not None:
+            last = message.timestamp
+        keyed.append((last, position, message))
+    keyed.sort(key=lambda item: (item[0], item[1]))
+    return [message for _, _, message in keyed]
+
+
+async def bootstrap(
+    stream: OddsStream,
+    snapshot: Snapshot,
+    book: Optional[OddsBook] = None,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+) -> OddsBook:
+    """
+    Build a consistent ``OddsBook`` from a REST snapshot and the live feed.
+
+    The feed is connected first and its messages are buffered while the
+    snapshot is fetched, so no update published during the (possibly slow)
+    REST calls is lost. The snapshot is then loaded and the buffered
+    messages are replayed in timestamp order. Per-(event, bookmaker)
+    timestamps in the book make sure a stale REST value never overwrites a
+    newer streamed one. Messages arriving during the replay stay queued in
+    the stream; keep iterating it afterwards to stay current.
+
+    Args:
+        stream: The feed to follow (started if needed)
+        snapshot: Coroutine function returning REST odds, e.g. events with
+            ``bookmakers`` from ``get_odds_for_multiple_events``, or
+            loading them into ``book`` itself and returning it, e.g.
+            ``prefetch_snapshot(..., book=book)``
+        book: Book to fill (default: a new ``OddsBook``)
+        connect_timeout: Seconds to wait for the feed to connect
+            (default: 30)
+
+    Returns:
+        The filled book
+
+    Raises:
+        OddsAPIError: If the feed does not connect in time or fails while
+            the snapshot is loading
+
+    Example:
+        >>> async with AsyncOddsAPIClient(api_key) as client, OddsStream(
+        ...     api_key, markets="ML", sport="football"
+        ... ) as feed:
+        ...     book = await bootstrap(
+        ...         feed,
+        ...         lambda: client.get_odds_for_multiple_events(ids, "Bet365"),
+        ...     )
+        ...     async for message in feed:
+        ...         book.apply(message)
+    """
+    book = book if book is not None else OddsBook()
+    buffer: List[StreamMessage] = []
+    connected = asyncio.Event()
+
+    async def collect() -> None:
+        async for message in stream:
+            if message.type == WELCOME:
+                connected.set()
+            else:
+                buffer.append(message)
+
+    collector = asyncio.ensure_future(collect())
+    waiter = asyncio.ensure_future(connected.wait())
+    try:
+        done, _ = await asyncio.wait(
+            {collector, waiter},
+            timeout=connect_timeout,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if collector in done:
+            collector.result()
+            raise OddsAPIError("Feed closed before the snapshot was taken")
+        if waiter not in done:
+            raise OddsAPIError("Timed out waiting for the feed to connect")
+
+        data = await snapshot()
+        if collector.done():
+            collector.result()
+    finally:
+        # The collector is only ever cancelled while waiting on the queue,
+        # so no received message is lost
+        for task in (collector, waiter):
+            task.cancel()
+        await asyncio.gather(collector, waiter, return_exceptions=True)
+
+    if data is not book:
+        book.load(data or [])
+    for message in replay_order(buffer):
+        book.apply(message)
+    return book
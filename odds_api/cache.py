@@ -0,0 +1,490 @@
+"""Response caching for the Odds-API.io clients."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from .constants import ENDPOINT_CACHE_TTLS
+from .decoders import get_decoder
+
+
+class CacheEntry:
+    """A cached, decoded response body."""
+
+    __slots__ = ("value", "size", "expires_at", "stale_until")
+
+    def __init__(
+        self,
+        value: Any,
+        size: int,
+        expires_at: float,
+        stale_until: Optional[float] = None,
+    ):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.stale_until = expires_at if stale_until is None else stale_until
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Return True if the entry has not yet expired."""
+        return (now if now is not None else time.time()) < self.expires_at
+
+
+class CacheStats:
+    """Hit/miss counters for a response cache."""
+
+    __slots__ = ("hits", "misses", "evictions", "entries", "bytes")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries = 0
+        self.bytes = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, entries={self.entries}, "
+            f"bytes={self.bytes})"
+        )
+
+
+class BaseCache(ABC):
+    """
+    Common TTL handling for response cache backends.
+
+    Subclasses implement ``get``, ``set`` and ``clear``.
+
+    Args:
+        ttls: Per-endpoint TTL overrides in seconds, keyed by ``Endpoints``
+            path
+        default_ttl: TTL for endpoints missing from the TTL table
+            (default: 0, not cached)
+        stale_ttl: Seconds past expiry during which an entry is still
+            returned while the client refreshes it in the background. The
+            window never exceeds the endpoint's own TTL (default: 0)
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        stale_ttl: float = 0.0,
+    ):
+        self.ttls = dict(ENDPOINT_CACHE_TTLS)
+        self.ttls.update(ttls or {})
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.stats = CacheStats()
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the TTL in seconds for ``endpoint`` (0 means not cached)."""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _lifetime(self, ttl: float) -> Tuple[float, float]:
+        """Return ``(expires_at, stale_until)`` for an entry stored now."""
+        expires_at = time.time() + ttl
+        return expires_at, expires_at + min(self.stale_ttl, ttl)
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Return the entry for ``key``, or None on a miss.
+
+        The entry may be past its TTL but still inside the stale window;
+        check ``CacheEntry.is_fresh`` to decide whether to refresh it.
+        """
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, size: int, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)."""
+
+
+class ResponseCache(BaseCache):
+    """
+    In-memory TTL + LRU cache for decoded API responses.
+
+    Entries are keyed on endpoint plus query parameters. Each endpoint gets
+    its own TTL, taken from ``ENDPOINT_CACHE_TTLS`` unless overridden;
+    endpoints with a TTL of 0 are never cached. When either ``max_entries``
+    or ``max_bytes`` (measured on the raw response body) is exceeded, the
+    least recently used entries are evicted. The cache is thread-safe and
+    can be shared between clients.
+
+    Cached objects are returned as-is, so callers must not mutate them.
+
+    Args:
+        max_entries: Maximum number of cached responses (default: 1024)
+        max_bytes: Maximum total size of cached response bodies
+            (default: 64 MiB)
+        ttls: Per-endpoint TTL overrides in seconds, keyed by ``Endpoints``
+            path
+        default_ttl: TTL for endpoints missing from the TTL table
+            (default: 0, not cached)
+        stale_ttl: Seconds an expired entry may still be served while it is
+            refreshed in the background (default: 0)
+
+    Example:
+        >>> cache = ResponseCache(ttls={Endpoints.GET_EVENTS: 10})
+        >>> client = OddsAPIClient(api_key="your_api_key", cache=cache)
+        >>> client.get_sports()  # network
+        >>> client.get_sports()  # served from cache
+        >>> cache.stats.hit_ratio
+        0.5
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        stale_ttl: float = 0.0,
+    ):
+        super().__init__(ttls=ttls, default_ttl=default_ttl, stale_ttl=stale_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() >= entry.stale_until:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def set(self, key: Hashable, value: Any, size: int, ttl: float) -> None:
+        if ttl <= 0 or size > self.max_bytes:
+            return
+
+        expires_at, stale_until = self._lifetime(ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(value, size, expires_at, stale_until)
+            self.stats.entries += 1
+            self.stats.bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self.stats.bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Rows read per query while evicting from ``SQLiteCache``
+_EVICT_BATCH = 64
+
+
+def default_cache_path() -> str:
+    """Return the default location of the on-disk response cache."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "odds-api", "responses.sqlite3")
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent response cache backed by a SQLite database.
+
+    All processes on a host that point at the same file share its entries,
+    so short-lived workers can start from cached reference data instead of
+    downloading it again. The database runs in WAL mode so readers do not
+    block each other. Expired entries inside the stale window are returned
+    immediately and refreshed in the background by the client. Triggers
+    keep the entry count and total size in a one-row table, so enforcing
+    the limits never scans the cache.
+
+    Values are stored as JSON and decoded on every hit, so each caller gets
+    its own copy.
+
+    Args:
+        path: Database file (default: ``$XDG_CACHE_HOME/odds-api/
+            responses.sqlite3``)
+        max_entries: Maximum number of cached responses (default: 10000)
+        max_bytes: Maximum total size of cached response bodies
+            (default: 256 MiB)
+        ttls: Per-endpoint TTL overrides in seconds, keyed by ``Endpoints``
+            path
+        default_ttl: TTL for endpoints missing from the TTL table
+            (default: 0, not cached)
+        stale_ttl: Seconds an expired entry may still be served while it is
+            refreshed in the background, capped at the endpoint's TTL
+            (default: 24 hours)
+
+    Example:
+        >>> cache = SQLiteCache("/var/cache/odds-api.sqlite3")
+        >>> client = OddsAPIClient(api_key="your_api_key", cache=cache)
+        >>> client.get_bookmakers()  # local read after the first worker
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        stale_ttl: float = 24 * 3600,
+    ):
+        super().__init__(ttls=ttls, default_ttl=default_ttl, stale_ttl=stale_ttl)
+        self.path = path or default_cache_path()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._decode = get_decoder()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Makes the rows removed by INSERT OR REPLACE fire the delete trigger
+        self._conn.execute("PRAGMA recursive_triggers=ON")
+        self._conn.executescript("""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,
+                expires_at REAL NOT NULL, stale_until REAL NOT NULL,
+                accessed_at REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS responses_accessed_at
+                ON responses (accessed_at);
+            CREATE TABLE IF NOT EXISTS totals (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                entries INTEGER NOT NULL, bytes INTEGER NOT NULL);
+            INSERT OR IGNORE INTO totals
+                SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses;
+            CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses
+            BEGIN
+                UPDATE totals SET entries = entries + 1, bytes = bytes + new.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses
+            BEGIN
+                UPDATE totals SET entries = entries - 1, bytes = bytes - old.size;
+            END;
+            COMMIT;
+            """)
+        with self._lock:
+            self._update_stats()
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        db_key = self._encode_key(key)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, expires_at, stale_until FROM responses "
+                "WHERE key = ?",
+                (db_key,),
+            ).fetchone()
+            if row is not None and now >= row[3]:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (db_key,))
+                row = None
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, db_key)
+            )
+            self.stats.hits += 1
+
+        value, size, expires_at, stale_until = row
+        return CacheEntry(self._decode(value), size, expires_at, stale_until)
+
+    def set(self, key: Hashable, value: Any, size: int, ttl: float) -> None:
+        if ttl <= 0 or size > self.max_bytes:
+            return
+
+        expires_at, stale_until = self._lifetime(ttl)
+        encoded = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, value, size, expires_at, stale_until, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self._encode_key(key),
+                    encoded,
+                    size,
+                    expires_at,
+                    stale_until,
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def _update_stats(self) -> Tuple[int, int]:
+        entries, total = self._conn.execute(
+            "SELECT entries, bytes FROM totals"
+        ).fetchone()
+        self.stats.entries = entries
+        self.stats.bytes = total
+        return entries, total
+
+    def _evict(self) -> None:
+        entries, total = self._update_stats()
+        while entries > self.max_entries or total > self.max_bytes:
+            # Least recently used first, in batches read off the index
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT ?",
+                (max(entries - self.max_entries, _EVICT_BATCH),),
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if entries <= self.max_entries and total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                entries -= 1
+                total -= size
+                self.stats.evictions += 1
+            entries, total = self._update_stats()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._update_stats()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._update_stats()[0]
+
+
+class Validators:
+    """HTTP validators and decoded body of the last full response for a URL."""
+
+    __slots__ = ("etag", "last_modified", "value", "size")
+
+    def __init__(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        value: Any,
+        size: int,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.value = value
+        self.size = size
+
+    def headers(self) -> Dict[str, str]:
+        """Return the conditional request headers for these validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    """
+    LRU store of ``ETag``/``Last-Modified`` validators per request.
+
+    The clients send them back as ``If-None-Match``/``If-Modified-Since``
+    and, on a ``304 Not Modified``, reuse the stored decoded body without
+    downloading or parsing it again. ``stats.hits`` counts 304 responses.
+
+    Args:
+        max_entries: Maximum number of requests to remember (default: 256)
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Validators]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Validators]:
+        """Return the stored validators for ``key``, if any."""
+        with self._lock:
+            validators = self._entries.get(key)
+            if validators is not None:
+                self._entries.move_to_end(key)
+            return validators
+
+    def update(
+        self, key: Hashable, headers: Mapping[str, str], value: Any, size: int
+    ) -> None:
+        """Remember the validators of a full response, or forget ``key``."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self.stats.misses += 1
+            if key in self._entries:
+                self._remove(key)
+            if not etag and not last_modified:
+                return
+
+            self._entries[key] = Validators(etag, last_modified, value, size)
+            self.stats.entries += 1
+            self.stats.bytes += size
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        validators = self._entries.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= validators.size
+
+    def record_not_modified(self) -> None:
+        """Count a ``304 Not Modified`` response."""
+        with self._lock:
+            self.stats.hits += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
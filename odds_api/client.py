@@ -1,16 +1,51 @@
 """Synchronous client for the Odds-API.io API."""
 
-from typing import Any, Dict, Optional, List
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
 import requests
 
-from .constants import BASE_API_URL, DEFAULT_TIMEOUT, Endpoints
+from .book import OddsBook
+from .cache import BaseCache, ValidatorStore
+from .coalesce import SingleFlight
+from .constants import (
+    BASE_API_URL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    MAX_EVENT_IDS_PER_REQUEST,
+    Endpoints,
+)
+from .decoders import JSONDecoder, get_decoder
 from .exceptions import (
     InvalidAPIKeyError,
     NotFoundError,
     OddsAPIError,
     RateLimitExceededError,
+    TransportError,
     ValidationError,
 )
+from .hooks import RequestHook, RequestRecord, track
+from .models import ArbitrageBet, Event, Participant, ValueBet
+from .pool import PoolConfig, origin
+from .prefetch import Leagues, PrefetchProgress, ProgressCallback, league_list
+from .quota import Quota
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .streaming import JSONArrayParser
+from .transport import RequestsTransport, Response, Transport
+from .utils import EventIds, RequestKey, chunked, normalize_ids, request_key
 
 
 class OddsAPIClient:
@@ -21,6 +56,41 @@ class OddsAPIClient:
         api_key: Your Odds-API.io API key
         timeout: Request timeout in seconds (default: 10)
         base_url: Base API URL (default: https://api2.odds-api.io/v3)
+        retry_policy: Backoff policy for 429s, 5xx responses and connection
+            errors (default: ``RetryPolicy()``; pass
+            ``RetryPolicy(max_retries=0)`` to disable retries)
+        rate_limiter: Optional ``RateLimiter`` consulted before every
+            request; one instance may be shared between several clients
+        quota: Optional ``Quota`` tracking the plan's remaining requests
+            from the API's rate-limit headers, or from a configured budget,
+            and slowing requests down as it runs out; exposed as
+            ``client.quota`` (default: None, no tracking or throttling)
+        coalesce_requests: If True, identical GET requests made while one is
+            already in flight share its result instead of hitting the API
+            again (default: False). Shared results must not be mutated.
+        cache: Optional ``ResponseCache`` or ``SQLiteCache`` for GET
+            responses; TTLs are set per endpoint, so reference data is cached
+            and odds are not. Stale entries are refreshed in the background.
+        conditional_requests: If True, remember ``ETag``/``Last-Modified``
+            validators per request and send conditional requests; a
+            ``304 Not Modified`` returns the previously decoded object
+            (default: False)
+        json_decoder: ``"orjson"``, ``"msgspec"``, ``"json"`` or a callable
+            decoding bytes; by default the fastest installed decoder is used
+        return_models: If True, events, odds, participants, arbitrage and
+            value bets are returned as compact ``__slots__`` models from
+            ``odds_api.models`` instead of dicts (default: False)
+        pool: ``PoolConfig`` with connection pool, keep-alive and DNS cache
+            settings (default: ``PoolConfig()``); set ``prewarm`` to open
+            connections when the client starts. Ignored if ``transport``
+            is given.
+        transport: ``Transport`` sending the requests (default:
+            ``RequestsTransport``); ``HTTPXTransport`` multiplexes requests
+            over HTTP/2
+        hooks: Callables receiving a ``RequestRecord`` with the timings,
+            status, size and retries of every finished request; more can be
+            appended to ``client.hooks`` later. With no hooks nothing is
+            recorded.
 
     Example:
         >>> client = OddsAPIClient(api_key="your_api_key")
@@ -33,6 +103,17 @@ class OddsAPIClient:
         api_key: str,
         timeout: int = DEFAULT_TIMEOUT,
         base_url: str = BASE_API_URL,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        quota: Optional[Quota] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[BaseCache] = None,
+        conditional_requests: bool = False,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        return_models: bool = False,
+        pool: Optional[PoolConfig] = None,
+        transport: Optional[Transport] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
     ):
         """Initialize the Odds API client."""
         if not api_key:
@@ -41,14 +122,42 @@ class OddsAPIClient:
         self.api_key = api_key
         self.timeout = timeout
         self.base_url = base_url
-        self.session = requests.Session()
-
-    def _handle_response(self, response: requests.Response) -> Any:
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.quota = quota
+        self.cache = cache
+        self.json_decoder = get_decoder(json_decoder)
+        self.return_models = return_models
+        self.validators = ValidatorStore() if conditional_requests else None
+        self._revalidating: Set[RequestKey] = set()
+        self._revalidate_lock = threading.Lock()
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self.transport = transport or RequestsTransport(timeout, pool)
+        self.pool = self.transport.pool
+        self.hooks: List[RequestHook] = list(hooks or ())
+        if self.pool.prewarm:
+            self.prewarm()
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """The ``requests`` session of the default transport, if used."""
+        return getattr(self.transport, "session", None)
+
+    def _handle_response(
+        self, response: Response, record: Optional[RequestRecord] = None
+    ) -> Any:
         """Handle API response and raise appropriate exceptions."""
         if response.ok:
-            return response.json()
+            started = time.perf_counter()
+            try:
+                data = self.json_decoder(response.body)
+            except ValueError as e:
+                raise OddsAPIError(f"Invalid JSON response: {e}") from e
+            if record is not None:
+                record.decode = time.perf_counter() - started
+            return data
 
-        status = response.status_code
+        status = response.status
 
         if status == 400:
             raise ValidationError(f"Invalid request: {response.text}")
@@ -63,31 +172,193 @@ class OddsAPIClient:
         else:
             raise OddsAPIError(f"API error {status}: {response.text}")
 
-    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """Make a GET request to the API."""
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        record: Optional[RequestRecord] = None,
+    ) -> Response:
+        """
+        Send a request, retrying transient failures per the retry policy.
+
+        With ``stream=True`` the body is not downloaded up front and the
+        caller must close the response. The outcome is noted in ``record``
+        if given.
+        """
+        path = endpoint.format(**path_params) if path_params else endpoint
         url = f"{self.base_url}/{path}"
-        params = params or {}
+        params = dict(params or {})
         params["apiKey"] = self.api_key
 
-        try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-        except requests.RequestException as e:
-            raise OddsAPIError(f"Request failed: {e}") from e
-
-        return self._handle_response(response)
-
-    def _put(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            waited = time.perf_counter()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            if self.quota is not None:
+                self.quota.acquire()
+            if record is not None:
+                record.wait += time.perf_counter() - waited
+            try:
+                response = self.transport.request(method, url, params, headers, stream)
+            except TransportError as e:
+                delay = policy.get_delay(attempt, time.monotonic() - started)
+                if delay is None:
+                    if record is not None:
+                        record.retries = attempt
+                    raise OddsAPIError(f"Request failed: {e}") from e
+            else:
+                if self.quota is not None:
+                    self.quota.update(response.headers)
+                delay = None
+                if policy.is_retryable_status(response.status):
+                    delay = policy.get_delay(
+                        attempt,
+                        time.monotonic() - started,
+                        parse_retry_after(response.headers.get("Retry-After")),
+                    )
+                if delay is None:
+                    if record is not None:
+                        record.set_response(response, attempt)
+                    return response
+                response.close()
+
+            attempt += 1
+            time.sleep(delay)
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Send a request and decode the response."""
+        if not self.hooks:
+            response = self._send(method, endpoint, params, path_params)
+            return self._handle_response(response)
+        with track(self.hooks, method, endpoint, params) as record:
+            response = self._send(method, endpoint, params, path_params, record=record)
+            return self._handle_response(response, record)
+
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make a GET request to the API, via the cache when enabled."""
+        cache = self.cache
+        ttl = cache.ttl_for(endpoint) if cache is not None else 0
+        validators = self.validators
+        if ttl <= 0 and self._single_flight is None and validators is None:
+            return self._request("GET", endpoint, params, path_params)
+
+        key = request_key(endpoint, params, path_params)
+
+        def load() -> Any:
+            with track(self.hooks, "GET", endpoint, params) as record:
+                stored = validators.get(key) if validators is not None else None
+                response = self._send(
+                    "GET",
+                    endpoint,
+                    params,
+                    path_params,
+                    stored.headers() if stored is not None else None,
+                    record=record,
+                )
+                if stored is not None and response.status == 304:
+                    validators.record_not_modified()
+                    data, size = stored.value, stored.size
+                else:
+                    data = self._handle_response(response, record)
+                    size = len(response.body)
+                    if validators is not None:
+                        validators.update(key, response.headers, data, size)
+            if ttl > 0:
+                cache.set(key, data, size, ttl)
+            return data
+
+        if ttl > 0:
+            entry = cache.get(key)
+            if entry is not None:
+                if self.hooks:
+                    with track(self.hooks, "GET", endpoint, params) as record:
+                        record.cache_hit = True  # type: ignore[union-attr]
+                if not entry.is_fresh():
+                    self._revalidate(key, load)
+                return entry.value
+
+        if self._single_flight is None:
+            return load()
+        return self._single_flight.do(key, load)
+
+    def _revalidate(self, key: RequestKey, load: Callable[[], Any]) -> None:
+        """Refresh a stale cache entry on a background thread."""
+        with self._revalidate_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def run() -> None:
+            try:
+                load()
+            except OddsAPIError:
+                # The stale entry stays usable until its stale window ends
+                pass
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _put(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Make a PUT request to the API."""
-        url = f"{self.base_url}/{path}"
-        params = params or {}
-        params["apiKey"] = self.api_key
-
-        try:
-            response = self.session.put(url, params=params, timeout=self.timeout)
-        except requests.RequestException as e:
-            raise OddsAPIError(f"Request failed: {e}") from e
-
-        return self._handle_response(response)
+        return self._request("PUT", endpoint, params)
+
+    def _iter(self, endpoint: str, params: Dict[str, Any], model: Any) -> Iterator[Any]:
+        """Stream a list response, yielding items as they are parsed."""
+        with track(self.hooks, "GET", endpoint, params) as record:
+            response = self._send("GET", endpoint, params, stream=True, record=record)
+            started = time.perf_counter()
+            try:
+                if not response.ok:
+                    response.read()
+                    self._handle_response(response)
+
+                parser = JSONArrayParser()
+                convert = model.from_dict if self.return_models else None
+                try:
+                    for chunk in response.chunks:  # type: ignore[union-attr]
+                        if record is not None:
+                            record.bytes += len(chunk)
+                        for item in parser.feed(chunk):
+                            yield convert(item) if convert else item
+                    for item in parser.close():
+                        yield convert(item) if convert else item
+                except TransportError as e:
+                    raise OddsAPIError(f"Request failed: {e}") from e
+                except ValueError as e:
+                    raise OddsAPIError(f"Invalid JSON response: {e}") from e
+            finally:
+                response.close()
+                if record is not None:
+                    record.streamed = True
+                    record.transfer = time.perf_counter() - started
+
+    def _parse(self, data: Any, model: Any) -> Any:
+        """Convert a decoded response into ``model`` instances if enabled."""
+        if not self.return_models or data is None:
+            return data
+        if isinstance(data, list):
+            return [model.from_dict(item) for item in data]
+        return model.from_dict(data)
 
     @staticmethod
     def _build_params(**kwargs) -> Dict[str, Any]:
@@ -103,6 +374,33 @@ class OddsAPIClient:
                 params[k] = v
         return params
 
+    @classmethod
+    def _events_params(
+        cls,
+        sport: str,
+        league: Optional[str],
+        participant_id: Optional[int],
+        status: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        bookmaker: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build the query parameters shared by get_events and iter_events."""
+        params = cls._build_params(
+            sport=sport,
+            league=league,
+            participantId=participant_id,
+            status=status,
+            bookmaker=bookmaker,
+        )
+
+        # Map start/end to from/to
+        if start:
+            params["from"] = start
+        if end:
+            params["to"] = end
+        return params
+
     # Sports & Leagues
 
     def get_sports(self) -> List[Dict[str, Any]]:
@@ -146,7 +444,7 @@ class OddsAPIClient:
         start: Optional[str] = None,
         end: Optional[str] = None,
         bookmaker: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get events with optional filters.
 
@@ -169,23 +467,51 @@ class OddsAPIClient:
             ...     status="upcoming"
             ... )
         """
-        params = self._build_params(
-            sport=sport,
-            league=league,
-            participantId=participant_id,
-            status=status,
-            bookmaker=bookmaker,
+        params = self._events_params(
+            sport, league, participant_id, status, start, end, bookmaker
         )
+        data = self._get(Endpoints.GET_EVENTS, params)
+        return self._parse(data, Event)
 
-        # Map start/end to from/to
-        if start:
-            params["from"] = start
-        if end:
-            params["to"] = end
+    def iter_events(
+        self,
+        sport: str,
+        league: Optional[str] = None,
+        participant_id: Optional[int] = None,
+        status: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        bookmaker: Optional[str] = None,
+    ) -> Iterator[Union[Dict[str, Any], Event]]:
+        """
+        Stream events with optional filters.
+
+        Like ``get_events``, but the response is parsed incrementally and
+        events are yielded as they arrive, so memory use does not grow with
+        the number of events. Responses are never cached.
+
+        Args:
+            sport: Sport identifier (required)
+            league: League identifier
+            participant_id: Filter by participant ID
+            status: Event status (e.g., "upcoming", "live", "finished")
+            start: Start date/time filter (ISO 8601 format)
+            end: End date/time filter (ISO 8601 format)
+            bookmaker: Filter by bookmaker
+
+        Yields:
+            Events matching the filters
 
-        return self._get(Endpoints.GET_EVENTS, params)
+        Example:
+            >>> for event in client.iter_events(sport="football"):
+            ...     print(event["home"], event["away"])
+        """
+        params = self._events_params(
+            sport, league, participant_id, status, start, end, bookmaker
+        )
+        return self._iter(Endpoints.GET_EVENTS, params, Event)
 
-    def get_event_by_id(self, event_id: int) -> Dict[str, Any]:
+    def get_event_by_id(self, event_id: int) -> Union[Dict[str, Any], Event]:
         """
         Get a specific event by ID.
 
@@ -198,10 +524,10 @@ class OddsAPIClient:
         Example:
             >>> event = client.get_event_by_id(event_id=12345)
         """
-        path = Endpoints.GET_EVENT_BY_ID.format(id=event_id)
-        return self._get(path)
+        data = self._get(Endpoints.GET_EVENT_BY_ID, path_params={"id": event_id})
+        return self._parse(data, Event)
 
-    def get_live_events(self, sport: str) -> List[Dict[str, Any]]:
+    def get_live_events(self, sport: str) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get currently live events for a sport.
 
@@ -215,9 +541,10 @@ class OddsAPIClient:
             >>> live_events = client.get_live_events(sport="basketball")
         """
         params = self._build_params(sport=sport)
-        return self._get(Endpoints.GET_LIVE_EVENTS, params)
+        data = self._get(Endpoints.GET_LIVE_EVENTS, params)
+        return self._parse(data, Event)
 
-    def search_events(self, query: str) -> List[Dict[str, Any]]:
+    def search_events(self, query: str) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Search for events by keyword.
 
@@ -231,13 +558,14 @@ class OddsAPIClient:
             >>> events = client.search_events(query="Lakers")
         """
         params = self._build_params(query=query)
-        return self._get(Endpoints.SEARCH_EVENTS, params)
+        data = self._get(Endpoints.SEARCH_EVENTS, params)
+        return self._parse(data, Event)
 
     # Odds
 
     def get_event_odds(
         self, event_id: str, bookmakers: str
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], Event]:
         """
         Get odds for a specific event.
 
@@ -255,7 +583,8 @@ class OddsAPIClient:
             ... )
         """
         params = self._build_params(eventId=event_id, bookmakers=bookmakers)
-        return self._get(Endpoints.GET_EVENT_ODDS, params)
+        data = self._get(Endpoints.GET_EVENT_ODDS, params)
+        return self._parse(data, Event)
 
     def get_odds_movement(
         self,
@@ -292,30 +621,140 @@ class OddsAPIClient:
         return self._get(Endpoints.GET_ODDS_MOVEMENT, params)
 
     def get_odds_for_multiple_events(
-        self, event_ids: str, bookmakers: str
-    ) -> List[Dict[str, Any]]:
+        self,
+        event_ids: EventIds,
+        bookmakers: str,
+        chunk_size: int = MAX_EVENT_IDS_PER_REQUEST,
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get odds for multiple events at once.
 
+        The IDs are split into chunks the API accepts in one request and the
+        results of all chunks are merged in the order of the input IDs.
+
         Args:
-            event_ids: Comma-separated event IDs
+            event_ids: Comma-separated event IDs or any iterable of IDs
             bookmakers: Comma-separated bookmaker slugs
+            chunk_size: Maximum event IDs per request (default: 10)
 
         Returns:
             Odds data for multiple events
 
         Example:
             >>> odds = client.get_odds_for_multiple_events(
-            ...     event_ids="12345,67890",
+            ...     event_ids=[12345, 67890],
             ...     bookmakers="singbet,bet365"
             ... )
         """
-        params = self._build_params(eventIds=event_ids, bookmakers=bookmakers)
-        return self._get(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS, params)
+        merged: List[Dict[str, Any]] = []
+        for chunk in chunked(normalize_ids(event_ids), chunk_size):
+            params = self._build_params(eventIds=",".join(chunk), bookmakers=bookmakers)
+            merged.extend(
+                self._get(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS, params) or []
+            )
+        return self._parse(merged, Event)
+
+    def prefetch_snapshot(
+        self,
+        sport: str,
+        leagues: Leagues = None,
+        status: Optional[str] = None,
+        bookmakers: Optional[str] = None,
+        book: Optional[OddsBook] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = MAX_EVENT_IDS_PER_REQUEST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> OddsBook:
+        """
+        Load the current odds of a whole sport, or of some of its leagues,
+        into an ``OddsBook``.
+
+        League listings and odds batches run as one pipeline on a thread
+        pool of ``max_concurrency`` workers: a league's odds batches are
+        queued as soon as its events are listed, while other leagues are
+        still being listed. The listed events' fields (teams, sport,
+        league, ...) are recorded in the book as well, so ``book.event(id)``
+        returns them even for events without prices. ``book.event_ids``
+        lists only the events that have prices.
+
+        Args:
+            sport: Sport identifier
+            leagues: League slugs, comma-separated or as an iterable
+                (default: the whole sport in one listing)
+            status: Event status filter (e.g. "pending", "live")
+            bookmakers: Comma-separated bookmaker slugs (default: None,
+                the parameter is not sent)
+            book: Book to load into (default: a new ``OddsBook``)
+            progress: Optional callback receiving a ``PrefetchProgress``
+                after every completed request
+            chunk_size: Maximum event IDs per odds request (default: 10)
+            max_concurrency: Maximum requests in flight at once (default: 8)
+
+        Returns:
+            The populated ``OddsBook``
+
+        Example:
+            >>> book = client.prefetch_snapshot(
+            ...     "football",
+            ...     leagues="england-premier-league,spain-laliga",
+            ...     status="pending",
+            ...     bookmakers="Bet365,SingBet",
+            ...     progress=lambda p: print(p.batches_done, "/", p.batches_total),
+            ... )
+        """
+        book = book if book is not None else OddsBook()
+        slugs = league_list(leagues)
+        state = PrefetchProgress(len(slugs))
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            # Maps each running request to its odds chunk (None for listings)
+            pending: Dict[Future, Optional[List[str]]] = {}
+            for league in slugs:
+                params = self._events_params(
+                    sport, league, None, status, None, None, None
+                )
+                future = pool.submit(self._get, Endpoints.GET_EVENTS, params)
+                pending[future] = None
+
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk = pending.pop(future)
+                        data = future.result() or []
+                        if chunk is None:
+                            listed = [e for e in data if e.get("id") is not None]
+                            for event in listed:
+                                book.set_event(event["id"], **event)
+                            ids = normalize_ids(e["id"] for e in listed)
+                            for chunk in chunked(ids, chunk_size):
+                                params = self._build_params(
+                                    eventIds=",".join(chunk), bookmakers=bookmakers
+                                )
+                                future = pool.submit(
+                                    self._get,
+                                    Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS,
+                                    params,
+                                )
+                                pending[future] = chunk
+                                state.batches_total += 1
+                            state.leagues_done += 1
+                            state.events += len(ids)
+                        else:
+                            book.load(data)
+                            state.batches_done += 1
+                            state.quotes = len(book)
+                        if progress is not None:
+                            progress(state)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return book
 
     def get_updated_odds_since_timestamp(
         self, since: int, bookmaker: str, sport: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[Event]]:
         """
         Get odds updated since a given timestamp.
 
@@ -335,13 +774,40 @@ class OddsAPIClient:
             ... )
         """
         params = self._build_params(since=since, bookmaker=bookmaker, sport=sport)
-        return self._get(Endpoints.GET_UPDATED_ODDS_SINCE_TIMESTAMP, params)
+        data = self._get(Endpoints.GET_UPDATED_ODDS_SINCE_TIMESTAMP, params)
+        return self._parse(data, Event)
+
+    def iter_updated_odds(
+        self, since: int, bookmaker: str, sport: str
+    ) -> Iterator[Union[Dict[str, Any], Event]]:
+        """
+        Stream odds updated since a given timestamp.
+
+        Like ``get_updated_odds_since_timestamp``, but items are yielded as
+        they are parsed instead of after the whole body has been decoded.
+
+        Args:
+            since: Unix timestamp
+            bookmaker: Bookmaker slug
+            sport: Sport identifier
+
+        Yields:
+            Updated odds, one event at a time
+
+        Example:
+            >>> for update in client.iter_updated_odds(
+            ...     since=1640000000, bookmaker="singbet", sport="basketball"
+            ... ):
+            ...     process(update)
+        """
+        params = self._build_params(since=since, bookmaker=bookmaker, sport=sport)
+        return self._iter(Endpoints.GET_UPDATED_ODDS_SINCE_TIMESTAMP, params, Event)
 
     # Participants
 
     def get_participants(
         self, sport: str, search: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[Participant]]:
         """
         Get participants (teams/players) for a sport.
 
@@ -359,9 +825,35 @@ class OddsAPIClient:
             ... )
         """
         params = self._build_params(sport=sport, search=search)
-        return self._get(Endpoints.GET_PARTICIPANTS, params)
+        data = self._get(Endpoints.GET_PARTICIPANTS, params)
+        return self._parse(data, Participant)
 
-    def get_participant_by_id(self, participant_id: int) -> Dict[str, Any]:
+    def iter_participants(
+        self, sport: str, search: Optional[str] = None
+    ) -> Iterator[Union[Dict[str, Any], Participant]]:
+        """
+        Stream participants (teams/players) for a sport.
+
+        Like ``get_participants``, but participants are yielded as they are
+        parsed instead of after the whole body has been decoded.
+
+        Args:
+            sport: Sport identifier
+            search: Optional search query
+
+        Yields:
+            Participants, one at a time
+
+        Example:
+            >>> for participant in client.iter_participants(sport="tennis"):
+            ...     print(participant["name"])
+        """
+        params = self._build_params(sport=sport, search=search)
+        return self._iter(Endpoints.GET_PARTICIPANTS, params, Participant)
+
+    def get_participant_by_id(
+        self, participant_id: int
+    ) -> Union[Dict[str, Any], Participant]:
         """
         Get a specific participant by ID.
 
@@ -374,8 +866,10 @@ class OddsAPIClient:
         Example:
             >>> participant = client.get_participant_by_id(participant_id=3428)
         """
-        path = Endpoints.GET_PARTICIPANT_BY_ID.format(id=participant_id)
-        return self._get(path)
+        data = self._get(
+            Endpoints.GET_PARTICIPANT_BY_ID, path_params={"id": participant_id}
+        )
+        return self._parse(data, Participant)
 
     # Bookmakers
 
@@ -438,7 +932,7 @@ class OddsAPIClient:
         bookmakers: str,
         limit: Optional[int] = None,
         include_event_details: Optional[bool] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[ArbitrageBet]]:
         """
         Find arbitrage betting opportunities.
 
@@ -462,13 +956,14 @@ class OddsAPIClient:
             limit=limit,
             includeEventDetails=include_event_details,
         )
-        return self._get(Endpoints.GET_ARBITRAGE_BETS, params)
+        data = self._get(Endpoints.GET_ARBITRAGE_BETS, params)
+        return self._parse(data, ArbitrageBet)
 
     def get_value_bets(
         self,
         bookmaker: str,
         include_event_details: Optional[bool] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[List[Dict[str, Any]], List[ValueBet]]:
         """
         Find value betting opportunities.
 
@@ -489,11 +984,31 @@ class OddsAPIClient:
             bookmaker=bookmaker,
             includeEventDetails=include_event_details,
         )
-        return self._get(Endpoints.GET_VALUE_BETS, params)
+        data = self._get(Endpoints.GET_VALUE_BETS, params)
+        return self._parse(data, ValueBet)
+
+    def prewarm(self, connections: Optional[int] = None) -> int:
+        """
+        Open connections to the API host ahead of the first requests.
+
+        Sends concurrent ``HEAD`` requests to the host root, which carry no
+        API key and do not count against the rate limit, so that many
+        keep-alive connections sit in the pool when real requests start.
+
+        Args:
+            connections: Connections to open (default: ``pool.prewarm``)
+
+        Returns:
+            Number of connections opened successfully
+        """
+        count = self.pool.prewarm if connections is None else connections
+        if count <= 0:
+            return 0
+        return self.transport.prewarm(origin(self.base_url), count)
 
     def close(self) -> None:
         """Close the HTTP session."""
-        self.session.close()
+        self.transport.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -3,6 +3,18 @@
 BASE_API_URL = "https://api2.odds-api.io/v3"
 DEFAULT_TIMEOUT = 10
 
+# Real-time odds feed
+WS_API_URL = "wss://api.odds-api.io/v3/ws"
+
+# Maximum number of event IDs accepted by a single odds/multi request
+MAX_EVENT_IDS_PER_REQUEST = 10
+
+# Default number of concurrent requests used by fan-out helpers
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Read size in bytes when streaming large list responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class Endpoints:
     """API endpoint paths."""
@@ -40,3 +52,26 @@ class Endpoints:
 
     # Value Bets
     GET_VALUE_BETS = "value-bets"
+
+
+# Default response cache TTLs in seconds, keyed by endpoint path. Reference
+# data changes rarely and is cached for long periods; odds, arbitrage and
+# value bets are never cached. Endpoints not listed here are not cached.
+ENDPOINT_CACHE_TTLS = {
+    Endpoints.GET_SPORTS: 24 * 3600,
+    Endpoints.GET_LEAGUES: 6 * 3600,
+    Endpoints.GET_BOOKMAKERS: 6 * 3600,
+    Endpoints.GET_PARTICIPANTS: 6 * 3600,
+    Endpoints.GET_PARTICIPANT_BY_ID: 24 * 3600,
+    Endpoints.GET_EVENTS: 30,
+    Endpoints.GET_EVENT_BY_ID: 30,
+    Endpoints.SEARCH_EVENTS: 60,
+    Endpoints.GET_LIVE_EVENTS: 10,
+    Endpoints.GET_EVENT_ODDS: 0,
+    Endpoints.GET_ODDS_MOVEMENT: 0,
+    Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS: 0,
+    Endpoints.GET_UPDATED_ODDS_SINCE_TIMESTAMP: 0,
+    Endpoints.GET_ARBITRAGE_BETS: 0,
+    Endpoints.GET_VALUE_BETS: 0,
+    Endpoints.GET_SELECTED_BOOKMAKERS: 0,
+}
@@ -0,0 +1,72 @@
+"""JSON decoders for API responses.
+
+The fastest available decoder is used by default: orjson, then msgspec, then
+the standard library. All decoders take the raw response body as bytes, so
+no intermediate ``str`` is built.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def _msgspec_loads(data: Union[bytes, str]) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+def get_decoder(decoder: Union[str, JSONDecoder, None] = None) -> JSONDecoder:
+    """
+    Resolve a JSON decoder.
+
+    Args:
+        decoder: ``"orjson"``, ``"msgspec"``, ``"json"``, a callable taking
+            bytes, or None to pick the fastest installed decoder
+
+    Returns:
+        A callable decoding a JSON document from bytes. Invalid input
+        raises ``ValueError``.
+
+    Example:
+        >>> decode = get_decoder("json")
+        >>> decode(b'{"id": 1}')
+        {'id': 1}
+    """
+    if callable(decoder):
+        return decoder
+
+    if decoder is None:
+        if orjson is not None:
+            return orjson.loads
+        if msgspec is not None:
+            return _msgspec_loads
+        return _stdlib_loads
+
+    if decoder == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed: pip install orjson")
+        return orjson.loads
+    if decoder == "msgspec":
+        if msgspec is None:
+            raise ImportError("msgspec is not installed: pip install msgspec")
+        return _msgspec_loads
+    if decoder == "json":
+        return _stdlib_loads
+    raise ValueError(f"Unknown JSON decoder: {decoder!r}")
@@ -29,3 +29,9 @@ class ValidationError(OddsAPIError):
     """Raised when request parameters are invalid."""
 
     pass
+
+
+class TransportError(OddsAPIError):
+    """Raised by a transport when a request fails to connect or times out."""
+
+    pass
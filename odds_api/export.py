@@ -0,0 +1,261 @@
+"""Columnar Arrow/Parquet export of odds snapshots, movements and feed messages.
+
+Requires PyArrow: ``pip install odds-api-io[arrow]``.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+from .stream import CREATED, UPDATED, StreamMessage
+from .timeseries import market_prices, movement_prices
+from .utils import markets_timestamp
+
+# (event, bookmaker, market, line, outcome, price, ts in epoch seconds)
+Row = Tuple[str, str, str, Optional[float], str, float, Optional[float]]
+
+FORMATS = ("parquet", "ipc", "ipc_stream")
+
+# Rows buffered before a record batch is written
+DEFAULT_BATCH_SIZE = 65536
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for columnar export: pip install odds-api-io[arrow]"
+        )
+
+
+def schema() -> "pa.Schema":
+    """
+    Return the fixed export schema.
+
+    Columns: ``event``, ``bookmaker``, ``market``, ``outcome`` (strings),
+    ``line`` (handicap or total, null for lineless markets), ``price``
+    (decimal odds) and ``ts`` (UTC millisecond timestamp, null if unknown).
+    """
+    _require_pyarrow()
+    return pa.schema(
+        [
+            ("event", pa.string()),
+            ("bookmaker", pa.string()),
+            ("market", pa.string()),
+            ("line", pa.float64()),
+            ("outcome", pa.string()),
+            ("price", pa.float64()),
+            ("ts", pa.timestamp("ms", tz="UTC")),
+        ]
+    )
+
+
+def odds_rows(events: Iterable[Dict[str, Any]]) -> Iterator[Row]:
+    """
+    Flatten a REST odds response (e.g. from ``get_odds_for_multiple_events``)
+    of events with ``bookmakers``.
+    """
+    if isinstance(events, dict):
+        events = [events]
+    for item in events:
+        event_id = item.get("id")
+        if event_id is None:
+            continue
+        event_id = str(event_id)
+        for bookmaker, markets in (item.get("bookmakers") or {}).items():
+            markets = markets if isinstance(markets, list) else []
+            fallback = markets_timestamp(markets)
+            for market, line, outcome, ts, price in market_prices(markets, fallback):
+                yield event_id, bookmaker, market, line, outcome, price, ts
+
+
+def movement_rows(
+    event_id: Any,
+    bookmaker: str,
+    market: str,
+    movements: Any,
+    hdp: Optional[float] = None,
+    outcome: Optional[str] = None,
+) -> Iterator[Row]:
+    """Flatten a ``get_odds_movement`` response, oldest first."""
+    event_id = str(event_id)
+    line = float(hdp) if hdp is not None else None
+    for ts, name, price in movement_prices(movements, outcome):
+        yield event_id, bookmaker, market, line, name, price, ts
+
+
+def message_rows(
+    messages: Iterable[Union[StreamMessage, Dict[str, Any]]],
+) -> Iterator[Row]:
+    """Flatten the prices of ``created``/``updated`` feed messages."""
+    for message in messages:
+        if isinstance(message, dict):
+            message = StreamMessage.from_dict(message)
+        if message.type not in (CREATED, UPDATED) or message.id is None:
+            continue
+        event_id, bookmaker = str(message.id), message.bookie or ""
+        rows = market_prices(message.markets, message.timestamp)
+        for market, line, outcome, ts, price in rows:
+            yield event_id, bookmaker, market, line, outcome, price, ts
+
+
+class _Columns:
+    """Column buffers of rows awaiting conversion to a record batch."""
+
+    __slots__ = ("event", "bookmaker", "market", "line", "outcome", "price", "ts")
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, [])
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def extend(self, rows: Iterable[Row], limit: int) -> bool:
+        """Add rows until ``limit`` are buffered; returns True if rows remain."""
+        events, bookmakers, markets = self.event, self.bookmaker, self.market
+        lines, outcomes, prices, stamps = self.line, self.outcome, self.price, self.ts
+        room = limit - len(prices)
+        for event_id, bookmaker, market, line, outcome, price, ts in rows:
+            events.append(event_id)
+            bookmakers.append(bookmaker)
+            markets.append(market)
+            lines.append(line)
+            outcomes.append(outcome)
+            prices.append(price)
+            stamps.append(None if ts is None else int(ts * 1000))
+            room -= 1
+            if room <= 0:
+                return True
+        return False
+
+    def batch(self, schema: "pa.Schema") -> "pa.RecordBatch":
+        arrays = [
+            pa.array(getattr(self, field.name), type=field.type) for field in schema
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_record_batch(rows: Iterable[Row]) -> "pa.RecordBatch":
+    """
+    Convert flattened rows to a single record batch.
+
+    Example:
+        >>> odds = client.get_odds_for_multiple_events(event_ids, "Bet365")
+        >>> batch = to_record_batch(odds_rows(odds))
+        >>> batch.to_pandas()
+    """
+    _require_pyarrow()
+    columns = _Columns()
+    rows = iter(rows)
+    while columns.extend(rows, len(columns) + DEFAULT_BATCH_SIZE):
+        pass
+    return columns.batch(schema())
+
+
+class OddsWriter:
+    """
+    Streams flattened odds to a Parquet or Arrow IPC file.
+
+    Rows are buffered column by column and written as a record batch every
+    ``batch_size`` rows, so memory use stays bounded however much history
+    is exported. Every file has the schema returned by ``schema()``.
+
+    Args:
+        where: Output path or writable file object
+        format: ``"parquet"`` (default), ``"ipc"`` (Arrow IPC file) or
+            ``"ipc_stream"`` (Arrow IPC stream)
+        batch_size: Rows per record batch (and Parquet row group)
+            (default: 65536)
+        **options: Passed to ``pyarrow.parquet.ParquetWriter`` (e.g.
+            ``compression="zstd"``) or ``pyarrow.ipc.IpcWriteOptions``
+
+    Example:
+        >>> with OddsWriter("odds.parquet") as writer:
+        ...     writer.write_odds(client.get_odds_for_multiple_events(ids, "Bet365"))
+        ...     async for message in feed:
+        ...         writer.write_message(message)
+    """
+
+    def __init__(
+        self,
+        where: Any,
+        format: str = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **options: Any,
+    ):
+        _require_pyarrow()
+        if format not in FORMATS:
+            raise ValueError(f"Unknown export format: {format!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.format = format
+        self.batch_size = batch_size
+        self.schema = schema()
+        self.rows_written = 0
+        self._columns = _Columns()
+
+        if format == "parquet":
+            self._writer = pyarrow.parquet.ParquetWriter(where, self.schema, **options)
+        else:
+            ipc_options = pyarrow.ipc.IpcWriteOptions(**options) if options else None
+            new = pyarrow.ipc.new_file if format == "ipc" else pyarrow.ipc.new_stream
+            self._writer = new(where, self.schema, options=ipc_options)
+
+    def __enter__(self) -> "OddsWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def write_rows(self, rows: Iterable[Row]) -> None:
+        """Write flattened rows (as yielded by ``odds_rows`` and friends)."""
+        rows = iter(rows)
+        while self._columns.extend(rows, self.batch_size):
+            self.flush()
+
+    def write_odds(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Write a REST odds response (see ``odds_rows``)."""
+        self.write_rows(odds_rows(events))
+
+    def write_movements(
+        self,
+        event_id: Any,
+        bookmaker: str,
+        market: str,
+        movements: Any,
+        hdp: Optional[float] = None,
+        outcome: Optional[str] = None,
+    ) -> None:
+        """Write a ``get_odds_movement`` response (see ``movement_rows``)."""
+        self.write_rows(
+            movement_rows(event_id, bookmaker, market, movements, hdp, outcome)
+        )
+
+    def write_message(self, message: Union[StreamMessage, Dict[str, Any]]) -> None:
+        """Write the prices of a feed message; other messages are ignored."""
+        self.write_rows(message_rows((message,)))
+
+    def flush(self) -> None:
+        """Write buffered rows as a record batch."""
+        if not len(self._columns):
+            return
+        batch = self._columns.batch(self.schema)
+        if self.format == "parquet":
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self.rows_written += batch.num_rows
+        self._columns = _Columns()
+
+    def close(self) -> None:
+        """Flush buffered rows and finish the file."""
+        if self._writer is None:
+            return
+        self.flush()
+        self._writer.close()
+        self._writer = None
@@ -0,0 +1,128 @@
+"""Per-request timing records passed to client hooks."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .models import Model
+from .transport import Response
+
+
+class RequestRecord(Model):
+    """
+    What happened during one API request, passed to every hook registered
+    on a client once the request has finished.
+
+    Times are in seconds. ``ttfb`` runs from sending the final attempt to
+    receiving its response headers, so it includes connecting when no
+    pooled connection was available. For streamed responses (``iter_*``
+    methods) parsing happens while the body downloads and is included in
+    ``transfer``.
+
+    Attributes:
+        method: HTTP method
+        endpoint: Endpoint template, e.g. ``"events/{id}"``
+        params: Query parameters, without the API key
+        status: HTTP status of the final attempt (None if no response)
+        bytes: Size of the response body
+        wait: Time spent waiting for the client-side rate limiter and quota
+        ttfb: Time to the first byte of the final attempt
+        transfer: Time reading the response body
+        decode: Time decoding the JSON body
+        total: Wall time of the whole request, retries included
+        retries: Number of retried attempts
+        cache_hit: True if served from the response cache without a request
+        streamed: True for streamed list responses
+        error: The exception raised, if the request failed
+        started: Epoch time the request started
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "params",
+        "status",
+        "bytes",
+        "wait",
+        "ttfb",
+        "transfer",
+        "decode",
+        "total",
+        "retries",
+        "cache_hit",
+        "streamed",
+        "error",
+        "started",
+        "_clock",
+    )
+
+    def __init__(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.params = params
+        self.status: Optional[int] = None
+        self.bytes = 0
+        self.wait = 0.0
+        self.ttfb = 0.0
+        self.transfer = 0.0
+        self.decode = 0.0
+        self.total = 0.0
+        self.retries = 0
+        self.cache_hit = False
+        self.streamed = False
+        self.error: Optional[BaseException] = None
+        self.started = time.time()
+        self._clock = time.perf_counter()
+
+    def _fields(self) -> Any:
+        return tuple(
+            (name, getattr(self, name))
+            for name in self.__slots__
+            if not name.startswith("_")
+        )
+
+    def set_response(self, response: Response, retries: int) -> None:
+        """Record the final attempt's response."""
+        self.status = response.status
+        self.bytes = len(response.body)
+        self.ttfb = response.ttfb
+        self.transfer = response.transfer
+        self.retries = retries
+
+
+RequestHook = Callable[[RequestRecord], None]
+
+
+@contextmanager
+def track(
+    hooks: List[RequestHook],
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> Iterator[Optional[RequestRecord]]:
+    """
+    Time the enclosed request and pass its record to ``hooks`` afterwards.
+
+    Hooks with a ``request_started`` method are also given the record
+    before the request is sent. Yields None, and records nothing, when no
+    hooks are registered.
+    """
+    if not hooks:
+        yield None
+        return
+    record = RequestRecord(method, endpoint, params)
+    for hook in hooks:
+        started = getattr(hook, "request_started", None)
+        if started is not None:
+            started(record)
+    try:
+        yield record
+    except Exception as e:
+        record.error = e
+        raise
+    finally:
+        record.total = time.perf_counter() - record._clock
+        for hook in hooks:
+            hook(record)
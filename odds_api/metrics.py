@@ -0,0 +1,361 @@
+"""OpenMetrics exporter for client requests, caches and feeds."""
+
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .hooks import RequestRecord
+from .stream import OddsStream
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Request latency histogram bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Histogram:
+    """Bucket counts, sum and count of one label set."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsCollector:
+    """
+    Aggregate request, cache, quota and feed metrics in OpenMetrics format.
+
+    Register the collector on a client with ``instrument``. It then acts as
+    a request hook and builds per-endpoint latency histograms, counters by
+    status and error class, and in-flight gauges. Cache and quota stats are
+    read from the client, and feed counters from each watched ``OddsStream``,
+    when the metrics are rendered. Each request record takes one short,
+    uncontended lock acquisition to count.
+
+    Rates such as messages per second come from the counters, e.g.
+    ``rate(odds_api_stream_messages_total[1m])`` in Prometheus.
+
+    Args:
+        namespace: Prefix for all metric names (default: "odds_api")
+        buckets: Upper bounds of the latency histogram buckets, in seconds
+
+    Example:
+        >>> metrics = MetricsCollector()
+        >>> client = metrics.instrument(OddsAPIClient(api_key="your_api_key"))
+        >>> server = metrics.serve(9464)  # scrape http://host:9464/metrics
+        >>> print(metrics.render())
+    """
+
+    def __init__(
+        self,
+        namespace: str = "odds_api",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._latency: Dict[Labels, _Histogram] = {}
+        self._requests: Dict[Labels, int] = {}
+        self._errors: Dict[Labels, int] = {}
+        self._in_flight: Dict[Labels, int] = {}
+        self._retries: Dict[Labels, int] = {}
+        self._bytes: Dict[Labels, int] = {}
+        self._cache_hits: Dict[Labels, int] = {}
+        self._clients: List[Any] = []
+        self._streams: List[Tuple[str, OddsStream]] = []
+
+    def instrument(self, client: Any) -> Any:
+        """
+        Record the requests of ``client`` and export its cache stats.
+
+        Args:
+            client: ``OddsAPIClient`` or ``AsyncOddsAPIClient``
+
+        Returns:
+            The client, for chaining
+        """
+        client.hooks.append(self)
+        self._clients.append(client)
+        return client
+
+    def watch_stream(self, stream: OddsStream, name: str = "default") -> OddsStream:
+        """
+        Export the message, reconnect and queue depth counters of a feed.
+
+        Args:
+            stream: ``OddsStream`` to watch
+            name: Value of the ``stream`` label, to tell feeds apart
+
+        Returns:
+            The stream, for chaining
+        """
+        self._streams.append((name, stream))
+        return stream
+
+    def request_started(self, record: RequestRecord) -> None:
+        """Count a request as in flight (called by the client)."""
+        key = (("endpoint", record.endpoint),)
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def __call__(self, record: RequestRecord) -> None:
+        """Count a finished request (called by the client)."""
+        endpoint = ("endpoint", record.endpoint)
+        key = (endpoint,)
+        if record.cache_hit:
+            status = "cache"
+        else:
+            status = str(record.status) if record.status is not None else "none"
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 1) - 1
+            counted = (endpoint, ("method", record.method), ("status", status))
+            self._requests[counted] = self._requests.get(counted, 0) + 1
+            if record.cache_hit:
+                self._cache_hits[key] = self._cache_hits.get(key, 0) + 1
+                return
+            if record.error is not None:
+                failed = (endpoint, ("error", type(record.error).__name__))
+                self._errors[failed] = self._errors.get(failed, 0) + 1
+            if record.retries:
+                self._retries[key] = self._retries.get(key, 0) + record.retries
+            self._bytes[key] = self._bytes.get(key, 0) + record.bytes
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = _Histogram(len(self.buckets))
+            histogram.counts[bisect_left(self.buckets, record.total)] += 1
+            histogram.sum += record.total
+            histogram.count += 1
+
+    def render(self) -> str:
+        """Return all metrics in OpenMetrics text format."""
+        lines: List[str] = []
+        with self._lock:
+            latency = [
+                (labels, list(h.counts), h.sum, h.count)
+                for labels, h in self._latency.items()
+            ]
+            counters = [
+                ("requests", "API requests by final status", self._requests),
+                ("request_errors", "Failed requests by exception", self._errors),
+                ("request_retries", "Retried request attempts", self._retries),
+                ("response_bytes", "Response body bytes", self._bytes),
+                ("request_cache_hits", "Requests served from cache", self._cache_hits),
+            ]
+            samples = [(m, d, list(values.items())) for m, d, values in counters]
+            in_flight = list(self._in_flight.items())
+
+        name = self._name("request_duration_seconds")
+        lines.append(f"# TYPE {name} histogram")
+        lines.append(f"# UNIT {name} seconds")
+        lines.append(f"# HELP {name} Request latency including retries.")
+        bounds = self.buckets + (float("inf"),)
+        for labels, counts, total, count in latency:
+            cumulative = 0
+            for bound, n in zip(bounds, counts):
+                cumulative += n
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{name}_bucket{_labels(labels, le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+
+        for metric, description, values in samples:
+            self._counter(lines, metric, description, values)
+        self._gauge(lines, "requests_in_flight", "Requests in progress", in_flight)
+        self._render_caches(lines)
+        self._render_quotas(lines)
+        self._render_streams(lines)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, addr: str = "") -> ThreadingHTTPServer:
+        """
+        Serve ``render()`` over HTTP from a daemon thread.
+
+        Every path returns the metrics. Call ``shutdown()`` on the returned
+        server to stop it.
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            addr: Address to bind (default: all interfaces)
+
+        Returns:
+            The running ``ThreadingHTTPServer``
+        """
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = collector.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((addr, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server
+
+    def _name(self, metric: str) -> str:
+        return f"{self.namespace}_{metric}" if self.namespace else metric
+
+    def _counter(
+        self,
+        lines: List[str],
+        metric: str,
+        description: str,
+        samples: Iterable[Tuple[Labels, float]],
+    ) -> None:
+        name = self._name(metric)
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"# HELP {name} {description}.")
+        for labels, value in samples:
+            lines.append(f"{name}_total{_labels(labels)} {_number(value)}")
+
+    def _gauge(
+        self,
+        lines: List[str],
+        metric: str,
+        description: str,
+        samples: Iterable[Tuple[Labels, float]],
+    ) -> None:
+        name = self._name(metric)
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"# HELP {name} {description}.")
+        for labels, value in samples:
+            lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def _render_caches(self, lines: List[str]) -> None:
+        # Caches shared by several clients are exported once; separate caches
+        # of the same kind are told apart by their index
+        caches: Dict[str, List[Any]] = {"response": [], "validators": []}
+        for client in self._clients:
+            for attr, kind in (("cache", "response"), ("validators", "validators")):
+                store = getattr(client, attr, None)
+                if store is not None and all(store is not c for c in caches[kind]):
+                    caches[kind].append(store)
+        stats = [
+            ((("cache", kind), ("index", str(i))), store.stats)
+            for kind, stores in caches.items()
+            for i, store in enumerate(stores)
+        ]
+        if not stats:
+            return
+        self._counter(
+            lines,
+            "cache_hits",
+            "Cache hits (304 responses for validators)",
+            [(labels, s.hits) for labels, s in stats],
+        )
+        self._counter(
+            lines,
+            "cache_misses",
+            "Cache misses",
+            [(labels, s.misses) for labels, s in stats],
+        )
+        self._gauge(
+            lines,
+            "cache_hit_ratio",
+            "Fraction of cache lookups that hit",
+            [(labels, s.hit_ratio) for labels, s in stats],
+        )
+        self._gauge(
+            lines,
+            "cache_entries",
+            "Entries in the cache",
+            [(labels, s.entries) for labels, s in stats],
+        )
+
+    def _render_quotas(self, lines: List[str]) -> None:
+        quotas = []
+        for client in self._clients:
+            quota = getattr(client, "quota", None)
+            if quota is not None and all(quota is not q for q in quotas):
+                quotas.append(quota)
+        known = [((("quota", str(i)),), q) for i, q in enumerate(quotas) if q.limit]
+        if not known:
+            return
+        self._gauge(
+            lines,
+            "quota_remaining",
+            "Requests left in the plan quota",
+            [(labels, q.remaining) for labels, q in known],
+        )
+        self._gauge(
+            lines,
+            "quota_limit",
+            "Requests allowed per quota period",
+            [(labels, q.limit) for labels, q in known],
+        )
+        self._counter(
+            lines,
+            "quota_throttled_seconds",
+            "Time requests were delayed to stretch the quota",
+            [(labels, q.throttled) for labels, q in known],
+        )
+
+    def _render_streams(self, lines: List[str]) -> None:
+        if not self._streams:
+            return
+        streams = [
+            ((("stream", name),), stream, stream.stats)
+            for name, stream in self._streams
+        ]
+        self._counter(
+            lines,
+            "stream_messages",
+            "Feed messages received",
+            [(labels, s.messages) for labels, _, s in streams],
+        )
+        self._counter(
+            lines,
+            "stream_decode_errors",
+            "Feed frames that failed to decode",
+            [(labels, s.decode_errors) for labels, _, s in streams],
+        )
+        self._counter(
+            lines,
+            "stream_reconnects",
+            "Feed reconnects",
+            [(labels, s.reconnects) for labels, _, s in streams],
+        )
+        self._gauge(
+            lines,
+            "stream_queue_depth",
+            "Parsed messages waiting for the consumer",
+            [(labels, s.queue_depth) for labels, _, s in streams],
+        )
+        self._gauge(
+            lines,
+            "stream_connected",
+            "1 while the feed is connected",
+            [(labels, int(stream.connected)) for labels, stream, _ in streams],
+        )
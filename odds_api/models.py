@@ -0,0 +1,408 @@
+"""Typed, compact response models.
+
+Enabled with ``return_models=True`` on either client. Every model uses
+``__slots__`` so instances carry no per-object ``__dict__``; fields the SDK
+does not know about are kept in ``extra`` (None when there are none).
+Responses are decoded to dicts first and the models built from them, so
+models cost a second pass over the payload.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Keys of a market line entry that hold prices rather than line metadata
+_LINE_KEYS = frozenset({"hdp", "label", "max"})
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convert a price given as number or string to float."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _slug(value: Any) -> Optional[str]:
+    """Return the slug of a ``{"name", "slug"}`` object, or the value itself."""
+    if isinstance(value, dict):
+        return value.get("slug") or value.get("name")
+    return value
+
+
+def _extra(data: Dict[str, Any], known: frozenset) -> Optional[Dict[str, Any]]:
+    extra = {k: v for k, v in data.items() if k not in known}
+    return extra or None
+
+
+class Model:
+    """Base class providing ``repr``, equality and ``to_dict`` over slots."""
+
+    __slots__ = ()
+
+    def _fields(self) -> Tuple[Tuple[str, Any], ...]:
+        return tuple((name, getattr(self, name)) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}"
+            for name, value in self._fields()
+            if name != "extra" and value is not None
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._fields() == other._fields()  # type: ignore[attr-defined]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the model as a plain dict (nested models included)."""
+        result: Dict[str, Any] = {}
+        for name, value in self._fields():
+            if name == "extra":
+                continue
+            result[name] = _dump(value)
+        if getattr(self, "extra", None):
+            result.update(self.extra)  # type: ignore[attr-defined]
+        return result
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_dump(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _dump(v) for k, v in value.items()}
+    return value
+
+
+class Outcome(Model):
+    """A single price, e.g. ``home`` at 1.85."""
+
+    __slots__ = ("name", "price")
+
+    def __init__(self, name: str, price: Optional[float]):
+        self.name = name
+        self.price = price
+
+
+class Market(Model):
+    """
+    One line of a market for one bookmaker.
+
+    ``hdp`` is the handicap/total line for Spread and Totals markets and None
+    for markets without a line such as ``ML``. ``label`` and ``max_stake``
+    carry the line's ``label`` and ``max`` fields when the API sends them.
+    """
+
+    __slots__ = ("name", "hdp", "outcomes", "updated_at", "label", "max_stake")
+
+    def __init__(
+        self,
+        name: str,
+        hdp: Optional[float],
+        outcomes: List[Outcome],
+        updated_at: Optional[str] = None,
+        label: Optional[str] = None,
+        max_stake: Optional[float] = None,
+    ):
+        self.name = name
+        self.hdp = hdp
+        self.outcomes = outcomes
+        self.updated_at = updated_at
+        self.label = label
+        self.max_stake = max_stake
+
+    def price(self, outcome: str) -> Optional[float]:
+        """Return the price of ``outcome`` (e.g. ``"home"``), if offered."""
+        for o in self.outcomes:
+            if o.name == outcome:
+                return o.price
+        return None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> List["Market"]:
+        """
+        Expand an API market (``{"name", "odds": [line, ...]}``) into one
+        ``Market`` per line.
+        """
+        name = data.get("name", "")
+        updated_at = data.get("updatedAt")
+        lines = data.get("odds") or [{}]
+        markets = []
+        for line in lines:
+            outcomes = [
+                Outcome(key, _to_float(value))
+                for key, value in line.items()
+                if key not in _LINE_KEYS
+            ]
+            markets.append(
+                cls(
+                    name,
+                    _to_float(line.get("hdp")),
+                    outcomes,
+                    updated_at,
+                    line.get("label"),
+                    _to_float(line.get("max")),
+                )
+            )
+        return markets
+
+
+class BookmakerOdds(Model):
+    """All markets offered by one bookmaker for one event."""
+
+    __slots__ = ("bookmaker", "markets")
+
+    def __init__(self, bookmaker: str, markets: List[Market]):
+        self.bookmaker = bookmaker
+        self.markets = markets
+
+    def market(self, name: str, hdp: Optional[float] = None) -> Optional[Market]:
+        """Return the market line with the given name and ``hdp``, if any."""
+        for m in self.markets:
+            if m.name == name and m.hdp == hdp:
+                return m
+        return None
+
+    @classmethod
+    def from_dict(cls, bookmaker: str, markets: Any) -> "BookmakerOdds":
+        """Build from one entry of an odds response's ``bookmakers`` mapping."""
+        expanded: List[Market] = []
+        for market in markets if isinstance(markets, list) else []:
+            expanded.extend(Market.from_dict(market))
+        return cls(bookmaker, expanded)
+
+
+class Participant(Model):
+    """A team or player."""
+
+    __slots__ = ("id", "name", "sport", "extra")
+    _known = frozenset({"id", "name", "sport"})
+
+    def __init__(
+        self,
+        participant_id: Any,
+        name: Optional[str],
+        sport: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.id = participant_id
+        self.name = name
+        self.sport = sport
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Participant":
+        return cls(
+            data.get("id"),
+            data.get("name"),
+            _slug(data.get("sport")),
+            _extra(data, cls._known),
+        )
+
+
+class Event(Model):
+    """
+    An event, optionally with odds.
+
+    ``bookmakers`` is populated for odds responses and is None otherwise.
+    """
+
+    __slots__ = (
+        "id",
+        "home",
+        "away",
+        "date",
+        "status",
+        "sport",
+        "league",
+        "bookmakers",
+        "extra",
+    )
+    _known = frozenset(
+        {"id", "home", "away", "date", "status", "sport", "league", "bookmakers"}
+    )
+
+    def __init__(
+        self,
+        event_id: Any,
+        home: Optional[str] = None,
+        away: Optional[str] = None,
+        date: Optional[str] = None,
+        status: Optional[str] = None,
+        sport: Optional[str] = None,
+        league: Optional[str] = None,
+        bookmakers: Optional[Dict[str, BookmakerOdds]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.id = event_id
+        self.home = home
+        self.away = away
+        self.date = date
+        self.status = status
+        self.sport = sport
+        self.league = league
+        self.bookmakers = bookmakers
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        raw_bookmakers = data.get("bookmakers")
+        bookmakers = None
+        if isinstance(raw_bookmakers, dict):
+            bookmakers = {
+                name: BookmakerOdds.from_dict(name, markets)
+                for name, markets in raw_bookmakers.items()
+            }
+        return cls(
+            data.get("id"),
+            data.get("home"),
+            data.get("away"),
+            data.get("date"),
+            data.get("status"),
+            _slug(data.get("sport")),
+            _slug(data.get("league")),
+            bookmakers,
+            _extra(data, cls._known),
+        )
+
+
+class ArbitrageLeg(Model):
+    """One bet of an arbitrage opportunity."""
+
+    __slots__ = ("bookmaker", "outcome", "price")
+
+    def __init__(self, bookmaker: Optional[str], outcome: str, price: Optional[float]):
+        self.bookmaker = bookmaker
+        self.outcome = outcome
+        self.price = price
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ArbitrageLeg":
+        return cls(
+            data.get("bookmaker"),
+            data.get("outcome") or data.get("side", ""),
+            _to_float(data.get("odds", data.get("price"))),
+        )
+
+
+class ArbitrageBet(Model):
+    """An arbitrage opportunity returned by ``get_arbitrage_bets``."""
+
+    __slots__ = ("id", "market", "hdp", "profit_percentage", "legs", "event", "extra")
+    _known = frozenset(
+        {"id", "market", "hdp", "profitPercentage", "bets", "legs", "event"}
+    )
+
+    def __init__(
+        self,
+        bet_id: Any,
+        market: Optional[str],
+        hdp: Optional[float],
+        profit_percentage: Optional[float],
+        legs: List[ArbitrageLeg],
+        event: Optional[Event] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.id = bet_id
+        self.market = market
+        self.hdp = hdp
+        self.profit_percentage = profit_percentage
+        self.legs = legs
+        self.event = event
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ArbitrageBet":
+        market = data.get("market")
+        hdp = data.get("hdp")
+        if isinstance(market, dict):
+            hdp = market.get("hdp", hdp)
+            market = market.get("name")
+        event = data.get("event")
+        return cls(
+            data.get("id"),
+            market,
+            _to_float(hdp),
+            _to_float(data.get("profitPercentage")),
+            [
+                ArbitrageLeg.from_dict(b)
+                for b in data.get("bets") or data.get("legs") or []
+            ],
+            Event.from_dict(event) if isinstance(event, dict) else None,
+            _extra(data, cls._known),
+        )
+
+
+class ValueBet(Model):
+    """A value bet returned by ``get_value_bets``."""
+
+    __slots__ = (
+        "id",
+        "bookmaker",
+        "market",
+        "hdp",
+        "outcome",
+        "price",
+        "expected_value",
+        "event",
+        "extra",
+    )
+    _known = frozenset(
+        {
+            "id",
+            "bookmaker",
+            "market",
+            "hdp",
+            "outcome",
+            "betSide",
+            "odds",
+            "expectedValue",
+            "event",
+        }
+    )
+
+    def __init__(
+        self,
+        bet_id: Any,
+        bookmaker: Optional[str],
+        market: Optional[str],
+        hdp: Optional[float],
+        outcome: Optional[str],
+        price: Optional[float],
+        expected_value: Optional[float],
+        event: Optional[Event] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.id = bet_id
+        self.bookmaker = bookmaker
+        self.market = market
+        self.hdp = hdp
+        self.outcome = outcome
+        self.price = price
+        self.expected_value = expected_value
+        self.event = event
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValueBet":
+        market = data.get("market")
+        hdp = data.get("hdp")
+        if isinstance(market, dict):
+            hdp = market.get("hdp", hdp)
+            market = market.get("name")
+        event = data.get("event")
+        return cls(
+            data.get("id"),
+            data.get("bookmaker"),
+            market,
+            _to_float(hdp),
+            data.get("outcome") or data.get("betSide"),
+            _to_float(data.get("odds")),
+            _to_float(data.get("expectedValue")),
+            Event.from_dict(event) if isinstance(event, dict) else None,
+            _extra(data, cls._known),
+        )
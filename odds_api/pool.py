@@ -0,0 +1,108 @@
+"""Connection pool settings shared by the sync and async clients."""
+
+from typing import Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class PoolConfig:
+    """
+    Connection pooling, keep-alive and DNS caching settings.
+
+    The same settings configure the ``requests`` adapter of
+    ``OddsAPIClient`` and the ``aiohttp`` connector of
+    ``AsyncOddsAPIClient``. All API requests go to one host, so
+    ``max_per_host`` is what bounds the pool in practice.
+
+    Args:
+        max_connections: Total connections the pool may hold (default: 100;
+            0 means no limit for the async client)
+        max_per_host: Connections per host, a hard limit for every
+            transport (default: 32; 0 means ``max_connections``)
+        keepalive_timeout: Seconds an idle connection is kept open (async
+            client; requests keeps idle connections until the server closes
+            them) (default: 30)
+        dns_cache_ttl: Seconds resolved addresses are cached (async client;
+            None disables the cache) (default: 300)
+        prewarm: Connections to open when the client starts, so the first
+            requests do not pay for TCP and TLS handshakes (default: 0)
+        acquire_timeout: Seconds a request waits for a free connection
+            while ``max_per_host`` are busy before failing with
+            ``TransportError`` (default: None, the request timeout)
+
+    Example:
+        >>> pool = PoolConfig(max_per_host=64, prewarm=16)
+        >>> client = OddsAPIClient(api_key="your_api_key", pool=pool)
+    """
+
+    __slots__ = (
+        "max_connections",
+        "max_per_host",
+        "keepalive_timeout",
+        "dns_cache_ttl",
+        "prewarm",
+        "acquire_timeout",
+    )
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_per_host: int = 32,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        prewarm: int = 0,
+        acquire_timeout: Optional[float] = None,
+    ):
+        if max_connections < 0 or max_per_host < 0 or prewarm < 0:
+            raise ValueError("pool sizes must be >= 0")
+        if acquire_timeout is not None and acquire_timeout <= 0:
+            raise ValueError("acquire_timeout must be positive")
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.prewarm = prewarm
+        self.acquire_timeout = acquire_timeout
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"PoolConfig({fields})"
+
+    @property
+    def per_host(self) -> int:
+        """Effective connections per host."""
+        return self.max_per_host or self.max_connections
+
+    def mount(self, session: requests.Session) -> None:
+        """
+        Install pooled adapters sized by this config on a requests session.
+
+        The pool itself does not block, as requests offers no timeout for
+        waiting on it; ``RequestsTransport`` enforces ``max_per_host``
+        before a request reaches the pool.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=max(1, self.max_connections // max(1, self.per_host)),
+            pool_maxsize=max(1, self.per_host),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Create an aiohttp connector with these settings."""
+        return aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.dns_cache_ttl is not None,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+
+def origin(url: str) -> str:
+    """Return the ``scheme://host[:port]/`` root of ``url``."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/"
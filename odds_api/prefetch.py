@@ -0,0 +1,55 @@
+"""Progress reporting for the clients' ``prefetch_snapshot``."""
+
+from typing import Callable, Iterable, List, Optional, Union
+
+from .models import Model
+from .utils import normalize_ids
+
+Leagues = Union[str, Iterable[str], None]
+
+
+class PrefetchProgress(Model):
+    """
+    Progress of a ``prefetch_snapshot`` call, passed to its ``progress``
+    callback after every completed request.
+
+    ``batches_total`` grows as league listings arrive, since the number of
+    odds batches is only known once a league's events have been listed.
+    """
+
+    __slots__ = (
+        "leagues_done",
+        "leagues_total",
+        "events",
+        "batches_done",
+        "batches_total",
+        "quotes",
+    )
+
+    def __init__(self, leagues_total: int):
+        self.leagues_done = 0
+        self.leagues_total = leagues_total
+        self.events = 0
+        self.batches_done = 0
+        self.batches_total = 0
+        self.quotes = 0
+
+    @property
+    def done(self) -> bool:
+        """True once every league is listed and every odds batch loaded."""
+        return (
+            self.leagues_done == self.leagues_total
+            and self.batches_done == self.batches_total
+        )
+
+
+ProgressCallback = Callable[[PrefetchProgress], None]
+
+
+def league_list(leagues: Leagues) -> List[Optional[str]]:
+    """
+    Split ``leagues`` (comma-separated or iterable) into slugs; no leagues
+    means a single sport-wide listing.
+    """
+    slugs = normalize_ids(leagues) if leagues is not None else []
+    return list(slugs) or [None]
@@ -0,0 +1,226 @@
+"""Request quota tracking and adaptive throttling for the Odds-API.io clients."""
+
+import asyncio
+import threading
+import time
+from typing import Mapping, Optional, Tuple
+
+from .retry import parse_retry_after
+
+# Header names tried, in order, for each quota field
+LIMIT_HEADERS = ("X-RateLimit-Limit", "RateLimit-Limit", "X-Requests-Limit")
+REMAINING_HEADERS = (
+    "X-RateLimit-Remaining",
+    "RateLimit-Remaining",
+    "X-Requests-Remaining",
+)
+RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset", "X-Requests-Reset")
+
+# Reset values above this are epoch timestamps rather than delta-seconds
+_EPOCH_THRESHOLD = 1e9
+
+
+def _header(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value:
+            return value
+    return None
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(float(value.split(",")[0].split(";")[0]))
+    except ValueError:
+        return None
+
+
+def parse_quota_headers(
+    headers: Mapping[str, str],
+) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    """
+    Parse rate-limit headers into ``(limit, remaining, reset_in)``.
+
+    ``reset_in`` is in seconds; the reset header may hold delta-seconds, an
+    epoch timestamp or an HTTP date. Missing or malformed fields are None.
+    """
+    limit = _int(_header(headers, LIMIT_HEADERS))
+    remaining = _int(_header(headers, REMAINING_HEADERS))
+    reset = _header(headers, RESET_HEADERS)
+    reset_in = parse_retry_after(reset)
+    if reset_in is not None and reset_in > _EPOCH_THRESHOLD:
+        reset_in = max(0.0, reset_in - time.time())
+    return limit, remaining, reset_in
+
+
+class Quota:
+    """
+    Live view of the request quota, used to throttle requests adaptively.
+
+    The limit, remaining requests and reset time are read from the
+    rate-limit headers of every response. When the API sends none, a
+    configured ``budget`` per ``period`` is counted locally instead.
+
+    While more than ``slow_below`` of the quota remains, requests are sent
+    at full speed. Below it, requests are spaced further apart as the quota
+    shrinks, until at zero remaining they are spread evenly over the time
+    left until the reset. A client can thus poll as fast as the quota
+    allows without running into ``RateLimitExceededError``. Once nothing
+    remains and the reset time is known, further requests are counted
+    against the following window(s) and spread evenly across them. Like
+    ``RateLimiter``, delays are reserved under a short lock and slept
+    outside it, so one instance can be shared by threads and coroutines.
+
+    Args:
+        budget: Requests allowed per ``period`` when the API sends no quota
+            headers (default: None, i.e. only headers are used)
+        period: Length in seconds of the budget window, also assumed as
+            the time to reset when headers give no reset (default: 3600)
+        slow_below: Fraction of the quota below which requests are paced
+            (default: 0.2; 0 disables throttling)
+
+    Example:
+        >>> client = OddsAPIClient(api_key="your_api_key", quota=Quota())
+        >>> client.get_sports()
+        >>> client.quota.remaining, client.quota.reset_in
+        (4873, 2210.4)
+    """
+
+    def __init__(
+        self,
+        budget: Optional[int] = None,
+        period: float = 3600.0,
+        slow_below: float = 0.2,
+    ):
+        if budget is not None and budget <= 0:
+            raise ValueError("budget must be positive")
+        if period <= 0:
+            raise ValueError("period must be positive")
+        if not 0 <= slow_below <= 1:
+            raise ValueError("slow_below must be between 0 and 1")
+
+        self.budget = budget
+        self.period = period
+        self.slow_below = slow_below
+        self.limit: Optional[int] = budget
+        self.remaining: Optional[int] = budget
+        self.from_headers = False
+        self.throttled = 0.0
+
+        self._reset_at: Optional[float] = None
+        self._next = 0.0
+        # Requests reserved against windows after the current one
+        self._queued = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"Quota(limit={self.limit}, remaining={self.remaining}, "
+            f"reset_in={self.reset_in}, from_headers={self.from_headers})"
+        )
+
+    @property
+    def reset_in(self) -> Optional[float]:
+        """Seconds until the quota resets, if known."""
+        if self._reset_at is None:
+            return None
+        return max(0.0, self._reset_at - time.monotonic())
+
+    @property
+    def used_fraction(self) -> Optional[float]:
+        """Fraction of the quota used, if known."""
+        if not self.limit or self.remaining is None:
+            return None
+        return 1.0 - max(0, self.remaining) / self.limit
+
+    def update(self, headers: Mapping[str, str]) -> bool:
+        """
+        Update the quota from response headers.
+
+        Returns:
+            True if the headers carried quota information
+        """
+        limit, remaining, reset_in = parse_quota_headers(headers)
+        if remaining is None:
+            return False
+        with self._lock:
+            self.from_headers = True
+            self.remaining = remaining
+            if limit is not None:
+                self.limit = limit
+            elif remaining and (self.limit is None or self.limit < remaining):
+                self.limit = remaining
+            if reset_in is not None:
+                self._reset_at = time.monotonic() + reset_in
+        return True
+
+    def _roll(self, now: float) -> None:
+        if self._reset_at is not None and now >= self._reset_at:
+            # Past the reset: assume the full quota, less the requests queued
+            # for this window, until headers say otherwise. Later resets are
+            # assumed to follow every ``period``.
+            windows = 1 + int((now - self._reset_at) // self.period)
+            self._reset_at += windows * self.period
+            limit = self.limit or 0
+            self._queued = max(0, self._queued - (windows - 1) * limit)
+            carried = min(limit, self._queued)
+            self._queued -= carried
+            self.remaining = limit - carried if self.limit is not None else None
+        if self._reset_at is None and not self.from_headers and self.budget:
+            self._reset_at = now + self.period
+
+    def reserve(self) -> float:
+        """
+        Count one request against the quota and return how long to wait.
+
+        The reservation is made immediately, so the returned delay must be
+        honoured before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._roll(now)
+            if self.remaining is None or not self.limit:
+                return 0.0
+            remaining = self.remaining
+            self.remaining = max(0, remaining - 1)
+            fraction = remaining / self.limit
+            if fraction >= self.slow_below:
+                return 0.0
+            if remaining <= 0:
+                # Used up: count the request against the next window with
+                # room, spaced evenly across it, or leave it to the server's
+                # 429 and the retry policy if the reset is unknown
+                if self._reset_at is None:
+                    return 0.0
+                window, position = divmod(self._queued, self.limit)
+                self._queued += 1
+                start = self._reset_at + self.period * (window + position / self.limit)
+                start = max(now, start)
+            else:
+                start = max(now, self._next)
+                if self._reset_at is not None:
+                    reset_in = max(0.0, self._reset_at - start)
+                else:
+                    reset_in = self.period
+                # Even spacing over the rest of the reset window, scaled from
+                # 0 at the threshold up to the full spacing near exhaustion
+                interval = reset_in / remaining
+                interval *= 1.0 - fraction / self.slow_below
+                self._next = start + interval
+            delay = start - now
+            self.throttled += delay
+            return delay
+
+    def acquire(self) -> None:
+        """Block the current thread until the next request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,103 @@
+"""Client-side token-bucket rate limiting for the Odds-API.io clients."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by any number of clients.
+
+    The bucket refills at ``rate`` tokens per second up to ``burst`` tokens.
+    Each request consumes the weight configured for its endpoint (default 1).
+    Tokens are reserved under a short lock and the caller then sleeps outside
+    of it, so one instance can be shared by many threads (``acquire``) and by
+    many coroutines (``acquire_async``) without ever blocking the event loop.
+    Callers are served in arrival order.
+
+    Args:
+        rate: Sustained rate in tokens per second
+        burst: Bucket capacity, i.e. how many requests may be sent back to
+            back after an idle period (default: ``max(1, rate)``)
+        weights: Optional mapping of endpoint paths (see ``Endpoints``) to
+            the number of tokens a request to that endpoint costs
+
+    Example:
+        >>> limiter = RateLimiter.per_hour(5000, burst=20)
+        >>> client_a = OddsAPIClient(api_key="key", rate_limiter=limiter)
+        >>> client_b = OddsAPIClient(api_key="key", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        if self.burst <= 0:
+            raise ValueError("burst must be positive")
+        self.weights = dict(weights or {})
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_hour(
+        cls,
+        requests: float,
+        burst: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> "RateLimiter":
+        """Create a limiter from an hourly request quota."""
+        return cls(requests / 3600.0, burst=burst, weights=weights)
+
+    def weight_for(self, endpoint: Optional[str]) -> float:
+        """Return the token cost of a request to ``endpoint``."""
+        if endpoint is None:
+            return 1.0
+        return self.weights.get(endpoint, 1.0)
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (negative while callers are queued)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, weight: float = 1.0) -> float:
+        """
+        Reserve ``weight`` tokens and return how long the caller must wait.
+
+        The reservation is made immediately, so the returned delay must be
+        honoured before sending the request.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= weight
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, endpoint: Optional[str] = None) -> None:
+        """Block the current thread until a request to ``endpoint`` may be sent."""
+        delay = self.reserve(self.weight_for(endpoint))
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: Optional[str] = None) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        delay = self.reserve(self.weight_for(endpoint))
+        if delay > 0:
+            await asyncio.sleep(delay)
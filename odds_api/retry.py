@@ -0,0 +1,111 @@
+"""Retry policy with exponential backoff for the Odds-API.io clients."""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient API failures.
+
+    The delay before retry ``n`` (0-based) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2 ** n)]`` so that many clients
+    retrying at once spread out instead of hitting the API in lockstep.
+    A ``Retry-After`` header sent by the server is honoured as a lower
+    bound on the delay.
+
+    Args:
+        max_retries: Maximum number of retries after the first attempt
+            (default: 3). Use 0 to disable retrying.
+        base_delay: Backoff base in seconds (default: 0.5)
+        max_delay: Upper bound for a single backoff delay in seconds
+            (default: 30)
+        max_elapsed: Total time budget in seconds across all attempts;
+            no retry is scheduled that would exceed it (default: 60)
+        retry_statuses: HTTP status codes that are retried
+            (default: 429, 500, 502, 503, 504)
+
+    Example:
+        >>> policy = RetryPolicy(max_retries=5, max_elapsed=20)
+        >>> client = OddsAPIClient(api_key="your_api_key", retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_elapsed: float = 60.0,
+        retry_statuses: Collection[int] = RETRYABLE_STATUS_CODES,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def is_retryable_status(self, status: int) -> bool:
+        """Return True if a response with this status should be retried."""
+        return status in self.retry_statuses
+
+    def get_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt: Number of retries already made (0 for the first retry)
+            elapsed: Seconds spent since the first attempt started
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Seconds to sleep before retrying, or None if the request
+            should not be retried.
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value into seconds.
+
+    Both the delta-seconds and HTTP-date forms are supported.
+    Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,356 @@
+"""Asyncio client for the Odds-API.io real-time WebSocket feed."""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlencode
+
+import aiohttp
+
+from .constants import WS_API_URL
+from .decoders import JSONDecoder, get_decoder
+from .exceptions import InvalidAPIKeyError, OddsAPIError
+from .models import Model
+from .retry import RetryPolicy
+from .utils import markets_timestamp, parse_timestamp
+
+# Message types sent by the feed
+WELCOME = "welcome"
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+NO_MARKETS = "no_markets"
+
+# Default number of parsed messages buffered between the socket and consumer
+DEFAULT_QUEUE_SIZE = 10000
+
+Filter = Union[str, Iterable[str], None]
+
+# Marks the end of the stream in the message queue
+_END = object()
+
+
+def _join(value: Filter) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return ",".join(value)
+
+
+class StreamMessage(Model):
+    """
+    One parsed feed message.
+
+    ``type`` is one of ``created``, ``updated``, ``deleted``, ``no_markets``
+    or ``welcome``. ``markets`` holds the bookmaker's full market list for
+    ``created``/``updated`` messages and is empty otherwise. ``timestamp``
+    is the update time in Unix seconds, taken from the message or from the
+    latest market ``updatedAt``.
+    """
+
+    __slots__ = ("type", "id", "bookie", "markets", "timestamp", "extra")
+    _known = frozenset({"type", "id", "bookie", "markets", "timestamp"})
+
+    def __init__(
+        self,
+        message_type: str,
+        event_id: Optional[str] = None,
+        bookie: Optional[str] = None,
+        markets: Optional[List[Dict[str, Any]]] = None,
+        timestamp: Optional[float] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.type = message_type
+        self.id = event_id
+        self.bookie = bookie
+        self.markets = markets if markets is not None else []
+        self.timestamp = timestamp
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StreamMessage":
+        event_id = data.get("id")
+        markets = data.get("markets")
+        markets = markets if isinstance(markets, list) else []
+        timestamp = parse_timestamp(data.get("timestamp"))
+        if timestamp is None:
+            timestamp = markets_timestamp(markets)
+        extra = {k: v for k, v in data.items() if k not in cls._known}
+        return cls(
+            data.get("type", ""),
+            str(event_id) if event_id is not None else None,
+            data.get("bookie"),
+            markets,
+            timestamp,
+            extra or None,
+        )
+
+
+class StreamStats:
+    """Counters for a feed connection."""
+
+    __slots__ = ("messages", "decode_errors", "reconnects", "queue_depth")
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.decode_errors = 0
+        self.reconnects = 0
+        self.queue_depth = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamStats(messages={self.messages}, "
+            f"decode_errors={self.decode_errors}, "
+            f"reconnects={self.reconnects}, queue_depth={self.queue_depth})"
+        )
+
+
+class OddsStream:
+    """
+    Real-time odds feed as an async iterator of ``StreamMessage`` objects.
+
+    A single background task reads the socket, splits frames holding several
+    newline-separated JSON documents, decodes them with the fastest installed
+    JSON decoder and puts the parsed messages on a bounded queue. When the
+    consumer falls behind and the queue is full, reading pauses, so memory
+    stays bounded and TCP flow control pushes back on the server instead of
+    messages being dropped.
+
+    Lost connections are re-established with exponential backoff and full
+    jitter per ``reconnect_policy``; the backoff resets once a connection
+    has been opened. When the policy gives up, iteration raises
+    ``OddsAPIError``. An invalid API key raises ``InvalidAPIKeyError``
+    without retrying, and any other failure while reading (e.g. a custom
+    decoder raising) ends the stream with ``OddsAPIError``.
+
+    Args:
+        api_key: Your Odds-API.io API key
+        markets: Market names to subscribe to, e.g. ``"ML,Spread,Totals"``
+            or a list (required by the feed, max 20)
+        sport: Optional sport slug(s) to filter on
+        leagues: Optional league slug(s) to filter on
+        status: Optional ``"prematch"`` or ``"live"``
+        url: Feed URL (default: wss://api.odds-api.io/v3/ws)
+        heartbeat: Seconds between pings; the connection is considered dead
+            if no pong arrives within half that time (default: 30)
+        receive_timeout: Seconds without any frame after which the
+            connection is re-established (default: None, disabled)
+        reconnect_policy: Backoff between reconnects (default: up to 10
+            attempts in a row, 1s base delay, 30s cap)
+        reconnect: If False, the stream ends when the connection closes
+            (default: True)
+        queue_size: Maximum parsed messages buffered for the consumer
+            (default: 10000)
+        json_decoder: ``"orjson"``, ``"msgspec"``, ``"json"`` or a callable;
+            by default the fastest installed decoder is used
+        session: Optional ``aiohttp.ClientSession`` to connect with; it is
+            not closed by ``close()``
+
+    Example:
+        >>> feed = OddsStream(api_key, markets="ML,Totals", sport="football")
+        >>> async with feed:
+        ...     async for message in feed:
+        ...         if message.type == "updated":
+        ...             print(message.id, message.bookie, message.markets)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        markets: Filter,
+        sport: Filter = None,
+        leagues: Filter = None,
+        status: Optional[str] = None,
+        url: str = WS_API_URL,
+        heartbeat: Optional[float] = 30.0,
+        receive_timeout: Optional[float] = None,
+        reconnect_policy: Optional[RetryPolicy] = None,
+        reconnect: bool = True,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        if not api_key:
+            raise ValueError("API key is required")
+        if not markets:
+            raise ValueError("At least one market is required")
+
+        self.api_key = api_key
+        self.markets = _join(markets)
+        self.sport = _join(sport)
+        self.leagues = _join(leagues)
+        self.status = status
+        self.url = url
+        self.heartbeat = heartbeat
+        self.receive_timeout = receive_timeout
+        self.reconnect_policy = reconnect_policy or RetryPolicy(
+            max_retries=10,
+            base_delay=1.0,
+            max_delay=30.0,
+            max_elapsed=float("inf"),
+        )
+        self.reconnect = reconnect
+        self.json_decoder = get_decoder(json_decoder)
+        self.welcome: Optional[Dict[str, Any]] = None
+        self.connected = False
+
+        self.queue_size = queue_size
+        # Created in ``start`` so it binds to the running loop on Python 3.8/3.9
+        self._queue: "asyncio.Queue[Any]" = None  # type: ignore[assignment]
+        self._stats = StreamStats()
+        self._session = session
+        self._owns_session = session is None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._error: Optional[BaseException] = None
+        self._opened = False
+
+    def build_url(self) -> str:
+        """Return the feed URL with the subscription filters encoded."""
+        params = {"apiKey": self.api_key, "markets": self.markets}
+        if self.sport:
+            params["sport"] = self.sport
+        if self.leagues:
+            params["leagues"] = self.leagues
+        if self.status:
+            params["status"] = self.status
+        return f"{self.url}?{urlencode(params)}"
+
+    @property
+    def stats(self) -> StreamStats:
+        """Message, reconnect and queue depth counters."""
+        self._stats.queue_depth = self._queue.qsize() if self._queue else 0
+        return self._stats
+
+    async def start(self) -> None:
+        """Connect in the background; iterating starts the stream implicitly."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def close(self) -> None:
+        """Stop reading and close the connection."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "OddsStream":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    def __aiter__(self) -> "OddsStream":
+        return self
+
+    async def __anext__(self) -> StreamMessage:
+        if self._task is None:
+            await self.start()
+        assert self._task is not None
+        if self._queue.empty() and self._task.done():
+            self._finish()
+        item = await self._queue.get()
+        if item is _END:
+            self._finish()
+        return item
+
+    def _finish(self) -> None:
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+    async def _run(self) -> None:
+        """Read the socket, reconnecting per the policy, until stopped."""
+        policy = self.reconnect_policy
+        attempt = 0
+        started = time.monotonic()
+        try:
+            while True:
+                self._opened = False
+                try:
+                    await self._read_connection()
+                    error: Optional[BaseException] = None
+                except aiohttp.WSServerHandshakeError as e:
+                    if e.status == 401:
+                        self._error = InvalidAPIKeyError("Invalid API key")
+                        return
+                    error = e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+                except Exception as e:
+                    # Not a connection problem (e.g. a failing decoder):
+                    # reconnecting would not help, so end the stream with it
+                    self._error = OddsAPIError(f"WebSocket feed failed: {e!r}")
+                    self._error.__cause__ = e
+                    return
+                finally:
+                    self.connected = False
+
+                if not self.reconnect:
+                    if error is not None:
+                        self._error = OddsAPIError(f"WebSocket error: {error}")
+                    return
+
+                if self._opened:
+                    attempt = 0
+                    started = time.monotonic()
+                delay = policy.get_delay(attempt, time.monotonic() - started)
+                if delay is None:
+                    reason = error or "connection closed"
+                    self._error = OddsAPIError(
+                        f"WebSocket reconnect attempts exhausted: {reason}"
+                    )
+                    return
+                attempt += 1
+                self._stats.reconnects += 1
+                await asyncio.sleep(delay)
+        finally:
+            # A full queue is drained first; the consumer then sees the
+            # finished task instead of the marker
+            if not self._queue.full():
+                self._queue.put_nowait(_END)
+
+    async def _read_connection(self) -> None:
+        assert self._session is not None
+        async with self._session.ws_connect(
+            self.build_url(),
+            heartbeat=self.heartbeat,
+            receive_timeout=self.receive_timeout,
+        ) as ws:
+            self._opened = True
+            self.connected = True
+            async for msg in ws:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    await self._dispatch(msg.data)
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    raise aiohttp.ClientError(ws.exception() or "WebSocket error")
+
+    async def _dispatch(self, frame: Union[str, bytes]) -> None:
+        """Decode every JSON document of a frame and enqueue the messages."""
+        decode = self.json_decoder
+        stats = self._stats
+        for line in frame.splitlines():
+            if not line.strip():
+                continue
+            try:
+                data = decode(line)
+            except ValueError:
+                stats.decode_errors += 1
+                continue
+            if not isinstance(data, dict):
+                stats.decode_errors += 1
+                continue
+
+            message = StreamMessage.from_dict(data)
+            if message.type == WELCOME:
+                self.welcome = data
+            stats.messages += 1
+            await self._queue.put(message)
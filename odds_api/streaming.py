@@ -0,0 +1,106 @@
+"""Incremental parsing of large JSON array responses."""
+
+import codecs
+import json
+from typing import Any, List
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+# Parser states
+_START, _VALUE_OR_END, _VALUE, _COMMA_OR_END, _DONE = range(5)
+
+
+class JSONArrayParser:
+    """
+    Push parser yielding the elements of a top-level JSON array.
+
+    Feed it raw body chunks as they arrive; each call returns the elements
+    completed so far. Only the current, incomplete element is buffered, so
+    memory stays flat regardless of the array's length.
+
+    Example:
+        >>> parser = JSONArrayParser()
+        >>> parser.feed(b'[{"id": 1}, {"id"')
+        [{'id': 1}]
+        >>> parser.feed(b': 2}]')
+        [{'id': 2}]
+        >>> parser.close()
+        []
+    """
+
+    def __init__(self) -> None:
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = _START
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Consume a chunk of the body and return any completed elements."""
+        self._buffer += self._utf8.decode(data)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body and return the remaining elements.
+
+        Raises:
+            ValueError: If the body was not a complete JSON array.
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON array")
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        end = len(buffer)
+
+        while True:
+            while pos < end and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == end:
+                break
+
+            char = buffer[pos]
+            state = self._state
+            if state == _START:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._state = _VALUE_OR_END
+                pos += 1
+            elif state == _COMMA_OR_END or (state == _VALUE_OR_END and char == "]"):
+                if char == "]":
+                    self._state = _DONE
+                    pos += 1
+                elif char == ",":
+                    self._state = _VALUE
+                    pos += 1
+                else:
+                    raise ValueError(f"Unexpected character {char!r} in JSON array")
+            elif state == _DONE:
+                raise ValueError("Unexpected data after JSON array")
+            else:
+                try:
+                    item, item_end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A bare number or literal may continue in the next chunk
+                # (e.g. "-1500" + ".0"), so wait until a delimiter follows it
+                if (
+                    not final
+                    and not isinstance(item, (dict, list, str))
+                    and (item_end == end or buffer[item_end] not in _DELIMITERS)
+                ):
+                    break
+                items.append(item)
+                self._state = _COMMA_OR_END
+                pos = item_end
+
+        self._buffer = buffer[pos:]
+        return items
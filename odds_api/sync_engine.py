@@ -0,0 +1,294 @@
+"""Delta synchronisation of odds via the updated-since endpoint."""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .constants import DEFAULT_MAX_CONCURRENCY
+from .utils import markets_timestamp, parse_timestamp
+
+Pair = Tuple[str, str]
+ChangeCallback = Callable[[str, str, List[Dict[str, Any]]], None]
+
+# How far back the first poll of a pair looks when no cursor is stored
+DEFAULT_INITIAL_LOOKBACK = 60
+
+# Seconds subtracted from the cursor so consecutive windows overlap
+DEFAULT_OVERLAP = 5
+
+
+class CursorStore:
+    """
+    In-memory store of the ``since`` cursor per (bookmaker, sport) pair.
+
+    Subclass and override ``get``/``set`` to persist cursors elsewhere.
+    """
+
+    def __init__(self) -> None:
+        self._cursors: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(bookmaker: str, sport: str) -> str:
+        return f"{bookmaker}:{sport}"
+
+    def get(self, bookmaker: str, sport: str) -> Optional[float]:
+        """Return the stored cursor for a pair, if any."""
+        with self._lock:
+            return self._cursors.get(self._key(bookmaker, sport))
+
+    def set(self, bookmaker: str, sport: str, cursor: float) -> None:
+        """Store the cursor for a pair."""
+        with self._lock:
+            self._cursors[self._key(bookmaker, sport)] = cursor
+
+
+class FileCursorStore(CursorStore):
+    """
+    Cursor store persisted to a JSON file.
+
+    The file is rewritten atomically on every update, so a restarted
+    process resumes polling where the previous one stopped.
+
+    Args:
+        path: JSON file holding the cursors
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._cursors = {k: float(v) for k, v in json.load(f).items()}
+        except FileNotFoundError:
+            pass
+
+    def set(self, bookmaker: str, sport: str, cursor: float) -> None:
+        with self._lock:
+            self._cursors[self._key(bookmaker, sport)] = cursor
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._cursors, f)
+            os.replace(tmp, self.path)
+
+
+class _SyncEngineBase:
+    """State and merge logic shared by the sync and async engines."""
+
+    def __init__(
+        self,
+        client: Any,
+        pairs: Sequence[Pair],
+        cursor_store: Optional[CursorStore] = None,
+        interval: float = 5.0,
+        overlap: float = DEFAULT_OVERLAP,
+        initial_lookback: float = DEFAULT_INITIAL_LOOKBACK,
+        on_change: Optional[ChangeCallback] = None,
+    ):
+        if getattr(client, "return_models", False):
+            raise ValueError("OddsSyncEngine requires a client returning dicts")
+
+        self.client = client
+        self.pairs = list(pairs)
+        self.cursor_store = cursor_store or CursorStore()
+        self.interval = interval
+        self.overlap = overlap
+        self.initial_lookback = initial_lookback
+        self.on_change = on_change
+
+        # {event_id: {bookmaker: [market, ...]}}
+        self.snapshot: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        # {event_id: event fields other than bookmakers}
+        self.events: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def _since(self, bookmaker: str, sport: str) -> int:
+        cursor = self.cursor_store.get(bookmaker, sport)
+        if cursor is None:
+            return int(time.time() - self.initial_lookback)
+        return int(cursor - self.overlap)
+
+    def _merge(self, pair: Pair, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Merge a delta into the snapshot and advance the pair's cursor.
+
+        Entries are versioned by their ``updatedAt`` timestamps, so items
+        seen again because of the window overlap are skipped. The cursor only
+        moves forward and only to timestamps reported by the server, which
+        keeps polling independent of the local clock.
+        """
+        bookmaker, sport = pair
+        changed = []
+        latest = None
+        with self._lock:
+            for item in items:
+                event_id = str(item.get("id", ""))
+                if not event_id:
+                    continue
+                meta = {k: v for k, v in item.items() if k != "bookmakers"}
+                self.events.setdefault(event_id, {}).update(meta)
+                item_ts = parse_timestamp(item.get("updatedAt", item.get("timestamp")))
+
+                for bookie, markets in (item.get("bookmakers") or {}).items():
+                    markets = markets if isinstance(markets, list) else []
+                    ts = markets_timestamp(markets) or item_ts
+                    if ts is not None and (latest is None or ts > latest):
+                        latest = ts
+
+                    version_key = (event_id, bookie)
+                    previous = self._versions.get(version_key)
+                    if ts is not None and previous is not None and ts <= previous:
+                        continue
+                    if ts is not None:
+                        self._versions[version_key] = ts
+
+                    books = self.snapshot.setdefault(event_id, {})
+                    if markets:
+                        books[bookie] = markets
+                    else:
+                        books.pop(bookie, None)
+                    changed.append((event_id, bookie, markets))
+
+        if latest is not None:
+            current = self.cursor_store.get(bookmaker, sport)
+            if current is None or latest > current:
+                self.cursor_store.set(bookmaker, sport, latest)
+
+        if self.on_change is not None:
+            for event_id, bookie, markets in changed:
+                self.on_change(event_id, bookie, markets)
+        return len(changed)
+
+    def get(self, event_id: Any) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the current ``{bookmaker: [market, ...]}`` for an event."""
+        return self.snapshot.get(str(event_id), {})
+
+
+class OddsSyncEngine(_SyncEngineBase):
+    """
+    Keeps an in-memory odds snapshot current by polling only deltas.
+
+    Each (bookmaker, sport) pair is polled through
+    ``get_updated_odds_since_timestamp`` with its own cursor, kept in a
+    ``CursorStore`` (use ``FileCursorStore`` to survive restarts).
+    Consecutive windows overlap by ``overlap`` seconds so no update is lost
+    to clock skew or late writes. Duplicates are detected by timestamp and
+    merged idempotently.
+
+    Args:
+        client: An ``OddsAPIClient`` returning dicts
+        pairs: ``(bookmaker, sport)`` pairs to keep in sync
+        cursor_store: Where cursors are kept (default: in memory)
+        interval: Seconds between polls in ``run`` (default: 5)
+        overlap: Seconds each window overlaps the previous one (default: 5)
+        initial_lookback: How far back the first poll of a pair without a
+            stored cursor reaches, in seconds (default: 60)
+        on_change: Optional callback ``(event_id, bookmaker, markets)``
+            called for every changed entry; empty markets mean removal
+
+    Example:
+        >>> engine = OddsSyncEngine(
+        ...     client,
+        ...     pairs=[("Bet365", "football"), ("SingBet", "football")],
+        ...     cursor_store=FileCursorStore("cursors.json"),
+        ... )
+        >>> engine.poll_once()
+        42
+        >>> engine.get(12345)["Bet365"]
+    """
+
+    def poll_pair(self, bookmaker: str, sport: str) -> int:
+        """Poll one pair and merge its delta; returns the number of changes."""
+        since = self._since(bookmaker, sport)
+        items = self.client.get_updated_odds_since_timestamp(
+            since=since, bookmaker=bookmaker, sport=sport
+        )
+        return self._merge((bookmaker, sport), items or [])
+
+    def poll_once(self) -> int:
+        """Poll every pair once; returns the total number of changes."""
+        return sum(self.poll_pair(bookmaker, sport) for bookmaker, sport in self.pairs)
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        """Poll every ``interval`` seconds until ``stop`` is set."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            started = time.monotonic()
+            self.poll_once()
+            stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+
+class AsyncOddsSyncEngine(_SyncEngineBase):
+    """
+    Asynchronous ``OddsSyncEngine`` for ``AsyncOddsAPIClient``.
+
+    All (bookmaker, sport) pairs are polled concurrently, at most
+    ``max_concurrency`` at a time.
+
+    Args:
+        client: An ``AsyncOddsAPIClient`` returning dicts
+        pairs: ``(bookmaker, sport)`` pairs to keep in sync
+        max_concurrency: Maximum pairs polled at once (default: 8)
+        **kwargs: Same options as ``OddsSyncEngine``
+
+    Example:
+        >>> engine = AsyncOddsSyncEngine(client, pairs=pairs)
+        >>> await engine.poll_once()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        pairs: Sequence[Pair],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs: Any,
+    ):
+        super().__init__(client, pairs, **kwargs)
+        self.max_concurrency = max_concurrency
+
+    async def poll_pair(self, bookmaker: str, sport: str) -> int:
+        """Poll one pair and merge its delta; returns the number of changes."""
+        since = self._since(bookmaker, sport)
+        items = await self.client.get_updated_odds_since_timestamp(
+            since=since, bookmaker=bookmaker, sport=sport
+        )
+        return self._merge((bookmaker, sport), items or [])
+
+    async def poll_once(self) -> int:
+        """Poll every pair concurrently; returns the total number of changes."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def poll(pair: Pair) -> int:
+            async with semaphore:
+                return await self.poll_pair(*pair)
+
+        results = await asyncio.gather(*[poll(pair) for pair in self.pairs])
+        return sum(results)
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Poll every ``interval`` seconds until ``stop`` is set."""
+        stop = stop or asyncio.Event()
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            started = loop.time()
+            await self.poll_once()
+            delay = max(0.0, self.interval - (loop.time() - started))
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,337 @@
+"""Compact ring-buffer history of odds movements."""
+
+import time
+from array import array
+from bisect import bisect_right
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .book import QuoteKey
+from .models import _LINE_KEYS, _to_float
+from .stream import CREATED, UPDATED, StreamMessage
+from .utils import parse_timestamp
+
+Tick = Tuple[float, float]
+
+# Default number of ticks kept per series
+DEFAULT_CAPACITY = 1024
+
+# Movement fields that are neither prices nor outcome names
+_MOVEMENT_KEYS = frozenset({"timestamp", "updatedAt", "time", "hdp", "label", "max"})
+
+
+def market_prices(
+    markets: Iterable[Dict[str, Any]], timestamp: Optional[float] = None
+) -> Iterator[Tuple[str, Optional[float], str, Optional[float], float]]:
+    """
+    Yield ``(market, hdp, outcome, timestamp, price)`` for API-format markets
+    (``{"name", "updatedAt", "odds"}``).
+
+    Each market's ``updatedAt`` is used as the timestamp, falling back to
+    ``timestamp``.
+    """
+    for market in markets:
+        name = market.get("name", "")
+        ts = parse_timestamp(market.get("updatedAt"))
+        if ts is None:
+            ts = timestamp
+        for line in market.get("odds") or []:
+            hdp = _to_float(line.get("hdp"))
+            for outcome, value in line.items():
+                if outcome in _LINE_KEYS:
+                    continue
+                price = _to_float(value)
+                if price is not None:
+                    yield name, hdp, outcome, ts, price
+
+
+def movement_prices(
+    movements: Any, outcome: Optional[str] = None
+) -> List[Tuple[float, str, float]]:
+    """
+    Return ``(timestamp, outcome, price)`` for a ``get_odds_movement``
+    response, oldest first.
+
+    Each movement needs a ``timestamp`` and its prices either under
+    ``odds`` (a mapping of outcome to price) or as outcome keys of the
+    movement itself; a bare ``price`` is reported for ``outcome``.
+    """
+    if isinstance(movements, dict):
+        movements = movements.get("movements", movements.get("history", []))
+
+    ticks: List[Tuple[float, str, float]] = []
+    for movement in movements or []:
+        ts = parse_timestamp(movement.get("timestamp", movement.get("updatedAt")))
+        if ts is None:
+            continue
+        prices = movement.get("odds")
+        if isinstance(prices, list):
+            prices = prices[0] if prices else {}
+        if not isinstance(prices, dict):
+            prices = movement
+        if "price" in prices and outcome is not None:
+            prices = {outcome: prices["price"]}
+        for name, value in prices.items():
+            if name in _MOVEMENT_KEYS or name == "price":
+                continue
+            price = _to_float(value)
+            if price is not None:
+                ticks.append((ts, name, price))
+    ticks.sort(key=lambda tick: tick[0])
+    return ticks
+
+
+class _Series:
+    """
+    Ring buffer of (timestamp, price) ticks in two ``array('d')`` columns.
+
+    The arrays grow up to ``capacity`` and are then overwritten oldest
+    first; ``start`` is the physical index of the oldest tick.
+    """
+
+    __slots__ = ("times", "prices", "start", "capacity")
+
+    def __init__(self, capacity: int):
+        self.times = array("d")
+        self.prices = array("d")
+        self.start = 0
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def _physical(self, i: int) -> int:
+        return (self.start + i) % len(self.times)
+
+    def last(self) -> Optional[Tick]:
+        if not self.times:
+            return None
+        i = self._physical(len(self.times) - 1)
+        return self.times[i], self.prices[i]
+
+    def append(self, timestamp: float, price: float) -> None:
+        """Append a tick, overwriting the oldest one when full."""
+        if len(self.times) < self.capacity:
+            self.times.append(timestamp)
+            self.prices.append(price)
+        else:
+            self.times[self.start] = timestamp
+            self.prices[self.start] = price
+            self.start = (self.start + 1) % self.capacity
+
+    def tick(self, i: int) -> Tick:
+        p = self._physical(i)
+        return self.times[p], self.prices[p]
+
+    def count_until(self, timestamp: float) -> int:
+        """Number of ticks at or before ``timestamp`` (a logical index)."""
+        times, start, n = self.times, self.start, len(self.times)
+        if start == 0:
+            return bisect_right(times, timestamp)
+        # Older ticks live in [start, n), newer ones in [0, start)
+        if timestamp < times[0]:
+            return bisect_right(times, timestamp, start, n) - start
+        return (n - start) + bisect_right(times, timestamp, 0, start)
+
+
+class OddsHistory:
+    """
+    Bounded price history per (event, bookmaker, market, hdp, outcome).
+
+    Each series is a ring buffer of (timestamp, price) ticks stored in two
+    float arrays: 16 bytes per tick, with no per-tick objects. Only price
+    changes are recorded, so repeated full-market updates from the feed
+    do not fill the buffers. When a series is full the oldest tick is
+    overwritten. Ticks older than a series' latest tick are dropped.
+
+    Args:
+        capacity: Maximum ticks kept per series (default: 1024)
+
+    Example:
+        >>> history = OddsHistory(capacity=4096)
+        >>> async for message in feed:
+        ...     history.ingest_message(message)
+        >>> key = ("12345", "Bet365", "ML", None, "home")
+        >>> history.last(key, 10)
+        >>> history.price_at(key, time.time() - 3600)
+        >>> history.max_move(key, window=300)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.dropped = 0
+        self._series: Dict[QuoteKey, _Series] = {}
+        self._by_event: Dict[str, Set[QuoteKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._series
+
+    @property
+    def ticks(self) -> int:
+        """Total number of ticks held."""
+        return sum(len(series) for series in self._series.values())
+
+    def keys(self, event_id: Any = None) -> List[QuoteKey]:
+        """Return the keys of all series, or of one event's series."""
+        if event_id is None:
+            return list(self._series)
+        return list(self._by_event.get(str(event_id), ()))
+
+    # Ingestion
+
+    def append(self, key: QuoteKey, timestamp: float, price: float) -> bool:
+        """
+        Record a price for a series.
+
+        Returns:
+            True if a tick was added, False if the price was unchanged or
+            the tick older than the series' latest one
+        """
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self.capacity)
+            self._by_event.setdefault(key[0], set()).add(key)
+        elif series.times:
+            last = series._physical(len(series.times) - 1)
+            if timestamp < series.times[last]:
+                self.dropped += 1
+                return False
+            if price == series.prices[last]:
+                return False
+        series.append(timestamp, price)
+        return True
+
+    def ingest_markets(
+        self,
+        event_id: Any,
+        bookmaker: str,
+        markets: Iterable[Dict[str, Any]],
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """
+        Record the prices of API-format markets (``{"name", "odds", ...}``).
+
+        Each market's ``updatedAt`` is used as the tick time, falling back
+        to ``timestamp`` and then to the current time.
+
+        Returns:
+            Number of ticks added
+        """
+        event_id = str(event_id)
+        now = time.time()
+        added = 0
+        for name, hdp, outcome, ts, price in market_prices(markets, timestamp):
+            key = (event_id, bookmaker, name, hdp, outcome)
+            added += self.append(key, now if ts is None else ts, price)
+        return added
+
+    def ingest_message(self, message: Union[StreamMessage, Dict[str, Any]]) -> int:
+        """Record the prices of a ``created``/``updated`` feed message."""
+        if isinstance(message, dict):
+            message = StreamMessage.from_dict(message)
+        if message.type not in (CREATED, UPDATED) or message.id is None:
+            return 0
+        return self.ingest_markets(
+            message.id, message.bookie or "", message.markets, message.timestamp
+        )
+
+    def ingest_movements(
+        self,
+        event_id: Any,
+        bookmaker: str,
+        market: str,
+        movements: Any,
+        hdp: Optional[float] = None,
+        outcome: Optional[str] = None,
+    ) -> int:
+        """
+        Record a ``get_odds_movement`` response (see ``movement_prices``).
+
+        Example:
+            >>> movements = client.get_odds_movement(
+            ...     event_id="12345", bookmaker="Bet365", market="ML"
+            ... )
+            >>> history.ingest_movements("12345", "Bet365", "ML", movements)
+        """
+        event_id = str(event_id)
+        hdp = _to_float(hdp)
+        added = 0
+        for ts, name, price in movement_prices(movements, outcome):
+            added += self.append((event_id, bookmaker, market, hdp, name), ts, price)
+        return added
+
+    def remove_event(self, event_id: Any) -> None:
+        """Drop every series of an event, e.g. once it has finished."""
+        for key in self._by_event.pop(str(event_id), ()):
+            del self._series[key]
+
+    # Queries
+
+    def last(self, key: QuoteKey, n: int = 1) -> List[Tick]:
+        """Return the latest ``n`` ticks of a series, oldest first."""
+        series = self._series.get(key)
+        if series is None:
+            return []
+        size = len(series)
+        return [series.tick(i) for i in range(max(0, size - n), size)]
+
+    def price_at(self, key: QuoteKey, timestamp: float) -> Optional[float]:
+        """
+        Return the price in effect at ``timestamp``.
+
+        None if the series is unknown or starts after ``timestamp``.
+        """
+        series = self._series.get(key)
+        if series is None:
+            return None
+        i = series.count_until(timestamp)
+        return series.tick(i - 1)[1] if i else None
+
+    def window(
+        self, key: QuoteKey, start: float, end: Optional[float] = None
+    ) -> List[Tick]:
+        """
+        Return the ticks between ``start`` and ``end`` (default: latest),
+        preceded by the tick in effect at ``start`` if there is one.
+        """
+        series = self._series.get(key)
+        if series is None:
+            return []
+        first = max(0, series.count_until(start) - 1)
+        last = len(series) if end is None else series.count_until(end)
+        return [series.tick(i) for i in range(first, last)]
+
+    def max_move(
+        self, key: QuoteKey, window: float, now: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Return the largest price range (highest minus lowest price) seen
+        in the last ``window`` seconds before ``now``.
+
+        ``now`` defaults to the series' latest tick. None if the series
+        has no price in the window.
+        """
+        series = self._series.get(key)
+        if series is None or not len(series):
+            return None
+        if now is None:
+            now = series.last()[0]  # type: ignore[index]
+        ticks = self.window(key, now - window, now)
+        if not ticks:
+            return None
+        prices = [price for _, price in ticks]
+        return max(prices) - min(prices)
@@ -0,0 +1,320 @@
+"""Incremental tracking of the best arbitrage and value opportunities."""
+
+import bisect
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .arbitrage import DEFAULT_MARKETS, _event_model
+from .book import Group, OddsBook, QuoteKey
+from .models import ArbitrageBet, ArbitrageLeg, ValueBet
+from .stream import StreamMessage
+from .value import DEVIG_METHODS, devig
+
+Opportunity = Union[ArbitrageBet, ValueBet]
+Callback = Callable[[Opportunity], None]
+# {bookmaker: {outcome: price}} of one group
+GroupPrices = Dict[str, Dict[str, float]]
+
+# Ranking updates larger than this are applied with a full sort
+_BULK_THRESHOLD = 1000
+
+
+class _Ranking:
+    """
+    Keys ordered by score, best first.
+
+    Small batches of changes are applied with binary-search inserts; large
+    ones (e.g. a full rescan) with a single sort.
+    """
+
+    def __init__(self) -> None:
+        self._order: List[Tuple[float, int]] = []
+        self._entries: Dict[Hashable, Tuple[float, int, Any]] = {}
+        self._keys: Dict[int, Hashable] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(
+        self,
+        changed: Dict[Hashable, Tuple[float, Any]],
+        removed: Iterable[Hashable] = (),
+    ) -> None:
+        """Set the (score, data) of ``changed`` keys and drop ``removed`` ones."""
+        bulk = len(changed) > _BULK_THRESHOLD
+        for key in itertools.chain(removed, changed):
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                continue
+            del self._keys[entry[1]]
+            if not bulk:
+                score, seq, _ = entry
+                del self._order[bisect.bisect_left(self._order, (-score, seq))]
+
+        for key, (score, data) in changed.items():
+            seq = next(self._counter)
+            self._entries[key] = (score, seq, data)
+            self._keys[seq] = key
+            if not bulk:
+                bisect.insort(self._order, (-score, seq))
+
+        if bulk:
+            self._order = sorted(
+                (-score, seq) for score, seq, _ in self._entries.values()
+            )
+
+    def top(self, n: int) -> List[Tuple[Hashable, float, Any]]:
+        """Return the ``n`` best ``(key, score, data)`` entries."""
+        result = []
+        for _, seq in self._order[:n]:
+            key = self._keys[seq]
+            score, _, data = self._entries[key]
+            result.append((key, score, data))
+        return result
+
+
+class OpportunityTracker:
+    """
+    Keeps the top-N arbitrage and value opportunities of an ``OddsBook``
+    current as updates arrive.
+
+    ``apply`` feeds a message to the book and re-evaluates only the
+    (event, market, line) groups it changed, so the cost of an update
+    depends on its size, not on the size of the book. Opportunities are
+    kept ranked by profit (arbitrage) or expected value (value bets);
+    ``on_enter`` is called when one joins a top-N list and ``on_exit``
+    when it leaves it.
+
+    Args:
+        book: The odds book to track
+        top_n: Size of each top list (default: 50)
+        markets: Market names to consider (default: ML, Spread, Totals);
+            None tracks every market
+        min_profit: Minimum arbitrage profit in percent (default: 0)
+        sharp: Bookmaker defining the fair line for value bets; None
+            disables value tracking (default). Value tracking requires
+            NumPy.
+        method: De-vig method for value bets (default: multiplicative)
+        min_edge: Minimum expected value in percent (default: 0)
+        on_enter: Optional callback receiving an ``ArbitrageBet`` or
+            ``ValueBet`` that entered a top list
+        on_exit: Optional callback receiving one that left a top list
+
+    Example:
+        >>> tracker = OpportunityTracker(
+        ...     book, top_n=20, sharp="SingBet",
+        ...     on_enter=lambda o: print("+", o), on_exit=lambda o: print("-", o),
+        ... )
+        >>> tracker.rescan()
+        >>> async for message in feed:
+        ...     tracker.apply(message)
+    """
+
+    def __init__(
+        self,
+        book: OddsBook,
+        top_n: int = 50,
+        markets: Optional[Iterable[str]] = DEFAULT_MARKETS,
+        min_profit: float = 0.0,
+        sharp: Optional[str] = None,
+        method: str = "multiplicative",
+        min_edge: float = 0.0,
+        on_enter: Optional[Callback] = None,
+        on_exit: Optional[Callback] = None,
+    ):
+        if method not in DEVIG_METHODS:
+            raise ValueError(f"Unknown de-vig method: {method!r}")
+        self.book = book
+        self.top_n = top_n
+        self.markets = frozenset(markets) if markets is not None else None
+        self.min_profit = min_profit
+        self.sharp = sharp
+        self.method = method
+        self.min_edge = min_edge
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+
+        self._arbitrage = _Ranking()
+        self._value = _Ranking()
+        self._value_keys: Dict[Group, Set[QuoteKey]] = {}
+
+    def top_arbitrage(self) -> List[ArbitrageBet]:
+        """Return the current top arbitrage opportunities, best first."""
+        return [self._arbitrage_model(*e) for e in self._arbitrage.top(self.top_n)]
+
+    def top_value(self) -> List[ValueBet]:
+        """Return the current top value bets, best first."""
+        return [self._value_model(*e) for e in self._value.top(self.top_n)]
+
+    def apply(self, message: Union[StreamMessage, Dict[str, Any]]) -> None:
+        """Apply a feed message to the book and update the rankings."""
+        self.update(self.book.apply(message))
+
+    def load(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Load a REST odds response into the book and update the rankings."""
+        self.update(self.book.load(events))
+
+    def rescan(self) -> None:
+        """
+        Re-evaluate every group in the book.
+
+        This costs time proportional to the book's size; call it once after
+        loading a snapshot and let ``apply`` keep the rankings current.
+        """
+        self.update(self.book.groups())
+
+    def update(self, groups: Iterable[Group]) -> None:
+        """Re-evaluate ``groups`` (as returned by ``OddsBook.apply``)."""
+        if self.markets is not None:
+            groups = [g for g in groups if g[1] in self.markets]
+        else:
+            groups = list(groups)
+        if not groups:
+            return
+
+        prices = {group: self._prices(group) for group in groups}
+
+        before = self._arbitrage.top(self.top_n)
+        self._update_arbitrage(prices)
+        self._notify(before, self._arbitrage.top(self.top_n), self._arbitrage_model)
+
+        if self.sharp is not None:
+            before = self._value.top(self.top_n)
+            self._update_value(prices)
+            self._notify(before, self._value.top(self.top_n), self._value_model)
+
+    def _notify(
+        self,
+        before: List[Tuple[Hashable, float, Any]],
+        after: List[Tuple[Hashable, float, Any]],
+        model: Callable[..., Opportunity],
+    ) -> None:
+        old = {entry[0] for entry in before}
+        new = {entry[0] for entry in after}
+        if self.on_exit is not None:
+            for entry in before:
+                if entry[0] not in new:
+                    self.on_exit(model(*entry))
+        if self.on_enter is not None:
+            for entry in after:
+                if entry[0] not in old:
+                    self.on_enter(model(*entry))
+
+    def _arbitrage_model(
+        self, group: Group, profit: float, legs: Tuple[Tuple[str, str, float], ...]
+    ) -> ArbitrageBet:
+        event_id, market, hdp = group
+        return ArbitrageBet(
+            None,
+            market,
+            hdp,
+            profit,
+            [ArbitrageLeg(b, outcome, price) for outcome, b, price in legs],
+            _event_model(self.book, event_id),
+        )
+
+    def _value_model(
+        self, key: QuoteKey, edge: float, data: Tuple[float, float]
+    ) -> ValueBet:
+        event_id, bookmaker, market, hdp, outcome = key
+        price, p = data
+        return ValueBet(
+            None,
+            bookmaker,
+            market,
+            hdp,
+            outcome,
+            price,
+            edge,
+            _event_model(self.book, event_id),
+            {"fairProbability": p, "fairPrice": 1.0 / p},
+        )
+
+    def _prices(self, group: Group) -> GroupPrices:
+        """Return ``{bookmaker: {outcome: price}}`` for one group."""
+        book = self.book
+        prices = book.prices
+        by_bookmaker: GroupPrices = {}
+        for slot in book.group_slots(group):
+            key = book.key(slot)
+            price = prices[slot]
+            if key is not None and price > 1.0:
+                by_bookmaker.setdefault(key[1], {})[key[4]] = price
+        return by_bookmaker
+
+    def _update_arbitrage(self, groups: Dict[Group, GroupPrices]) -> None:
+        threshold = 1.0 / (1.0 + self.min_profit / 100.0)
+        changed: Dict[Hashable, Tuple[float, Any]] = {}
+        removed = []
+        for group, by_bookmaker in groups.items():
+            best: Dict[str, Tuple[float, str]] = {}
+            for bookmaker, prices in by_bookmaker.items():
+                for outcome, price in prices.items():
+                    current = best.get(outcome)
+                    if current is None or price > current[0]:
+                        best[outcome] = (price, bookmaker)
+
+            total = sum(1.0 / price for price, _ in best.values())
+            if not self.book.is_complete(group, best) or not 0 < total < threshold:
+                removed.append(group)
+                continue
+            legs = tuple(
+                (outcome, bookmaker, price)
+                for outcome, (price, bookmaker) in sorted(best.items())
+            )
+            changed[group] = ((1.0 / total - 1.0) * 100.0, legs)
+        self._arbitrage.update(changed, removed)
+
+    def _update_value(self, groups: Dict[Group, GroupPrices]) -> None:
+        # De-vig the sharp prices of every changed group in one batch
+        rows: List[Tuple[Group, List[str], GroupPrices]] = []
+        matrix: List[List[float]] = []
+        removed: List[Hashable] = []
+        for group, by_bookmaker in groups.items():
+            others = dict(by_bookmaker)
+            sharp = others.pop(self.sharp, {})  # type: ignore[arg-type]
+            if not self.book.is_complete(group, sharp):
+                removed.extend(self._value_keys.pop(group, ()))
+                continue
+            outcomes = sorted(sharp)
+            rows.append((group, outcomes, others))
+            matrix.append([sharp[o] for o in outcomes])
+
+        fair: List[List[float]] = []
+        if rows:
+            width = max(len(row) for row in matrix)
+            padded = [row + [0.0] * (width - len(row)) for row in matrix]
+            fair = devig(padded, self.method).tolist()
+
+        changed: Dict[Hashable, Tuple[float, Any]] = {}
+        for (group, outcomes, others), probabilities in zip(rows, fair):
+            event_id, market, hdp = group
+            found: Set[QuoteKey] = set()
+            for bookmaker, prices in others.items():
+                for outcome, p in zip(outcomes, probabilities):
+                    price = prices.get(outcome)
+                    if price is None or p <= 0:
+                        continue
+                    edge = (price * p - 1.0) * 100.0
+                    if edge > self.min_edge:
+                        key = (event_id, bookmaker, market, hdp, outcome)
+                        changed[key] = (edge, (price, p))
+                        found.add(key)
+            removed.extend(self._value_keys.get(group, set()) - found)
+            if found:
+                self._value_keys[group] = found
+            else:
+                self._value_keys.pop(group, None)
+        self._value.update(changed, removed)
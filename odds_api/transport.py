@@ -0,0 +1,641 @@
+"""HTTP transports used by the clients to talk to the API.
+
+The clients build URLs, apply rate limiting and retries, and decode
+responses; a transport only sends a request and returns a ``Response``.
+``RequestsTransport`` and ``AiohttpTransport`` are the defaults.
+``HTTPXTransport`` and ``AsyncHTTPXTransport`` use HTTP/2, multiplexing
+concurrent requests over a few connections, and require httpx:
+``pip install odds-api-io[http2]``.
+"""
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+import aiohttp
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .constants import DEFAULT_TIMEOUT, STREAM_CHUNK_SIZE
+from .exceptions import TransportError
+from .pool import PoolConfig
+
+Params = Optional[Dict[str, Any]]
+Headers = Optional[Dict[str, str]]
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            "httpx is required for the HTTP/2 transport: "
+            "pip install odds-api-io[http2]"
+        )
+
+
+class Response:
+    """
+    A transport-independent HTTP response.
+
+    ``body`` holds the full body, except for streamed responses, whose
+    body is read from ``chunks`` (an iterator, or an async iterator for
+    async transports). Streamed responses must be closed with ``close``
+    (sync) or ``aclose`` (async). ``ttfb`` is the time in seconds from
+    sending the request to receiving the headers and ``transfer`` the time
+    reading the body (0 for streamed responses).
+    """
+
+    __slots__ = ("status", "headers", "body", "chunks", "ttfb", "transfer", "_close")
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes = b"",
+        chunks: Union[Iterator[bytes], AsyncIterator[bytes], None] = None,
+        close: Optional[Callable[[], Any]] = None,
+        ttfb: float = 0.0,
+        transfer: float = 0.0,
+    ):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.chunks = chunks
+        self.ttfb = ttfb
+        self.transfer = transfer
+        self._close = close
+
+    def __repr__(self) -> str:
+        return f"Response(status={self.status}, size={len(self.body)})"
+
+    @property
+    def ok(self) -> bool:
+        """True for 2xx responses."""
+        return 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        """The body decoded as UTF-8."""
+        return self.body.decode("utf-8", errors="replace")
+
+    def read(self) -> bytes:
+        """Read the rest of a streamed response of a sync transport."""
+        if self.chunks is not None:
+            self.body += b"".join(self.chunks)  # type: ignore[arg-type]
+            self.chunks = None
+        return self.body
+
+    async def aread(self) -> bytes:
+        """Read the rest of a streamed response of an async transport."""
+        if self.chunks is not None:
+            chunks = [chunk async for chunk in self.chunks]  # type: ignore[union-attr]
+            self.body += b"".join(chunks)
+            self.chunks = None
+        return self.body
+
+    def close(self) -> None:
+        """Release a streamed response of a sync transport."""
+        if self._close is not None:
+            self._close()
+
+    async def aclose(self) -> None:
+        """Release a streamed response of an async transport."""
+        if self._close is not None:
+            result = self._close()
+            if asyncio.iscoroutine(result):
+                await result
+
+
+class Transport(ABC):
+    """
+    Base class of the transports of ``OddsAPIClient``.
+
+    Subclasses implement ``request``, ``prewarm`` and ``close``, and raise
+    ``TransportError`` for connection failures and timeouts.
+
+    Args:
+        timeout: Request timeout in seconds (default: 10)
+        pool: Connection pool settings (default: ``PoolConfig()``)
+    """
+
+    def __init__(
+        self, timeout: float = DEFAULT_TIMEOUT, pool: Optional[PoolConfig] = None
+    ):
+        self.timeout = timeout
+        self.pool = pool or PoolConfig()
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Headers = None,
+        stream: bool = False,
+    ) -> Response:
+        """Send a request; with ``stream=True`` the body is left unread."""
+
+    @abstractmethod
+    def prewarm(self, url: str, count: int) -> int:
+        """Open up to ``count`` connections to ``url``'s host."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close all connections."""
+
+    def _prewarm(self, head: Callable[[], None], count: int) -> int:
+        """Run ``count`` concurrent HEAD requests; returns the successes."""
+        if count <= 0:
+            return 0
+
+        def connect(_: int) -> bool:
+            try:
+                head()
+            except TransportError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return sum(executor.map(connect, range(count)))
+
+
+class AsyncTransport(ABC):
+    """
+    Base class of the transports of ``AsyncOddsAPIClient``.
+
+    Subclasses implement ``request``, ``prewarm`` and ``close`` as
+    coroutines, and raise ``TransportError`` for connection failures and
+    timeouts.
+
+    Args:
+        timeout: Request timeout in seconds (default: 10)
+        pool: Connection pool settings (default: ``PoolConfig()``)
+    """
+
+    def __init__(
+        self, timeout: float = DEFAULT_TIMEOUT, pool: Optional[PoolConfig] = None
+    ):
+        self.timeout = timeout
+        self.pool = pool or PoolConfig()
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Headers = None,
+        stream: bool = False,
+    ) -> Response:
+        """Send a request; with ``stream=True`` the body is left unread."""
+
+    @abstractmethod
+    async def prewarm(self, url: str, count: int) -> int:
+        """Open up to ``count`` connections to ``url``'s host."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close all connections."""
+
+    async def _prewarm(self, head: Callable[[], Any], count: int) -> int:
+        """Run ``count`` concurrent HEAD requests; returns the successes."""
+        if count <= 0:
+            return 0
+
+        async def connect() -> bool:
+            try:
+                await head()
+            except TransportError:
+                return False
+            return True
+
+        results = await asyncio.gather(*[connect() for _ in range(count)])
+        return sum(results)
+
+
+class RequestsTransport(Transport):
+    """
+    HTTP/1.1 transport on a ``requests.Session`` (the sync default).
+
+    At most ``pool.max_per_host`` requests are in flight at once (a
+    streamed response counts until it is closed); further requests wait up
+    to ``pool.acquire_timeout`` for one to finish.
+
+    Args:
+        timeout: Request timeout in seconds (default: 10)
+        pool: Connection pool settings (default: ``PoolConfig()``)
+        session: Optional session to use instead of a new one
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool: Optional[PoolConfig] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(timeout, pool)
+        self.session = session or requests.Session()
+        self.pool.mount(self.session)
+        per_host = self.pool.per_host
+        self._slots = threading.BoundedSemaphore(per_host) if per_host else None
+
+    def _acquire(self) -> Callable[[], None]:
+        """Wait for a connection slot; returns a callable releasing it once."""
+        slots = self._slots
+        if slots is None:
+            return lambda: None
+        timeout = self.pool.acquire_timeout
+        if timeout is None:
+            timeout = self.timeout
+        if not slots.acquire(timeout=timeout):
+            raise TransportError(
+                f"No connection free within {timeout}s "
+                f"(max_per_host={self.pool.per_host})"
+            )
+        released = threading.Lock()
+
+        def release() -> None:
+            if released.acquire(blocking=False):
+                slots.release()
+
+        return release
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Headers = None,
+        stream: bool = False,
+    ) -> Response:
+        release = self._acquire()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream,
+            )
+        except BaseException as e:
+            release()
+            if isinstance(e, requests.RequestException):
+                raise TransportError(str(e)) from e
+            raise
+        elapsed = time.perf_counter() - started
+        if stream:
+
+            def close() -> None:
+                try:
+                    response.close()
+                finally:
+                    release()
+
+            return Response(
+                response.status_code,
+                response.headers,
+                chunks=self._chunks(response),
+                close=close,
+                ttfb=elapsed,
+            )
+        release()
+        # ``elapsed`` of a requests response stops when the headers are parsed
+        ttfb = min(response.elapsed.total_seconds(), elapsed)
+        return Response(
+            response.status_code,
+            response.headers,
+            response.content,
+            ttfb=ttfb,
+            transfer=elapsed - ttfb,
+        )
+
+    @staticmethod
+    def _chunks(response: requests.Response) -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(STREAM_CHUNK_SIZE)
+        except requests.RequestException as e:
+            raise TransportError(str(e)) from e
+
+    def prewarm(self, url: str, count: int) -> int:
+        def head() -> None:
+            release = self._acquire()
+            try:
+                self.session.head(url, timeout=self.timeout).close()
+            except requests.RequestException as e:
+                raise TransportError(str(e)) from e
+            finally:
+                release()
+
+        return self._prewarm(head, count)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    HTTP/2 transport on an ``httpx.Client``.
+
+    Concurrent requests from several threads share a few multiplexed
+    connections instead of opening one connection each.
+
+    Args:
+        timeout: Request timeout in seconds (default: 10)
+        pool: Connection pool settings (default: ``PoolConfig()``)
+        http2: Negotiate HTTP/2 (default: True); False uses HTTP/1.1
+
+    Example:
+        >>> client = OddsAPIClient(api_key="your_api_key", transport=HTTPXTransport())
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool: Optional[PoolConfig] = None,
+        http2: bool = True,
+    ):
+        _require_httpx()
+        super().__init__(timeout, pool)
+        self.client = httpx.Client(
+            http2=http2,
+            timeout=_httpx_timeout(timeout, self.pool),
+            limits=_httpx_limits(self.pool),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Headers = None,
+        stream: bool = False,
+    ) -> Response:
+        request = self.client.build_request(method, url, params=params, headers=headers)
+        started = time.perf_counter()
+        try:
+            response = self.client.send(request, stream=True)
+            ttfb = time.perf_counter() - started
+            if not stream:
+                try:
+                    body = response.read()
+                finally:
+                    response.close()
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+        if stream:
+            return Response(
+                response.status_code,
+                response.headers,
+                chunks=self._chunks(response),
+                close=response.close,
+                ttfb=ttfb,
+            )
+        return Response(
+            response.status_code,
+            response.headers,
+            body,
+            ttfb=ttfb,
+            transfer=time.perf_counter() - started - ttfb,
+        )
+
+    @staticmethod
+    def _chunks(response: "httpx.Response") -> Iterator[bytes]:
+        try:
+            yield from response.iter_bytes(STREAM_CHUNK_SIZE)
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+
+    def prewarm(self, url: str, count: int) -> int:
+        def head() -> None:
+            try:
+                self.client.head(url)
+            except httpx.HTTPError as e:
+                raise TransportError(str(e)) from e
+
+        return self._prewarm(head, count)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    HTTP/1.1 transport on an ``aiohttp.ClientSession`` (the async default).
+
+    The session is created on first use, inside the running event loop.
+
+    Args:
+        timeout: Request timeout in seconds (default: 10)
+        pool: Connection pool settings (default: ``PoolConfig()``)
+    """
+
+    def __init__(
+        self, timeout: float = DEFAULT_TIMEOUT, pool: Optional[PoolConfig] = None
+    ):
+        super().__init__(timeout, pool)
+        # aiohttp's ``connect`` timeout covers waiting for a free connection
+        acquire = self.pool.acquire_timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout, connect=acquire)
+        # Streamed bodies may take longer than ``timeout`` in total, so only
+        # connecting and each individual read are bounded
+        self._stream_timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=acquire if acquire is not None else timeout,
+            sock_connect=timeout,
+            sock_read=timeout,
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout, connector=self.pool.connector()
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Headers = None,
+        stream: bool = False,
+    ) -> Response:
+        started = time.perf_counter()
+        try:
+            response = await self.session.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=self._stream_timeout if stream else self._timeout,
+            )
+            ttfb = time.perf_counter() - started
+            if not stream:
+                try:
+                    body = await response.read()
+                finally:
+                    response.release()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+        if stream:
+            return Response(
+                response.status,
+                response.headers,
+                chunks=self._chunks(response),
+                close=response.release,
+                ttfb=ttfb,
+            )
+        return Response(
+            response.status,
+            response.headers,
+            body,
+            ttfb=ttfb,
+            transfer=time.perf_counter() - started - ttfb,
+        )
+
+    @staticmethod
+    async def _chunks(response: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                yield chunk
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+
+    async def prewarm(self, url: str, count: int) -> int:
+        async def head() -> None:
+            try:
+                async with self.session.head(url) as response:
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise TransportError(str(e) or type(e).__name__) from e
+
+        return await self._prewarm(head, count)
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
+class AsyncHTTPXTransport(AsyncTransport):
+    """
+    HTTP/2 transport on an ``httpx.AsyncClient``.
+
+    Concurrent requests share a few multiplexed connections instead of
+    opening one connection each.
+
+    Args:
+        timeout: Request timeout in seconds (default: 10)
+        pool: Connection pool settings (default: ``PoolConfig()``)
+        http2: Negotiate HTTP/2 (default: True); False uses HTTP/1.1
+
+    Example:
+        >>> async with AsyncOddsAPIClient(
+        ...     api_key="your_api_key", transport=AsyncHTTPXTransport()
+        ... ) as client:
+        ...     odds = await client.get_odds_for_multiple_events(ids, "Bet365")
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool: Optional[PoolConfig] = None,
+        http2: bool = True,
+    ):
+        _require_httpx()
+        super().__init__(timeout, pool)
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            timeout=_httpx_timeout(timeout, self.pool),
+            limits=_httpx_limits(self.pool),
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Headers = None,
+        stream: bool = False,
+    ) -> Response:
+        request = self.client.build_request(method, url, params=params, headers=headers)
+        started = time.perf_counter()
+        try:
+            response = await self.client.send(request, stream=True)
+            ttfb = time.perf_counter() - started
+            if not stream:
+                try:
+                    body = await response.aread()
+                finally:
+                    await response.aclose()
+        except httpx.HTTPError as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+        if stream:
+            return Response(
+                response.status_code,
+                response.headers,
+                chunks=self._chunks(response),
+                close=response.aclose,
+                ttfb=ttfb,
+            )
+        return Response(
+            response.status_code,
+            response.headers,
+            body,
+            ttfb=ttfb,
+            transfer=time.perf_counter() - started - ttfb,
+        )
+
+    @staticmethod
+    async def _chunks(response: "httpx.Response") -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+        except httpx.HTTPError as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+
+    async def prewarm(self, url: str, count: int) -> int:
+        async def head() -> None:
+            try:
+                await self.client.head(url)
+            except httpx.HTTPError as e:
+                raise TransportError(str(e) or type(e).__name__) from e
+
+        return await self._prewarm(head, count)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def _httpx_limits(pool: PoolConfig) -> "httpx.Limits":
+    # httpx has no per-host limit; every request goes to the API host, so
+    # the per-host limit bounds the whole pool
+    return httpx.Limits(
+        max_connections=pool.per_host or None,
+        max_keepalive_connections=pool.per_host or None,
+        keepalive_expiry=pool.keepalive_timeout,
+    )
+
+
+def _httpx_timeout(timeout: float, pool: PoolConfig) -> "httpx.Timeout":
+    acquire = pool.acquire_timeout
+    return httpx.Timeout(timeout, pool=timeout if acquire is None else acquire)
@@ -0,0 +1,124 @@
+"""Internal helpers shared by the sync and async clients."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+EventIds = Union[str, int, Iterable[Union[str, int]]]
+T = TypeVar("T")
+
+
+def normalize_ids(ids: EventIds) -> List[str]:
+    """
+    Normalize IDs given as a comma-separated string, a single ID or any
+    iterable of IDs into a de-duplicated list of strings, preserving order.
+    """
+    if isinstance(ids, str):
+        items: Iterable[Union[str, int]] = ids.split(",")
+    elif isinstance(ids, int):
+        items = [ids]
+    else:
+        items = ids
+
+    seen = set()
+    result = []
+    for item in items:
+        value = str(item).strip()
+        if value and value not in seen:
+            seen.add(value)
+            result.append(value)
+    return result
+
+
+def chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield successive slices of ``items`` holding at most ``size`` elements."""
+    if size < 1:
+        raise ValueError("chunk size must be >= 1")
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> List[T]:
+    """
+    Await ``aws`` concurrently, like ``asyncio.gather``.
+
+    If one fails, or the caller is cancelled, the others are cancelled and
+    awaited before the exception propagates, so no request outlives the
+    call.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+RequestKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def request_key(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    path_params: Optional[Dict[str, Any]] = None,
+) -> RequestKey:
+    """
+    Build a hashable key identifying a request by its resolved path and its
+    query parameters, independent of parameter order. The API key is ignored.
+    """
+    path = endpoint.format(**path_params) if path_params else endpoint
+    items = tuple(
+        sorted((k, str(v)) for k, v in (params or {}).items() if k != "apiKey")
+    )
+    return path, items
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """
+    Convert an API timestamp to Unix seconds.
+
+    Accepts Unix seconds or milliseconds as numbers or numeric strings, and
+    ISO 8601 strings (UTC unless an offset is given).
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        seconds = float(value)
+    elif isinstance(value, str):
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            return when.timestamp()
+    else:
+        return None
+    # Values this large are milliseconds
+    return seconds / 1000.0 if seconds > 1e11 else seconds
+
+
+def markets_timestamp(markets: Iterable[Dict[str, Any]]) -> Optional[float]:
+    """Return the latest ``updatedAt`` of a list of markets as Unix seconds."""
+    latest = None
+    for market in markets:
+        ts = parse_timestamp(market.get("updatedAt"))
+        if ts is not None and (latest is None or ts > latest):
+            latest = ts
+    return latest
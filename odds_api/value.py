@@ -0,0 +1,241 @@
+"""Local value-bet detection against de-vigged sharp prices.
+
+Requires NumPy: ``pip install odds-api-io[analytics]``.
+"""
+
+from typing import Any, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .arbitrage import (
+    DEFAULT_MARKETS,
+    _codes,
+    _complete,
+    _event_model,
+    _rank,
+    _require_numpy,
+)
+from .book import OddsBook
+from .models import ValueBet
+
+DEVIG_METHODS = ("multiplicative", "power", "shin")
+
+# Iteration limits of the power and Shin solvers
+_POWER_ITERATIONS = 50
+_SHIN_ITERATIONS = 50
+
+
+def _power(implied: Any, offered: Any) -> Any:
+    """Solve ``sum(q ** k) == 1`` for ``k`` per row with Newton's method."""
+    log_q = np.log(implied, out=np.zeros_like(implied), where=offered)
+    k = np.ones((implied.shape[0], 1))
+    for _ in range(_POWER_ITERATIONS):
+        q_k = np.where(offered, np.exp(k * log_q), 0.0)
+        f = q_k.sum(axis=1, keepdims=True) - 1.0
+        slope = (q_k * log_q).sum(axis=1, keepdims=True)
+        step = np.divide(f, slope, out=np.zeros_like(f), where=slope != 0)
+        k -= step
+        if np.abs(step).max() < 1e-12:
+            break
+    return np.where(offered, np.exp(k * log_q), 0.0)
+
+
+def _shin(implied: Any) -> Any:
+    """
+    Shin's model: solve for the insider share ``z`` per row with Newton's
+    method.
+
+    Rows without an overround (implied sum <= 1) have no solution and fall
+    back to ``z = 0``, i.e. the multiplicative method.
+    """
+    total = implied.sum(axis=1, keepdims=True)
+    scaled = np.divide(implied**2, total, out=np.zeros_like(implied), where=total > 0)
+
+    # Outcomes not offered have ``scaled == 0`` and so a probability of 0
+    def probabilities(z: Any) -> Any:
+        root = np.sqrt(z * z + 4.0 * (1.0 - z) * scaled)
+        return (root - z) / (2.0 * (1.0 - z)), root
+
+    z = np.zeros_like(total)
+    for _ in range(_SHIN_ITERATIONS):
+        p, root = probabilities(z)
+        f = p.sum(axis=1, keepdims=True) - 1.0
+        d_root = np.divide(
+            z - 2.0 * scaled, root, out=np.ones_like(root), where=root > 0
+        )
+        d_p = ((d_root - 1.0) * (1.0 - z) + (root - z)) / (2.0 * (1.0 - z) ** 2)
+        slope = d_p.sum(axis=1, keepdims=True)
+        step = np.divide(f, slope, out=np.zeros_like(f), where=slope != 0)
+        moved = np.clip(z - step, 0.0, 0.999)
+        converged = np.abs(moved - z).max() < 1e-12
+        z = moved
+        if converged:
+            break
+    return probabilities(np.where(total > 1.0, z, 0.0))[0]
+
+
+def devig(prices: Any, method: str = "multiplicative") -> Any:
+    """
+    Remove the bookmaker margin from rows of decimal prices.
+
+    Args:
+        prices: 2-D array, one market per row and one outcome per column;
+            0 or NaN marks an outcome that is not offered
+        method: ``"multiplicative"`` (implied probabilities rescaled to
+            sum to 1), ``"power"`` (``q ** k`` with ``k`` solved per row,
+            shifting margin towards longshots) or ``"shin"`` (Shin's
+            insider-trading model)
+
+    Returns:
+        Array of fair probabilities of the same shape, 0 where not offered;
+        every row with an offered outcome sums to 1
+
+    Example:
+        >>> devig([[1.90, 1.90, 0.0], [2.80, 3.30, 2.60]], method="power")
+        array([[0.5       , 0.5       , 0.        ],
+               [0.3421..., 0.2883..., 0.3696...]])
+    """
+    _require_numpy()
+    if method not in DEVIG_METHODS:
+        raise ValueError(f"Unknown de-vig method: {method!r}")
+
+    prices = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+    offered = prices > 0
+    implied = np.divide(1.0, prices, out=np.zeros_like(prices), where=offered)
+
+    if method == "power":
+        fair = _power(implied, offered)
+    elif method == "shin":
+        fair = _shin(implied)
+    else:
+        fair = implied
+    total = fair.sum(axis=1, keepdims=True)
+    return np.divide(fair, total, out=np.zeros_like(fair), where=total > 0)
+
+
+class ValueScanner:
+    """
+    Finds prices beating a sharp bookmaker's fair line in an ``OddsBook``.
+
+    The sharp bookmaker's prices for every (event, market, line) group are
+    de-vigged in one batch with ``devig``. Every other bookmaker's price
+    is then compared with the fair probability ``p`` of its outcome: the
+    expected value of a unit stake is ``price * p - 1``. All steps are
+    NumPy operations over the book's columnar storage.
+
+    Args:
+        book: The odds book to scan
+        sharp: Bookmaker whose prices define the fair line
+            (default: SingBet)
+        method: De-vig method, see ``devig`` (default: multiplicative)
+        markets: Market names to consider (default: ML, Spread, Totals);
+            None scans every market
+        bookmakers: Optional bookmakers to report value for (default: all
+            but the sharp one)
+        min_edge: Minimum expected value in percent (default: 0)
+
+    Example:
+        >>> scanner = ValueScanner(book, sharp="SingBet", method="shin")
+        >>> for bet in scanner.scan(top=20):
+        ...     print(bet.bookmaker, bet.market, bet.outcome, bet.price,
+        ...           f"{bet.expected_value:.2f}%")
+    """
+
+    def __init__(
+        self,
+        book: OddsBook,
+        sharp: str = "SingBet",
+        method: str = "multiplicative",
+        markets: Optional[Iterable[str]] = DEFAULT_MARKETS,
+        bookmakers: Optional[Iterable[str]] = None,
+        min_edge: float = 0.0,
+    ):
+        _require_numpy()
+        if method not in DEVIG_METHODS:
+            raise ValueError(f"Unknown de-vig method: {method!r}")
+        self.book = book
+        self.sharp = sharp
+        self.method = method
+        self.markets = tuple(markets) if markets is not None else None
+        self.bookmakers = tuple(bookmakers) if bookmakers is not None else None
+        self.min_edge = min_edge
+
+    def scan(self, top: Optional[int] = None) -> List[ValueBet]:
+        """
+        Scan the book and return value bets, highest expected value first.
+
+        Args:
+            top: Return at most this many bets (default: all)
+
+        Returns:
+            ``ValueBet`` models with ``expected_value`` in percent; ``extra``
+            holds the sharp ``fairProbability`` and ``fairPrice``
+        """
+        columns = self.book.columns()
+        if self.sharp not in columns.bookmaker_names:
+            return []
+        sharp_code = columns.bookmaker_names.index(self.sharp)
+        n_groups = len(columns.group_keys)
+        n_outcomes = len(columns.outcome_names)
+
+        prices = np.frombuffer(columns.prices, dtype=np.float64)
+        groups = np.frombuffer(columns.groups, dtype=np.intc)
+        outcomes = np.frombuffer(columns.outcomes, dtype=np.intc)
+        bookmakers = np.frombuffer(columns.bookmakers, dtype=np.intc)
+
+        valid = (groups >= 0) & (prices > 1.0)
+        if self.markets is not None:
+            group_markets = np.frombuffer(columns.group_markets, dtype=np.intc)
+            allowed = np.isin(group_markets, _codes(columns.market_names, self.markets))
+            valid &= allowed[np.maximum(groups, 0)]
+
+        # Fair probabilities of every group the sharp book prices completely
+        is_sharp = valid & (bookmakers == sharp_code)
+        sharp_prices = np.zeros((n_groups, n_outcomes))
+        sharp_prices[groups[is_sharp], outcomes[is_sharp]] = prices[is_sharp]
+        rows = np.flatnonzero(_complete(columns, sharp_prices > 0))
+        fair = np.zeros_like(sharp_prices)
+        if len(rows):
+            fair[rows] = devig(sharp_prices[rows], self.method)
+
+        others = valid & ~is_sharp
+        if self.bookmakers is not None:
+            others &= np.isin(
+                bookmakers, _codes(columns.bookmaker_names, self.bookmakers)
+            )
+        index = np.flatnonzero(others)
+        probability = fair[groups[index], outcomes[index]]
+        edge = (prices[index] * probability - 1.0) * 100.0
+        keep = (probability > 0) & (edge > self.min_edge)
+        index, probability, edge = index[keep], probability[keep], edge[keep]
+
+        order = _rank(edge, top)
+
+        results = []
+        events = {}
+        for i in order.tolist():
+            slot = int(index[i])
+            key = self.book.key(slot)
+            assert key is not None
+            event_id, bookmaker, market, hdp, outcome = key
+            event = events.get(event_id)
+            if event is None:
+                event = events[event_id] = _event_model(self.book, event_id)
+            p = float(probability[i])
+            results.append(
+                ValueBet(
+                    None,
+                    bookmaker,
+                    market,
+                    hdp,
+                    outcome,
+                    float(prices[slot]),
+                    float(edge[i]),
+                    event,
+                    {"fairProbability": p, "fairPrice": 1.0 / p},
+                )
+            )
+        return results
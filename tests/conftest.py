@@ -0,0 +1,110 @@
+"""Shared fixtures: a local HTTP server standing in for the API."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+Reply = Tuple[int, Dict[str, str], Any]
+
+
+class Request:
+    """One request received by the fake API."""
+
+    def __init__(self, method: str, path: str, query: str, headers: Any):
+        self.method = method
+        self.path = path
+        self.params = {k: v[0] for k, v in parse_qs(query).items()}
+        self.headers = headers
+
+
+class FakeAPI:
+    """
+    Threaded HTTP server answering like the API.
+
+    Replies are taken from ``replies`` in order, then from ``handler`` if
+    set, else ``default``. Bodies that are not bytes are sent as JSON.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Request] = []
+        self.replies: List[Reply] = []
+        self.handler: Optional[Callable[[Request], Reply]] = None
+        self.default: Reply = (200, {}, [])
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_one(self) -> None:
+                url = urlparse(self.path)
+                request = Request(self.command, url.path, url.query, self.headers)
+                with api._lock:
+                    api.requests.append(request)
+                    api.active += 1
+                    api.peak = max(api.peak, api.active)
+                try:
+                    status, headers, body = api.reply(request)
+                finally:
+                    with api._lock:
+                        api.active -= 1
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if "Content-Type" not in headers:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_PUT = do_HEAD = handle_one
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        # Clients that cancel requests close connections mid-reply
+        self.server.handle_error = lambda request, address: None  # type: ignore
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v3"
+        self.connections = 0
+
+        serve = self.server.process_request
+
+        def process_request(request: Any, address: Any) -> None:
+            with self._lock:
+                self.connections += 1
+            serve(request, address)
+
+        self.server.process_request = process_request  # type: ignore[assignment]
+
+    def reply(self, request: Request) -> Reply:
+        with self._lock:
+            if self.replies:
+                return self.replies.pop(0)
+        if self.handler is not None:
+            return self.handler(request)
+        return self.default
+
+    def paths(self) -> List[str]:
+        return [request.path for request in self.requests]
+
+
+@pytest.fixture
+def api():
+    fake = FakeAPI()
+    thread = threading.Thread(target=fake.server.serve_forever, daemon=True)
+    thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
@@ -0,0 +1,53 @@
+"""Tests for the vectorized ArbitrageScanner."""
+
+import pytest
+
+from odds_api.book import OddsBook
+
+pytest.importorskip("numpy")
+
+from odds_api.arbitrage import ArbitrageScanner  # noqa: E402
+
+
+def moneyline(**prices):
+    return [{"name": "ML", "odds": [prices]}]
+
+
+@pytest.fixture
+def book():
+    book = OddsBook()
+    # Stream events carry no sport: 2-way and 3-way markets share the book
+    book.replace("tennis", "A", moneyline(home="2.10", away="1.80"), 1)
+    book.replace("tennis", "B", moneyline(home="1.80", away="2.10"), 1)
+    book.replace("football", "A", moneyline(home="2.50", away="3.00"), 1)
+    book.replace("football", "B", moneyline(home="2.00", draw="3.00", away="2.80"), 1)
+    return book
+
+
+def test_reports_two_way_arbitrage_next_to_three_way_markets(book):
+    (arb,) = ArbitrageScanner(book).scan()
+    assert arb.event.id == "tennis"
+    assert arb.profit_percentage == pytest.approx(5.0)
+    assert {(leg.outcome, leg.bookmaker, leg.price) for leg in arb.legs} == {
+        ("home", "A", 2.10),
+        ("away", "B", 2.10),
+    }
+
+
+def test_skips_three_way_market_missing_the_draw(book):
+    # Home at 2.50 and away at 3.00 alone would be a 27% arbitrage
+    assert ArbitrageScanner(book, bookmakers=["A"]).scan() == []
+
+
+def test_reports_complete_three_way_arbitrage(book):
+    book.replace("football", "C", moneyline(home="3.50", draw="3.80", away="3.10"), 1)
+    arbs = {arb.event.id: arb for arb in ArbitrageScanner(book).scan()}
+    assert set(arbs) == {"football", "tennis"}
+    legs = {leg.outcome: leg.bookmaker for leg in arbs["football"].legs}
+    assert legs == {"home": "C", "draw": "C", "away": "C"}
+    assert ArbitrageScanner(book).scan(top=1)[0].event.id == "football"
+
+
+def test_min_profit_and_market_filters(book):
+    assert ArbitrageScanner(book, min_profit=6.0).scan() == []
+    assert ArbitrageScanner(book, markets=["Totals"]).scan() == []
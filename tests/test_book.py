@@ -0,0 +1,132 @@
+"""Tests for OddsBook."""
+
+from odds_api.book import OddsBook
+
+
+def moneyline(**prices):
+    return [{"name": "ML", "odds": [prices]}]
+
+
+def test_completeness_comes_from_each_group():
+    book = OddsBook()
+    book.replace("tennis", "A", moneyline(home="2.10", away="1.80"))
+    book.replace("football", "A", moneyline(home="2.50", away="3.00"))
+    book.replace("football", "B", moneyline(home="2.00", draw="3.0", away="2.8"))
+
+    tennis, football = ("tennis", "ML", None), ("football", "ML", None)
+    assert book.required_outcomes(tennis) == {"home", "away"}
+    assert book.required_outcomes(football) == {"home", "draw", "away"}
+    assert book.is_complete(tennis, ["home", "away"])
+    assert not book.is_complete(tennis, ["home"])
+    assert not book.is_complete(football, ["home", "away"])
+    assert book.is_complete(football, ["home", "draw", "away"])
+
+    # Once no bookmaker prices the draw, the market is 2-way again
+    book.replace("football", "B", [])
+    assert book.required_outcomes(football) == {"home", "away"}
+
+
+def spread(hdp, home, away, updated=None):
+    market = {"name": "Spread", "odds": [{"hdp": hdp, "home": home, "away": away}]}
+    if updated is not None:
+        market["updatedAt"] = updated
+    return [market]
+
+
+def test_replace_upserts_and_reports_changed_groups():
+    book = OddsBook()
+    group = ("1", "ML", None)
+    assert book.replace(1, "A", moneyline(home="2.10", away="1.80")) == {group}
+    assert book.price(1, "A", "ML", "home") == 2.10
+    assert book.replace(1, "A", moneyline(home="2.10", away="1.80")) == set()
+
+    # Outcomes left out of a replacement are removed and their slot reused
+    book.replace(1, "A", moneyline(home="2.20"))
+    assert book.price("1", "A", "ML", "away") is None
+    assert len(book) == 1
+    book.replace(1, "B", moneyline(away="1.70"))
+    assert len(book.prices) == 2
+    assert ("1", "B", "ML", None, "away") in book
+
+
+def test_price_normalizes_hdp():
+    book = OddsBook()
+    book.replace(1, "A", spread("-1.5", "1.95", "1.90"))
+    book.replace(1, "A", spread(2, "1.80", "2.05") + spread("-1.5", "1.95", "1.90"))
+    assert book.price(1, "A", "Spread", "home", hdp=-1.5) == 1.95
+    assert book.price(1, "A", "Spread", "home", hdp="2") == 1.80
+    assert book.price(1, "A", "Spread", "home", hdp=2.0) == 1.80
+    assert book.price(1, "A", "Spread", "home") is None
+
+
+def test_older_updates_are_ignored():
+    book = OddsBook()
+    markets = moneyline(home="2.0", away="1.9")
+    book.apply(
+        {"type": "updated", "id": 1, "bookie": "A", "timestamp": 20, "markets": markets}
+    )
+    stale = {
+        "id": 1,
+        "bookmakers": {"A": spread(1, "1.5", "2.5", "1970-01-01T00:00:10Z")},
+    }
+    assert book.load([stale]) == set()
+    assert book.price(1, "A", "ML", "home") == 2.0
+
+    book.apply({"type": "no_markets", "id": 1, "bookie": "A", "timestamp": 30})
+    assert len(book) == 0
+
+
+def test_deleted_event_without_bookmaker_clears_all_prices():
+    book = OddsBook()
+    book.replace(1, "A", moneyline(home="2.0", away="1.9"))
+    book.replace(1, "B", moneyline(home="2.1", away="1.8"))
+    book.replace(2, "A", moneyline(home="3.0", away="1.4"))
+    assert book.apply({"type": "deleted", "id": 1}) == {("1", "ML", None)}
+    assert book.event_ids() == {"2"}
+    assert book.groups() == [("2", "ML", None)]
+
+
+def test_slot_filters():
+    book = OddsBook()
+    book.load(
+        [
+            {
+                "id": 1,
+                "sport": {"name": "Football", "slug": "football"},
+                "league": {"name": "Premier League", "slug": "england-pl"},
+                "bookmakers": {
+                    "A": moneyline(home="2.0", away="1.9") + spread(1, "1.8", "2.0"),
+                    "B": spread(-1, "1.9", "1.9"),
+                },
+            },
+            {
+                "id": 2,
+                "sport": {"name": "Tennis", "slug": "tennis"},
+                "bookmakers": {"A": moneyline(home="1.5", away="2.6")},
+            },
+        ]
+    )
+    assert book.event(1)["league"]["slug"] == "england-pl"
+    assert book.event_ids(sport="football") == {"1"}
+    assert book.event_ids(league="england-pl", sport="tennis") == set()
+
+    def outcomes(**filters):
+        quotes = book.quotes(**filters)
+        return sorted((q.event_id, q.bookmaker, q.hdp, q.outcome) for q in quotes)
+
+    assert outcomes(sport="tennis") == [
+        ("2", "A", None, "away"),
+        ("2", "A", None, "home"),
+    ]
+    assert outcomes(event_id=1, market="Spread", hdp="1") == [
+        ("1", "A", 1.0, "away"),
+        ("1", "A", 1.0, "home"),
+    ]
+    # hdp=None selects lineless markets only
+    assert len(book.slots(event_id=1, hdp=None)) == 2
+    assert len(book.slots(bookmaker="B", league="england-pl")) == 2
+    assert len(book.slots()) == len(book) == 8
+    assert sorted(book.groups("Spread")) == [
+        ("1", "Spread", -1.0),
+        ("1", "Spread", 1.0),
+    ]
@@ -0,0 +1,137 @@
+"""Tests for the REST snapshot to feed hand-off."""
+
+import asyncio
+
+import pytest
+
+from odds_api.book import OddsBook
+from odds_api.bootstrap import bootstrap, replay_order
+from odds_api.exceptions import OddsAPIError
+from odds_api.stream import StreamMessage
+
+T0 = 1767225600  # 2026-01-01T00:00:00Z
+SNAPSHOT_TIME = "2026-01-01T00:00:10Z"
+
+
+class FakeFeed:
+    """Async iterator over messages put on a queue; None ends the feed."""
+
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue" = asyncio.Queue()
+
+    def send(self, message_type, event_id=None, bookie=None, ts=None, **prices):
+        markets = [{"name": "ML", "odds": [prices]}] if prices else []
+        message = {"type": message_type, "id": event_id, "bookie": bookie}
+        message.update(timestamp=ts, markets=markets)
+        self.queue.put_nowait(StreamMessage.from_dict(message))
+
+    def close(self):
+        self.queue.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self.queue.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+def rest_odds(event_id, bookie, home, away):
+    markets = [
+        {
+            "name": "ML",
+            "updatedAt": SNAPSHOT_TIME,
+            "odds": [{"home": home, "away": away}],
+        }
+    ]
+    return {"id": event_id, "bookmakers": {bookie: markets}}
+
+
+def test_replay_order_sorts_by_timestamp_and_keeps_untimed_in_place():
+    def message(name, ts):
+        return StreamMessage(message_type=name, timestamp=ts)
+
+    messages = [message("a", 5), message("b", None), message("c", 3), message("d", 5)]
+    assert [m.type for m in replay_order(messages)] == ["c", "a", "b", "d"]
+
+
+async def test_updates_during_the_snapshot_are_not_lost():
+    feed = FakeFeed()
+    feed.send("welcome")
+
+    async def snapshot():
+        # Published while the REST call is in flight: one newer and one
+        # older than the snapshot, out of order
+        feed.send("updated", "1", "A", T0 + 20, home="2.50", away="1.60")
+        feed.send("updated", "1", "A", T0 + 5, home="1.50", away="2.60")
+        feed.send("updated", "2", "B", T0 + 15, home="3.00", away="1.40")
+        await asyncio.sleep(0.01)
+        return [rest_odds(1, "A", "2.00", "1.80"), rest_odds(2, "C", "1.9", "1.9")]
+
+    book = await bootstrap(feed, snapshot)
+    assert book.price(1, "A", "ML", "home") == 2.50
+    assert book.price(2, "B", "ML", "home") == 3.00
+    assert book.price(2, "C", "ML", "home") == 1.9
+
+
+async def test_snapshot_may_fill_the_book_itself():
+    feed = FakeFeed()
+    feed.send("welcome")
+    book = OddsBook()
+
+    async def snapshot():
+        book.load([rest_odds(1, "A", "2.00", "1.80")])
+        feed.send("deleted", "1", "A", T0 + 20)
+        await asyncio.sleep(0.01)
+        return book
+
+    assert await bootstrap(feed, snapshot, book=book) is book
+    assert len(book) == 0
+
+
+async def test_messages_after_the_handoff_stay_queued():
+    feed = FakeFeed()
+    feed.send("welcome")
+
+    async def snapshot():
+        return []
+
+    book = await bootstrap(feed, snapshot)
+    feed.send("updated", "1", "A", T0, home="2.0", away="1.8")
+    message = await feed.__anext__()
+    assert book.apply(message) == {("1", "ML", None)}
+
+
+async def test_connect_timeout_and_closed_feed():
+    async def snapshot():
+        raise AssertionError("snapshot taken before the feed connected")
+
+    with pytest.raises(OddsAPIError, match="Timed out"):
+        await bootstrap(FakeFeed(), snapshot, connect_timeout=0.05)
+
+    feed = FakeFeed()
+    feed.close()
+    with pytest.raises(OddsAPIError, match="closed"):
+        await bootstrap(feed, snapshot)
+
+
+async def test_feed_failure_during_the_snapshot_is_raised():
+    class BrokenFeed(FakeFeed):
+        async def __anext__(self):
+            message = await super().__anext__()
+            if message.type == "error":
+                raise OddsAPIError("WebSocket feed failed")
+            return message
+
+    feed = BrokenFeed()
+    feed.send("welcome")
+
+    async def snapshot():
+        feed.send("error")
+        await asyncio.sleep(0.01)
+        return []
+
+    with pytest.raises(OddsAPIError, match="feed failed"):
+        await bootstrap(feed, snapshot)
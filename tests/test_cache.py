@@ -0,0 +1,145 @@
+"""Tests for the response caches."""
+
+import sqlite3
+
+import pytest
+
+from odds_api import OddsAPIClient
+from odds_api.cache import BaseCache, ResponseCache, SQLiteCache
+from odds_api.constants import Endpoints
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("odds_api.cache.time", clock)
+    return clock
+
+
+def test_base_cache_is_abstract():
+    with pytest.raises(TypeError):
+        BaseCache()
+
+    class GetOnly(BaseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = ResponseCache()
+    cache.set("key", [1], size=3, ttl=10)
+    assert cache.get("key").value == [1]
+
+    clock.now += 10
+    assert cache.get("key") is None
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.entries) == (1, 1, 0)
+
+
+def test_stale_entries_are_served_inside_the_window(clock):
+    cache = ResponseCache(stale_ttl=5)
+    cache.set("key", [1], size=3, ttl=10)
+    clock.now += 12
+    entry = cache.get("key")
+    assert entry.value == [1] and not entry.is_fresh(clock.now)
+    clock.now += 3
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.set("a", "a", size=10, ttl=60)
+    cache.set("b", "b", size=10, ttl=60)
+    cache.get("a")
+    cache.set("c", "c", size=10, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    cache.set("big", "big", size=95, ttl=60)
+    assert len(cache) == 1
+    assert cache.stats.bytes == 95
+    assert cache.stats.evictions == 3
+
+    cache.set("huge", "huge", size=101, ttl=60)
+    cache.set("uncached", "x", size=1, ttl=0)
+    assert cache.get("huge") is None and cache.get("uncached") is None
+
+
+def test_client_serves_repeated_requests_from_cache(api):
+    api.default = (200, {}, [{"name": "Football", "slug": "football"}])
+    cache = ResponseCache(ttls={Endpoints.GET_EVENTS: 0})
+    with OddsAPIClient(api_key="key", base_url=api.url, cache=cache) as client:
+        assert client.get_sports() == client.get_sports()
+        client.get_events(sport="football")
+        client.get_events(sport="football")
+
+    assert api.paths() == ["/v3/sports", "/v3/events", "/v3/events"]
+    assert cache.stats.hits == 1
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = SQLiteCache(path)
+    first.set(("sports", ()), [{"slug": "football"}], size=20, ttl=60)
+    first.close()
+
+    second = SQLiteCache(path)
+    assert second.get(("sports", ())).value == [{"slug": "football"}]
+    assert (len(second), second.stats.entries, second.stats.bytes) == (1, 1, 20)
+    second.close()
+
+
+def test_sqlite_cache_evicts_without_scanning(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_entries=3, max_bytes=100)
+    statements = []
+    cache._conn.set_trace_callback(statements.append)
+    for i in range(5):
+        cache.set(f"k{i}", i, size=10, ttl=60)
+    cache.set("k4", "replaced", size=30, ttl=60)
+    cache.set("big", "big", size=60, ttl=60)
+
+    assert not [s for s in statements if "COUNT(" in s or "SUM(" in s]
+    assert cache.get("k4").value == "replaced"
+    assert cache.get("k2") is None
+    assert (len(cache), cache.stats.entries, cache.stats.bytes) == (3, 3, 100)
+    assert cache.stats.evictions == 3
+
+    cache.clear()
+    assert (len(cache), cache.stats.bytes) == (0, 0)
+    cache.close()
+
+
+def test_sqlite_cache_counts_existing_rows_at_startup(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+        "size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+        "stale_until REAL NOT NULL, accessed_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO responses VALUES ('\"a\"', '1', 7, 1e12, 1e12, 0)")
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(path)
+    assert (cache.stats.entries, cache.stats.bytes) == (1, 7)
+    cache.close()
+
+
+def test_sqlite_cache_drops_expired_entries(tmp_path, clock):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), stale_ttl=0)
+    cache.set("key", 1, size=5, ttl=10)
+    clock.now += 10
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    cache.close()
@@ -0,0 +1,107 @@
+"""Tests for single-flight coalescing of identical requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.coalesce import AsyncSingleFlight, SingleFlight
+from odds_api.exceptions import NotFoundError
+
+
+def slow(reply):
+    def handler(request):
+        time.sleep(0.2)
+        return reply
+
+    return handler
+
+
+def test_single_flight_shares_result_and_error():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        release.wait()
+        return {"n": len(calls)}
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(flight.do, "key", fn) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+    # Finished calls are forgotten, so the next call runs again
+    assert flight.do("key", lambda: 2) == 2
+
+
+async def test_async_single_flight_survives_a_cancelled_waiter():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", fn))
+    second = asyncio.ensure_future(flight.do("key", fn))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+    assert calls == [1]
+
+
+def test_sync_client_coalesces_identical_gets(api):
+    api.handler = slow((200, {}, [{"slug": "football"}]))
+    with OddsAPIClient(
+        api_key="key", base_url=api.url, coalesce_requests=True
+    ) as client:
+        with ThreadPoolExecutor(5) as pool:
+            results = list(pool.map(lambda _: client.get_sports(), range(5)))
+            leagues = [
+                pool.submit(client.get_leagues, sport)
+                for sport in ("football", "tennis")
+            ]
+            for future in leagues:
+                future.result()
+    assert results == [[{"slug": "football"}]] * 5
+    assert api.paths().count("/v3/sports") == 1
+    assert api.paths().count("/v3/leagues") == 2
+
+
+def test_sync_client_shares_errors(api):
+    api.handler = slow((404, {}, "missing"))
+    with OddsAPIClient(
+        api_key="key", base_url=api.url, coalesce_requests=True
+    ) as client:
+        with ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(client.get_sports) for _ in range(3)]
+            for future in futures:
+                with pytest.raises(NotFoundError):
+                    future.result()
+    assert len(api.requests) == 1
+
+
+async def test_async_client_coalesces_identical_gets(api):
+    api.handler = slow((200, {}, [{"slug": "tennis"}]))
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, coalesce_requests=True
+    ) as client:
+        results = await asyncio.gather(*(client.get_sports() for _ in range(5)))
+        await client.get_sports()
+    assert results == [[{"slug": "tennis"}]] * 5
+    # The second round starts after the first finished and is sent again
+    assert len(api.requests) == 2
@@ -0,0 +1,83 @@
+"""Tests for conditional requests with ETag/Last-Modified validators."""
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.cache import ValidatorStore
+
+ODDS = {"id": 1, "bookmakers": {"Bet365": []}}
+DATE = "Wed, 01 Jan 2026 00:00:00 GMT"
+
+
+def conditional(request):
+    if request.headers.get("If-None-Match") == '"v1"':
+        return 304, {"ETag": '"v1"'}, b""
+    return 200, {"ETag": '"v1"', "Last-Modified": DATE}, ODDS
+
+
+def test_validator_store_is_lru():
+    store = ValidatorStore(max_entries=2)
+    store.update("a", {"ETag": '"a"'}, 1, 10)
+    store.update("b", {"Last-Modified": DATE}, 2, 20)
+    store.get("a")
+    store.update("c", {"ETag": '"c"'}, 3, 30)
+    assert store.get("b") is None
+    assert store.get("a").headers() == {"If-None-Match": '"a"'}
+    assert (store.stats.entries, store.stats.bytes, store.stats.evictions) == (
+        2,
+        40,
+        1,
+    )
+
+    # A response without validators forgets the old ones
+    store.update("a", {}, 4, 10)
+    assert store.get("a") is None
+    assert len(store) == 1
+
+
+def test_sync_client_reuses_body_on_not_modified(api):
+    api.handler = conditional
+    with OddsAPIClient(
+        api_key="key", base_url=api.url, conditional_requests=True
+    ) as client:
+        first = client.get_event_odds(1, "Bet365")
+        second = client.get_event_odds(1, "Bet365")
+        stats = client.validators.stats
+
+    assert first == second == ODDS
+    assert "If-None-Match" not in api.requests[0].headers
+    assert api.requests[1].headers["If-None-Match"] == '"v1"'
+    assert api.requests[1].headers["If-Modified-Since"] == DATE
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_sync_client_sends_no_validators_when_disabled(api):
+    api.handler = conditional
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        client.get_event_odds(1, "Bet365")
+        client.get_event_odds(1, "Bet365")
+        assert client.validators is None
+    assert all("If-None-Match" not in r.headers for r in api.requests)
+
+
+async def test_async_client_reuses_body_on_not_modified(api):
+    api.handler = conditional
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, conditional_requests=True
+    ) as client:
+        first = await client.get_event_odds(1, "Bet365")
+        second = await client.get_event_odds(1, "Bet365")
+        assert client.validators.stats.hits == 1
+
+    assert first == second == ODDS
+    assert api.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_response_without_validators_forgets_them(api):
+    changed = {"id": 1, "bookmakers": {}}
+    api.replies = [(200, {"ETag": '"v0"'}, ODDS), (200, {}, changed)]
+    with OddsAPIClient(
+        api_key="key", base_url=api.url, conditional_requests=True
+    ) as client:
+        client.get_event_odds(1, "Bet365")
+        assert client.get_event_odds(1, "Bet365") == changed
+        assert len(client.validators) == 0
+    assert api.requests[1].headers["If-None-Match"] == '"v0"'
@@ -0,0 +1,60 @@
+"""Tests for the pluggable JSON decoders."""
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.decoders import get_decoder
+from odds_api.exceptions import OddsAPIError
+
+BODY = '{"id": 1, "name": "Kölner Derby", "odds": [1.5, null]}'.encode()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_decoders_agree_and_raise_value_error(name):
+    if name != "json":
+        pytest.importorskip(name)
+    decode = get_decoder(name)
+    assert decode(BODY) == {"id": 1, "name": "Kölner Derby", "odds": [1.5, None]}
+    with pytest.raises(ValueError):
+        decode(b"{not json")
+
+
+def test_resolving_decoders():
+    def custom(data):
+        return data
+
+    assert get_decoder(custom) is custom
+    assert callable(get_decoder())
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+def test_sync_client_decodes_bytes_with_chosen_decoder(api):
+    seen = []
+
+    def decode(data):
+        seen.append(data)
+        return get_decoder("json")(data)
+
+    api.default = (200, {}, [{"slug": "football"}])
+    with OddsAPIClient(api_key="key", base_url=api.url, json_decoder=decode) as c:
+        assert c.get_sports() == [{"slug": "football"}]
+    assert seen == [b'[{"slug": "football"}]']
+
+
+def test_invalid_json_raises_odds_api_error(api):
+    api.default = (200, {}, b"<html>")
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        with pytest.raises(OddsAPIError, match="Invalid JSON"):
+            client.get_sports()
+
+
+async def test_async_client_decodes_bytes_with_chosen_decoder(api):
+    api.default = (200, {}, [{"slug": "tennis"}])
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, json_decoder="json"
+    ) as client:
+        assert await client.get_sports() == [{"slug": "tennis"}]
+        api.default = (200, {}, b"[")
+        with pytest.raises(OddsAPIError, match="Invalid JSON"):
+            await client.get_sports()
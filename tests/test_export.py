@@ -0,0 +1,116 @@
+"""Tests for columnar export of odds to Arrow and Parquet."""
+
+import pytest
+
+from odds_api.export import (
+    OddsWriter,
+    message_rows,
+    movement_rows,
+    odds_rows,
+    schema,
+    to_record_batch,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+ODDS = [
+    {
+        "id": 7,
+        "bookmakers": {
+            "Bet365": [
+                {
+                    "name": "ML",
+                    "updatedAt": "2026-01-01T00:00:00Z",
+                    "odds": [{"home": "2.10", "away": "1.80"}],
+                },
+                {
+                    "name": "Spread",
+                    "updatedAt": "2026-01-01T00:00:01Z",
+                    "odds": [{"hdp": -1.5, "home": "1.95", "away": "1.90"}],
+                },
+            ]
+        },
+    },
+    {"bookmakers": {"Bet365": []}},
+]
+
+EPOCH_MS = 1767225600000
+
+
+def test_odds_rows_flatten_events():
+    rows = list(odds_rows(ODDS))
+    assert rows == [
+        ("7", "Bet365", "ML", None, "home", 2.10, EPOCH_MS / 1000),
+        ("7", "Bet365", "ML", None, "away", 1.80, EPOCH_MS / 1000),
+        ("7", "Bet365", "Spread", -1.5, "home", 1.95, EPOCH_MS / 1000 + 1),
+        ("7", "Bet365", "Spread", -1.5, "away", 1.90, EPOCH_MS / 1000 + 1),
+    ]
+
+
+def test_record_batch_has_export_schema():
+    batch = to_record_batch(odds_rows(ODDS))
+    assert batch.schema == schema()
+    assert batch.num_rows == 4
+    columns = batch.to_pydict()
+    assert columns["line"] == [None, None, -1.5, -1.5]
+    assert columns["price"] == [2.10, 1.80, 1.95, 1.90]
+    stamps = batch.column("ts").cast(pa.int64()).to_pylist()
+    assert stamps == [EPOCH_MS, EPOCH_MS, EPOCH_MS + 1000, EPOCH_MS + 1000]
+
+
+def test_message_rows_skip_other_message_types():
+    messages = [
+        {
+            "type": "updated",
+            "id": 3,
+            "bookie": "Pinnacle",
+            "timestamp": 10,
+            "markets": [{"name": "ML", "odds": [{"home": 2.0, "away": 1.9}]}],
+        },
+        {"type": "deleted", "id": 3, "bookie": "Pinnacle", "timestamp": 11},
+        {"type": "no_markets", "id": 4, "bookie": "Pinnacle", "timestamp": 12},
+    ]
+    assert list(message_rows(messages)) == [
+        ("3", "Pinnacle", "ML", None, "home", 2.0, 10),
+        ("3", "Pinnacle", "ML", None, "away", 1.9, 10),
+    ]
+
+
+def test_movement_rows_are_oldest_first():
+    movements = [
+        {"timestamp": 20, "odds": {"home": 2.2}},
+        {"timestamp": 10, "odds": {"home": 2.0}},
+    ]
+    rows = list(movement_rows(9, "Bet365", "Spread", movements, hdp=1.5))
+    assert rows == [
+        ("9", "Bet365", "Spread", 1.5, "home", 2.0, 10),
+        ("9", "Bet365", "Spread", 1.5, "home", 2.2, 20),
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "ipc", "ipc_stream"])
+def test_writer_round_trip(tmp_path, fmt):
+    path = tmp_path / f"odds.{fmt}"
+    with OddsWriter(str(path), format=fmt, batch_size=3) as writer:
+        writer.write_odds(ODDS)
+        writer.write_odds(ODDS)
+        # Two full batches written so far, two rows still buffered
+        assert writer.rows_written == 6
+    assert writer.rows_written == 8
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        assert pq.ParquetFile(path).num_row_groups == 3
+    elif fmt == "ipc":
+        table = pa.ipc.open_file(path).read_all()
+    else:
+        table = pa.ipc.open_stream(path).read_all()
+    assert table.schema == schema()
+    assert table.column("outcome").to_pylist() == ["home", "away"] * 4
+
+
+def test_writer_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        OddsWriter(str(tmp_path / "odds.csv"), format="csv")
@@ -0,0 +1,60 @@
+"""Tests for chunked, concurrent get_odds_for_multiple_events."""
+
+import asyncio
+import time
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.exceptions import NotFoundError
+
+
+def odds_for(request):
+    ids = request.params["eventIds"].split(",")
+    if ids[0] == "1":
+        # The first chunk answers last; results still follow the input order
+        time.sleep(0.1)
+    return 200, {}, [{"id": int(i), "bookmakers": {}} for i in ids]
+
+
+def test_sync_client_chunks_ids_and_keeps_order(api):
+    api.handler = odds_for
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        odds = client.get_odds_for_multiple_events(range(1, 26), "Bet365")
+
+    assert [event["id"] for event in odds] == list(range(1, 26))
+    assert [len(r.params["eventIds"].split(",")) for r in api.requests] == [
+        10,
+        10,
+        5,
+    ]
+
+
+async def test_async_client_fans_out_chunks_concurrently(api):
+    api.handler = odds_for
+    async with AsyncOddsAPIClient(api_key="key", base_url=api.url) as client:
+        odds = await client.get_odds_for_multiple_events(
+            "1,2,3,3,4,5,6,7", "Bet365", chunk_size=2, max_concurrency=2
+        )
+
+    assert [event["id"] for event in odds] == list(range(1, 8))
+    assert len(api.requests) == 4
+    assert api.peak == 2
+
+
+async def test_async_failure_cancels_chunks_in_flight(api):
+    def reply(request):
+        if request.params["eventIds"].startswith("1,"):
+            return 404, {}, {"error": "Not found"}
+        time.sleep(0.5)
+        return 200, {}, []
+
+    api.handler = reply
+    async with AsyncOddsAPIClient(api_key="key", base_url=api.url) as client:
+        started = time.monotonic()
+        with pytest.raises(NotFoundError):
+            await client.get_odds_for_multiple_events(
+                range(1, 31), "Bet365", max_concurrency=3
+            )
+        assert time.monotonic() - started < 0.4
+        assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,96 @@
+"""Tests for per-request hooks and RequestRecord."""
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.cache import ResponseCache
+from odds_api.exceptions import NotFoundError
+from odds_api.retry import RetryPolicy
+
+FAST = RetryPolicy(max_retries=2, base_delay=0.001, max_delay=0.01)
+SPORTS = [{"name": "Football", "slug": "football"}]
+
+
+class Recorder:
+    def __init__(self):
+        self.started = []
+        self.records = []
+
+    def request_started(self, record):
+        self.started.append(record.endpoint)
+
+    def __call__(self, record):
+        self.records.append(record)
+
+
+def test_record_of_a_retried_request(api):
+    api.replies = [(503, {}, "busy")]
+    api.default = (200, {}, SPORTS)
+    hook = Recorder()
+    with OddsAPIClient(
+        api_key="key", base_url=api.url, retry_policy=FAST, hooks=[hook]
+    ) as client:
+        client.get_leagues("football")
+
+    (record,) = hook.records
+    assert hook.started == ["leagues"]
+    assert (record.method, record.endpoint, record.status) == ("GET", "leagues", 200)
+    assert record.params == {"sport": "football"}
+    assert record.retries == 1
+    assert record.bytes == len(b'[{"name": "Football", "slug": "football"}]')
+    assert record.error is None
+    assert record.total >= record.ttfb > 0
+    assert not record.cache_hit and not record.streamed
+    assert record.to_dict()["endpoint"] == "leagues"
+
+
+def test_failed_and_cached_requests(api):
+    hook = Recorder()
+    with OddsAPIClient(
+        api_key="key", base_url=api.url, cache=ResponseCache(), hooks=[hook]
+    ) as client:
+        api.default = (200, {}, SPORTS)
+        client.get_sports()
+        client.get_sports()
+        api.default = (404, {}, "missing")
+        with pytest.raises(NotFoundError):
+            client.get_event_by_id(1)
+
+    fetched, cached, failed = hook.records
+    assert (fetched.cache_hit, cached.cache_hit) == (False, True)
+    assert cached.status is None
+    assert failed.endpoint == "events/{id}"
+    assert failed.status == 404
+    assert isinstance(failed.error, NotFoundError)
+    assert len(api.requests) == 2
+
+
+def test_streamed_requests_count_body_bytes(api):
+    api.default = (200, {}, [{"id": i} for i in range(100)])
+    hook = Recorder()
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        client.hooks.append(hook)
+        assert len(list(client.iter_events(sport="football"))) == 100
+
+    (record,) = hook.records
+    assert record.streamed
+    assert record.bytes == len(b", ".join(b'{"id": %d}' % i for i in range(100))) + 2
+
+
+async def test_async_client_records_requests(api):
+    api.replies = [(429, {}, "slow down")]
+    api.default = (200, {}, SPORTS)
+    hook = Recorder()
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, retry_policy=FAST, hooks=[hook]
+    ) as client:
+        await client.get_sports()
+        api.default = (404, {}, "missing")
+        with pytest.raises(NotFoundError):
+            await client.get_sports()
+
+    ok, failed = hook.records
+    assert (ok.status, ok.retries, ok.params) == (200, 1, None)
+    assert ok.decode > 0
+    assert isinstance(failed.error, NotFoundError)
+    assert hook.started == ["sports", "sports"]
@@ -0,0 +1,101 @@
+"""Tests for the OpenMetrics exporter."""
+
+import urllib.request
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.cache import ResponseCache
+from odds_api.exceptions import NotFoundError
+from odds_api.metrics import CONTENT_TYPE, MetricsCollector
+from odds_api.quota import Quota
+from odds_api.stream import OddsStream
+
+QUOTA_HEADERS = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4200"}
+
+
+def samples(text):
+    """Map every sample line of an exposition to its value."""
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if not line.startswith("#")
+    }
+
+
+def test_render_request_cache_and_quota_metrics(api):
+    metrics = MetricsCollector(buckets=(0.5, 10.0))
+    client = metrics.instrument(
+        OddsAPIClient(
+            api_key="key",
+            base_url=api.url,
+            cache=ResponseCache(),
+            quota=Quota(),
+        )
+    )
+    api.default = (200, QUOTA_HEADERS, [])
+    client.get_sports()
+    client.get_sports()
+    api.default = (404, {}, "missing")
+    with pytest.raises(NotFoundError):
+        client.get_event_by_id(1)
+    client.close()
+
+    text = metrics.render()
+    assert text.endswith("# EOF\n")
+    values = samples(text)
+    sports = 'endpoint="sports"'
+    for status, count in (("200", 1), ("cache", 1)):
+        labels = f'{sports},method="GET",status="{status}"'
+        assert values[f"odds_api_requests_total{{{labels}}}"] == count
+    assert values[f"odds_api_request_cache_hits_total{{{sports}}}"] == 1
+    assert values[f"odds_api_response_bytes_total{{{sports}}}"] == 2
+    # Cache hits are not timed
+    histogram = "odds_api_request_duration_seconds"
+    assert values[f'{histogram}_bucket{{{sports},le="+Inf"}}'] == 1
+    assert values[f"{histogram}_count{{{sports}}}"] == 1
+    assert values[f"odds_api_requests_in_flight{{{sports}}}"] == 0
+    failed = 'endpoint="events/{id}",error="NotFoundError"'
+    assert values[f"odds_api_request_errors_total{{{failed}}}"] == 1
+    assert values['odds_api_cache_hits_total{cache="response",index="0"}'] == 1
+    # The 404 carried no quota headers and was counted locally
+    assert values['odds_api_quota_remaining{quota="0"}'] == 4199
+    assert values['odds_api_quota_limit{quota="0"}'] == 5000
+
+
+def test_stream_metrics_and_label_escaping():
+    metrics = MetricsCollector(namespace="feed")
+    stream = metrics.watch_stream(OddsStream("key", markets="ML"), name='a "b"\n')
+    stream.stats.messages = 12
+    stream.stats.reconnects = 2
+
+    values = samples(metrics.render())
+    labels = '{stream="a \\"b\\"\\n"}'
+    assert values[f"feed_stream_messages_total{labels}"] == 12
+    assert values[f"feed_stream_reconnects_total{labels}"] == 2
+    assert values[f"feed_stream_connected{labels}"] == 0
+
+
+async def test_async_client_metrics(api):
+    metrics = MetricsCollector()
+    async with AsyncOddsAPIClient(api_key="key", base_url=api.url) as client:
+        metrics.instrument(client)
+        await client.get_sports()
+    values = samples(metrics.render())
+    key = 'odds_api_requests_total{endpoint="sports",method="GET",status="200"}'
+    assert values[key] == 1
+
+
+def test_serve_exposes_the_metrics():
+    metrics = MetricsCollector()
+    server = metrics.serve(0, "127.0.0.1")
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert "# TYPE odds_api_request_duration_seconds histogram" in body
+    assert body.endswith("# EOF\n")
@@ -0,0 +1,114 @@
+"""Tests for the typed response models."""
+
+from odds_api import OddsAPIClient
+from odds_api.models import ArbitrageBet, Event, Market, Participant, ValueBet
+
+ODDS = {
+    "id": 123,
+    "home": "Arsenal",
+    "away": "Chelsea",
+    "sport": {"name": "Football", "slug": "football"},
+    "league": {"name": "Premier League", "slug": "england-premier-league"},
+    "venue": "Emirates",
+    "bookmakers": {
+        "Bet365": [
+            {
+                "name": "ML",
+                "updatedAt": "2025-01-01T12:00:00Z",
+                "odds": [{"home": "1.90", "draw": "3.40", "away": "4.20"}],
+            },
+            {
+                "name": "Spread",
+                "odds": [
+                    {"hdp": -1.5, "label": "-1.5", "max": 500, "home": "2.5"},
+                    {"hdp": "-0.5", "home": "1.8", "away": "2.0"},
+                ],
+            },
+        ]
+    },
+}
+
+
+def test_event_with_odds():
+    event = Event.from_dict(ODDS)
+    assert (event.id, event.sport, event.league) == (
+        123,
+        "football",
+        "england-premier-league",
+    )
+    assert event.extra == {"venue": "Emirates"}
+
+    odds = event.bookmakers["Bet365"]
+    assert odds.market("ML").price("draw") == 3.40
+    assert odds.market("ML").updated_at == "2025-01-01T12:00:00Z"
+    first = odds.market("Spread", hdp=-1.5)
+    assert (first.label, first.max_stake, first.price("home")) == ("-1.5", 500, 2.5)
+    assert first.price("away") is None
+    assert odds.market("Spread", hdp=-0.5).price("away") == 2.0
+
+    data = event.to_dict()
+    assert data["venue"] == "Emirates"
+    assert data["bookmakers"]["Bet365"]["markets"][1]["max_stake"] == 500.0
+
+
+def test_market_without_odds_is_one_empty_line():
+    (market,) = Market.from_dict({"name": "ML"})
+    assert (market.name, market.hdp, market.outcomes) == ("ML", None, [])
+
+
+def test_participant_keeps_unknown_fields():
+    participant = Participant.from_dict({"id": 7, "name": "Arsenal", "short": "ARS"})
+    assert (participant.id, participant.name, participant.extra) == (
+        7,
+        "Arsenal",
+        {"short": "ARS"},
+    )
+    assert participant == Participant(7, "Arsenal", None, {"short": "ARS"})
+
+
+def test_arbitrage_bet_accepts_null_legs_and_nested_market():
+    bet = ArbitrageBet.from_dict(
+        {
+            "id": "a1",
+            "market": {"name": "Totals", "hdp": "2.5"},
+            "profitPercentage": "1.5",
+            "bets": None,
+        }
+    )
+    assert (bet.market, bet.hdp, bet.profit_percentage, bet.legs) == (
+        "Totals",
+        2.5,
+        1.5,
+        [],
+    )
+
+    bet = ArbitrageBet.from_dict(
+        {"bets": [{"bookmaker": "Bet365", "side": "over", "odds": "2.1"}]}
+    )
+    assert [(leg.bookmaker, leg.outcome, leg.price) for leg in bet.legs] == [
+        ("Bet365", "over", 2.1)
+    ]
+
+
+def test_value_bet():
+    bet = ValueBet.from_dict(
+        {
+            "id": "v1",
+            "bookmaker": "Bet365",
+            "market": "ML",
+            "betSide": "home",
+            "odds": "2.2",
+            "expectedValue": 4.5,
+            "event": {"id": 1, "home": "A", "away": "B"},
+        }
+    )
+    assert (bet.outcome, bet.price, bet.expected_value) == ("home", 2.2, 4.5)
+    assert bet.event == Event(1, "A", "B")
+
+
+def test_client_returns_models(api):
+    api.default = (200, {}, [ODDS])
+    with OddsAPIClient(api_key="key", base_url=api.url, return_models=True) as client:
+        (event,) = client.get_odds_for_multiple_events([123], "Bet365")
+    assert isinstance(event, Event)
+    assert event.bookmakers["Bet365"].market("ML").price("home") == 1.90
@@ -0,0 +1,79 @@
+"""Tests for the connection limits of PoolConfig."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from odds_api.exceptions import TransportError
+from odds_api.pool import PoolConfig
+from odds_api.transport import AiohttpTransport, RequestsTransport
+
+
+def slow(request):
+    time.sleep(0.2)
+    return 200, {}, []
+
+
+def test_requests_transport_caps_connections_per_host(api):
+    api.handler = slow
+    transport = RequestsTransport(pool=PoolConfig(max_per_host=2))
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        responses = list(
+            executor.map(lambda _: transport.request("GET", api.url), range(6))
+        )
+    transport.close()
+
+    assert [r.status for r in responses] == [200] * 6
+    assert api.peak == 2
+    assert api.connections == 2
+
+
+def test_requests_transport_times_out_waiting_for_a_connection(api):
+    api.handler = slow
+    transport = RequestsTransport(pool=PoolConfig(max_per_host=1, acquire_timeout=0.05))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(transport.request, "GET", api.url) for _ in "ab"]
+        errors = [f.exception() for f in futures]
+    transport.close()
+
+    assert sum(isinstance(e, TransportError) for e in errors) == 1
+    assert "max_per_host=1" in str(next(e for e in errors if e is not None))
+
+
+def test_streamed_response_holds_its_connection_until_closed(api):
+    transport = RequestsTransport(pool=PoolConfig(max_per_host=1, acquire_timeout=0.05))
+    response = transport.request("GET", api.url, stream=True)
+    with pytest.raises(TransportError):
+        transport.request("GET", api.url)
+    response.close()
+    response.close()
+    assert transport.request("GET", api.url).status == 200
+    transport.close()
+
+
+def test_httpx_transport_caps_connections(api):
+    pytest.importorskip("httpx")
+    from odds_api.transport import HTTPXTransport
+
+    api.handler = slow
+    transport = HTTPXTransport(pool=PoolConfig(max_per_host=2), http2=False)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda _: transport.request("GET", api.url), range(6)))
+    transport.close()
+
+    assert api.peak == 2
+    assert api.connections == 2
+
+
+async def test_aiohttp_transport_caps_connections(api):
+    api.handler = slow
+    transport = AiohttpTransport(pool=PoolConfig(max_per_host=2))
+    try:
+        await asyncio.gather(*[transport.request("GET", api.url) for _ in range(6)])
+    finally:
+        await transport.close()
+
+    assert api.peak == 2
+    assert api.connections == 2
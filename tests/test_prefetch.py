@@ -0,0 +1,103 @@
+"""Tests for the prefetch_snapshot pipeline."""
+
+import asyncio
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.exceptions import NotFoundError
+
+EVENTS = {
+    "premier-league": [1, 2, 3],
+    "laliga": [4, 5],
+}
+
+
+def reply(request):
+    if request.path.endswith("/events"):
+        league = request.params["league"]
+        return (
+            200,
+            {},
+            [
+                {"id": i, "home": f"H{i}", "sport": "Football", "league": league}
+                for i in EVENTS[league]
+            ],
+        )
+    ids = request.params["eventIds"].split(",")
+    # Event 5 is listed but has no odds
+    return (
+        200,
+        {},
+        [
+            {
+                "id": int(i),
+                "bookmakers": {
+                    "Bet365": [{"name": "ML", "odds": [{"home": "1.9", "away": "2.0"}]}]
+                },
+            }
+            for i in ids
+            if i != "5"
+        ],
+    )
+
+
+def check(api, book, updates):
+    assert book.event_ids() == {"1", "2", "3", "4"}
+    assert book.event("5")["home"] == "H5"
+    assert book.price(4, "Bet365", "ML", "away") == 2.0
+    assert len(book) == 8
+
+    odds = [r for r in api.requests if r.path.endswith("/odds/multi")]
+    assert sorted(len(r.params["eventIds"].split(",")) for r in odds) == [1, 2, 2]
+    assert all("bookmakers" not in r.params for r in odds)
+
+    assert updates[-1] == {
+        "leagues_done": 2,
+        "leagues_total": 2,
+        "events": 5,
+        "batches_done": 3,
+        "batches_total": 3,
+        "quotes": 8,
+    }
+
+
+def test_sync_prefetch_loads_every_league(api):
+    api.handler = reply
+    updates = []
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        book = client.prefetch_snapshot(
+            "football",
+            leagues="premier-league,laliga",
+            progress=lambda p: updates.append(p.to_dict()),
+            chunk_size=2,
+        )
+    check(api, book, updates)
+
+
+async def test_async_prefetch_loads_every_league(api):
+    api.handler = reply
+    updates = []
+    async with AsyncOddsAPIClient(api_key="key", base_url=api.url) as client:
+        book = await client.prefetch_snapshot(
+            "football",
+            leagues=["premier-league", "laliga"],
+            progress=lambda p: updates.append(p.to_dict()),
+            chunk_size=2,
+        )
+    check(api, book, updates)
+
+
+async def test_async_prefetch_failure_cancels_the_pipeline(api):
+    def failing(request):
+        if request.params.get("league") == "laliga":
+            return 404, {}, {"error": "Unknown league"}
+        return reply(request)
+
+    api.handler = failing
+    async with AsyncOddsAPIClient(api_key="key", base_url=api.url) as client:
+        with pytest.raises(NotFoundError):
+            await client.prefetch_snapshot(
+                "football", leagues="premier-league,laliga", chunk_size=1
+            )
+        assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,146 @@
+"""Tests for quota tracking and adaptive throttling."""
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.quota import Quota, parse_quota_headers
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.epoch = 1767225600.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.epoch + self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("odds_api.quota.time", clock)
+    return clock
+
+
+def test_parse_quota_headers(clock):
+    assert parse_quota_headers(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "12",
+            "X-RateLimit-Reset": "30",
+        }
+    ) == (5000, 12, 30.0)
+    # IETF draft names with policy suffixes, and an epoch reset
+    reset_at = str(int(clock.time() + 90))
+    headers = {
+        "RateLimit-Limit": "100, 100;w=3600",
+        "RateLimit-Remaining": "7",
+        "RateLimit-Reset": reset_at,
+    }
+    assert parse_quota_headers(headers) == (100, 7, 90.0)
+    assert parse_quota_headers({"X-RateLimit-Remaining": "many"}) == (
+        None,
+        None,
+        None,
+    )
+
+
+def test_update_from_headers(clock):
+    quota = Quota()
+    assert quota.remaining is None and quota.used_fraction is None
+    assert not quota.update({"Content-Type": "application/json"})
+    assert quota.update({"X-Requests-Remaining": "80", "X-Requests-Reset": "60"})
+    # Without a limit header the highest remaining count seen stands in
+    assert (quota.limit, quota.remaining) == (80, 80)
+    quota.update({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "75"})
+    assert quota.used_fraction == 0.25
+    clock.now += 20
+    assert quota.reset_in == 40
+    assert quota.from_headers
+
+
+def test_full_speed_above_the_threshold(clock):
+    quota = Quota(slow_below=0.2)
+    quota.update({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "50"})
+    assert [quota.reserve() for _ in range(30)] == [0.0] * 30
+    assert quota.remaining == 20
+    assert quota.throttled == 0
+
+
+def test_spacing_grows_as_the_quota_shrinks(clock):
+    quota = Quota(slow_below=0.2)
+    quota.update(
+        {
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": "100",
+        }
+    )
+    assert quota.reserve() == 0.0
+    # 10 left over 100 s, at half the full spacing: 10 % of the quota
+    # is half way from the threshold to exhaustion
+    assert quota.reserve() == pytest.approx(5.0)
+    delays = [quota.reserve() for _ in range(8)]
+    gaps = [b - a for a, b in zip([5.0] + delays, delays)]
+    assert all(later > earlier for earlier, later in zip(gaps, gaps[1:]))
+    assert delays[-1] < 100
+    assert quota.throttled == pytest.approx(5.0 + sum(delays))
+
+
+def test_exhausted_quota_spreads_requests_over_later_windows(clock):
+    quota = Quota(period=3600)
+    quota.update(
+        {
+            "X-RateLimit-Limit": "2",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "60",
+        }
+    )
+    assert [quota.reserve() for _ in range(3)] == [60.0, 1860.0, 3660.0]
+
+    # After the reset two queued requests use up the new window, so the
+    # next one goes half way into the window after it
+    clock.now += 61
+    assert quota.reserve() == pytest.approx(3599.0 + 1800.0)
+    assert quota.remaining == 0
+
+
+def test_local_budget_without_headers(clock):
+    quota = Quota(budget=3, period=10, slow_below=0.5)
+    assert [quota.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert quota.reserve() == 10.0
+    # The new window starts with the request queued for it
+    clock.now += 10
+    assert quota.reserve() == 0.0
+    assert quota.remaining == 1
+    with pytest.raises(ValueError):
+        Quota(budget=0)
+    with pytest.raises(ValueError):
+        Quota(slow_below=1.5)
+
+
+def test_clients_track_quota_only_when_enabled(api):
+    api.default = (
+        200,
+        {"X-RateLimit-Limit": "500", "X-RateLimit-Remaining": "499"},
+        [],
+    )
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        client.get_sports()
+        assert client.quota is None
+    with OddsAPIClient(api_key="key", base_url=api.url, quota=Quota()) as client:
+        client.get_sports()
+        assert (client.quota.limit, client.quota.remaining) == (500, 499)
+
+
+async def test_async_client_tracks_quota(api):
+    api.default = (200, {"RateLimit-Limit": "50", "RateLimit-Remaining": "5"}, [])
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, quota=Quota()
+    ) as client:
+        await client.get_sports()
+        assert client.quota.remaining == 5
+        assert client.quota.from_headers
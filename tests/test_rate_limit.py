@@ -0,0 +1,112 @@
+"""Tests for the token-bucket RateLimiter."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.constants import Endpoints
+from odds_api.rate_limit import RateLimiter
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("odds_api.rate_limit.time", clock)
+    return clock
+
+
+def test_burst_then_sustained_rate(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Queued callers wait in arrival order, 1 / rate apart
+    assert [limiter.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+    assert limiter.available == -3
+
+    clock.now += 10
+    assert limiter.available == 3
+
+
+def test_endpoint_weights(clock):
+    limiter = RateLimiter(
+        rate=1, burst=4, weights={Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS: 3}
+    )
+    assert limiter.weight_for(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS) == 3
+    assert limiter.weight_for(Endpoints.GET_SPORTS) == 1
+    assert limiter.weight_for(None) == 1
+    assert (
+        limiter.reserve(limiter.weight_for(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS))
+        == 0.0
+    )
+    assert (
+        limiter.reserve(limiter.weight_for(Endpoints.GET_ODDS_FOR_MULTIPLE_EVENTS))
+        == 2.0
+    )
+
+
+def test_per_hour_and_validation():
+    limiter = RateLimiter.per_hour(7200)
+    assert limiter.rate == 2
+    assert limiter.burst == 2
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+
+
+def test_threads_share_one_bucket():
+    limiter = RateLimiter(rate=50, burst=1)
+    started = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # One token up front, then five more at 50 per second
+    assert time.monotonic() - started >= 0.09
+
+
+def test_sync_client_waits_for_tokens(api):
+    limiter = RateLimiter(rate=20, burst=1)
+    with OddsAPIClient(api_key="key", base_url=api.url, rate_limiter=limiter) as a:
+        with OddsAPIClient(api_key="key", base_url=api.url, rate_limiter=limiter) as b:
+            started = time.monotonic()
+            a.get_sports()
+            b.get_sports()
+            a.get_sports()
+            assert time.monotonic() - started >= 0.09
+    assert len(api.requests) == 3
+
+
+async def test_async_client_does_not_block_the_loop(api):
+    limiter = RateLimiter(rate=20, burst=1)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, rate_limiter=limiter
+    ) as client:
+        started = time.monotonic()
+        await asyncio.gather(*(client.get_sports() for _ in range(4)))
+        elapsed = time.monotonic() - started
+    task.cancel()
+
+    assert elapsed >= 0.14
+    assert ticks >= 5
+    assert len(api.requests) == 4
@@ -0,0 +1,107 @@
+"""Tests for the retry policy and its use by both clients."""
+
+import random
+import time
+from email.utils import formatdate
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.exceptions import NotFoundError, OddsAPIError, RateLimitExceededError
+from odds_api.retry import RetryPolicy, parse_retry_after
+
+FAST = RetryPolicy(max_retries=2, base_delay=0.001, max_delay=0.01)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-4") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_a_minute = parse_retry_after(formatdate(time.time() + 60, usegmt=True))
+    assert 55 < in_a_minute <= 60
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+
+
+def test_delay_is_jittered_below_the_exponential_ceiling():
+    random.seed(1)
+    policy = RetryPolicy(max_retries=10, base_delay=1, max_delay=5, max_elapsed=1e9)
+    for attempt, ceiling in enumerate([1, 2, 4, 5, 5]):
+        delays = [policy.get_delay(attempt, 0) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        # Full jitter spreads delays over the whole range
+        assert max(delays) - min(delays) > ceiling / 2
+
+
+def test_delay_limits():
+    policy = RetryPolicy(max_retries=2, base_delay=1, max_delay=1, max_elapsed=10)
+    assert policy.get_delay(0, 0, retry_after=3) >= 3
+    assert policy.get_delay(2, 0) is None
+    assert policy.get_delay(0, 9.5, retry_after=1) is None
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+
+def test_sync_client_retries_transient_statuses(api):
+    api.replies = [(503, {}, "busy"), (502, {}, "bad gateway")]
+    api.default = (200, {}, [{"slug": "football"}])
+    with OddsAPIClient(api_key="key", base_url=api.url, retry_policy=FAST) as client:
+        assert client.get_sports() == [{"slug": "football"}]
+    assert len(api.requests) == 3
+
+
+def test_sync_client_gives_up_after_max_retries(api):
+    api.default = (429, {}, "slow down")
+    with OddsAPIClient(api_key="key", base_url=api.url, retry_policy=FAST) as client:
+        with pytest.raises(RateLimitExceededError):
+            client.get_sports()
+    assert len(api.requests) == 3
+
+
+def test_sync_client_does_not_retry_client_errors(api):
+    api.default = (404, {}, "missing")
+    with OddsAPIClient(api_key="key", base_url=api.url, retry_policy=FAST) as client:
+        with pytest.raises(NotFoundError):
+            client.get_sports()
+    assert len(api.requests) == 1
+
+
+def test_sync_client_honours_retry_after(api):
+    api.replies = [(429, {"Retry-After": "0.2"}, "slow down")]
+    with OddsAPIClient(api_key="key", base_url=api.url, retry_policy=FAST) as client:
+        started = time.monotonic()
+        client.get_sports()
+        assert time.monotonic() - started >= 0.2
+    assert len(api.requests) == 2
+
+
+def test_sync_client_retries_connection_errors(api):
+    url = api.url
+    api.server.shutdown()
+    api.server.server_close()
+    with OddsAPIClient(api_key="key", base_url=url, retry_policy=FAST) as client:
+        with pytest.raises(OddsAPIError, match="Request failed"):
+            client.get_sports()
+
+
+async def test_async_client_retries_transient_statuses(api):
+    api.replies = [(500, {}, "oops"), (429, {"Retry-After": "0.1"}, "slow down")]
+    api.default = (200, {}, [{"slug": "tennis"}])
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, retry_policy=FAST
+    ) as client:
+        started = time.monotonic()
+        assert await client.get_sports() == [{"slug": "tennis"}]
+        assert time.monotonic() - started >= 0.1
+    assert len(api.requests) == 3
+
+
+async def test_async_client_gives_up_after_max_retries(api):
+    api.default = (503, {}, "busy")
+    async with AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, retry_policy=FAST
+    ) as client:
+        with pytest.raises(OddsAPIError, match="503"):
+            await client.get_sports()
+    assert len(api.requests) == 3
@@ -0,0 +1,120 @@
+"""Tests for OddsStream against a local WebSocket server."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from odds_api.exceptions import InvalidAPIKeyError, OddsAPIError
+from odds_api.retry import RetryPolicy
+from odds_api.stream import OddsStream
+
+WELCOME = {"type": "welcome", "message": "Connected"}
+UPDATE = {
+    "type": "updated",
+    "id": "123",
+    "bookie": "Bet365",
+    "timestamp": 1700000000,
+    "markets": [{"name": "ML", "odds": [{"home": "1.90", "away": "1.95"}]}],
+}
+
+
+class FeedServer:
+    """Serves each connection the next list of frames, then closes it."""
+
+    def __init__(self) -> None:
+        self.connections = []
+        self.frames = []
+        self.status = 200
+
+    async def handle(self, request):
+        self.connections.append(dict(request.query))
+        if self.status != 200:
+            return web.Response(status=self.status)
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        frames = self.frames.pop(0) if self.frames else []
+        for frame in frames:
+            await ws.send_str(frame)
+        await ws.close()
+        return ws
+
+
+@pytest.fixture
+async def feed_server():
+    server = FeedServer()
+    app = web.Application()
+    app.router.add_get("/ws", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    server.url = f"ws://127.0.0.1:{port}/ws"
+    yield server
+    await runner.cleanup()
+
+
+def stream(server, **kwargs):
+    kwargs.setdefault("reconnect", False)
+    return OddsStream("key", markets=["ML", "Totals"], url=server.url, **kwargs)
+
+
+async def collect(feed):
+    return [message async for message in feed]
+
+
+async def test_parses_messages_and_subscribes_with_filters(feed_server):
+    feed_server.frames = [
+        [json.dumps(WELCOME), json.dumps(UPDATE) + "\n" + json.dumps(UPDATE)]
+    ]
+    async with stream(feed_server, sport="football", status="live") as feed:
+        messages = await asyncio.wait_for(collect(feed), 5)
+
+    assert [m.type for m in messages] == ["welcome", "updated", "updated"]
+    update = messages[1]
+    assert (update.id, update.bookie, update.timestamp) == ("123", "Bet365", 1.7e9)
+    assert feed.welcome == WELCOME
+    assert feed.stats.messages == 3
+    assert feed_server.connections == [
+        {"apiKey": "key", "markets": "ML,Totals", "sport": "football", "status": "live"}
+    ]
+
+
+async def test_counts_undecodable_frames(feed_server):
+    feed_server.frames = [["not json", "[1, 2]", json.dumps(UPDATE)]]
+    async with stream(feed_server) as feed:
+        messages = await asyncio.wait_for(collect(feed), 5)
+    assert [m.type for m in messages] == ["updated"]
+    assert feed.stats.decode_errors == 2
+
+
+async def test_reconnects_after_the_connection_closes(feed_server):
+    feed_server.frames = [[json.dumps(WELCOME)], [json.dumps(UPDATE)]]
+    policy = RetryPolicy(max_retries=1, base_delay=0.01, max_delay=0.01)
+    async with stream(feed_server, reconnect=True, reconnect_policy=policy) as feed:
+        first = await asyncio.wait_for(feed.__anext__(), 5)
+        second = await asyncio.wait_for(feed.__anext__(), 5)
+    assert (first.type, second.type) == ("welcome", "updated")
+    assert feed.stats.reconnects >= 1
+
+
+async def test_invalid_api_key_ends_the_stream(feed_server):
+    feed_server.status = 401
+    async with stream(feed_server, reconnect=True) as feed:
+        with pytest.raises(InvalidAPIKeyError):
+            await asyncio.wait_for(collect(feed), 5)
+    assert len(feed_server.connections) == 1
+
+
+async def test_unexpected_errors_end_the_stream(feed_server):
+    def decoder(data):
+        raise TypeError("decoder bug")
+
+    feed_server.frames = [[json.dumps(UPDATE)]]
+    async with stream(feed_server, reconnect=True, json_decoder=decoder) as feed:
+        with pytest.raises(OddsAPIError, match="decoder bug") as error:
+            await asyncio.wait_for(collect(feed), 5)
+    assert isinstance(error.value.__cause__, TypeError)
+    assert len(feed_server.connections) == 1
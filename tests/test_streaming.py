@@ -0,0 +1,101 @@
+"""Tests for incremental parsing of JSON array responses."""
+
+import json
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.exceptions import NotFoundError, OddsAPIError
+from odds_api.models import Event
+from odds_api.streaming import JSONArrayParser
+
+ITEMS = [
+    {"id": 1, "home": "Bayern München", "away": "1. FC Köln"},
+    -1500.25,
+    "a, b]",
+    [1, [2, 3]],
+    True,
+    None,
+    12,
+]
+
+
+def parse(chunks):
+    parser = JSONArrayParser()
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items
+
+
+def test_any_chunking_yields_the_same_items():
+    body = json.dumps(ITEMS, ensure_ascii=False).encode()
+    assert parse([body]) == ITEMS
+    # One byte at a time splits multi-byte characters and numbers
+    assert parse([body[i : i + 1] for i in range(len(body))]) == ITEMS
+    assert parse([b" [ ", b"] \n"]) == []
+
+
+def test_items_are_returned_as_soon_as_complete():
+    parser = JSONArrayParser()
+    assert parser.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b": 2}, 3") == [{"id": 2}]
+    # 3 may continue as 30 or 3.5 until a delimiter follows
+    assert parser.feed(b"0") == []
+    assert parser.feed(b"]") == [30]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"id": 1}', b"[1, 2", b'[{"id": 1]', b"[1 2]", b"[1] [2]"],
+)
+def test_invalid_arrays_raise_value_error(body):
+    with pytest.raises(ValueError):
+        parse([body])
+
+
+def events_handler(request):
+    return 200, {}, [{"id": i, "home": "A", "away": "B"} for i in range(500)]
+
+
+def test_sync_iter_events_streams_items(api):
+    api.handler = events_handler
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        events = client.iter_events(sport="football", league="england-premier-league")
+        assert next(events)["id"] == 0
+        assert [event["id"] for event in events] == list(range(1, 500))
+    assert api.requests[0].params["league"] == "england-premier-league"
+
+
+def test_sync_iter_events_returns_models(api):
+    api.handler = events_handler
+    with OddsAPIClient(api_key="key", base_url=api.url, return_models=True) as c:
+        events = list(c.iter_events(sport="football"))
+    assert len(events) == 500
+    assert all(isinstance(event, Event) for event in events)
+
+
+def test_sync_iter_raises_api_and_parse_errors(api):
+    api.replies = [(404, {}, "missing"), (200, {}, b'[{"id": 1}, {"id": ')]
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        with pytest.raises(NotFoundError):
+            list(client.iter_events(sport="football"))
+        events = client.iter_events(sport="football")
+        assert next(events) == {"id": 1}
+        with pytest.raises(OddsAPIError, match="Invalid JSON"):
+            next(events)
+
+
+async def test_async_iter_updated_odds_streams_items(api):
+    api.handler = events_handler
+    async with AsyncOddsAPIClient(api_key="key", base_url=api.url) as client:
+        ids = [
+            item["id"]
+            async for item in client.iter_updated_odds(
+                since=1700000000, bookmaker="Bet365", sport="football"
+            )
+        ]
+    assert ids == list(range(500))
+    assert api.requests[0].params["since"] == "1700000000"
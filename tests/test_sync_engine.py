@@ -0,0 +1,130 @@
+"""Tests for the delta sync engines and cursor stores."""
+
+import asyncio
+import time
+
+import pytest
+
+from odds_api import OddsAPIClient
+from odds_api.sync_engine import (
+    AsyncOddsSyncEngine,
+    CursorStore,
+    FileCursorStore,
+    OddsSyncEngine,
+)
+
+T0 = 1767225600  # 2026-01-01T00:00:00Z
+
+
+def iso(ts):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+def update(event_id, bookmaker, ts, home=2.0):
+    markets = [{"name": "ML", "updatedAt": iso(ts), "odds": [{"home": home}]}]
+    return {"id": event_id, "home": "A", "bookmakers": {bookmaker: markets}}
+
+
+class FakeClient:
+    return_models = False
+
+    def __init__(self):
+        self.deltas = []
+        self.calls = []
+
+    def get_updated_odds_since_timestamp(self, since, bookmaker, sport):
+        self.calls.append((since, bookmaker, sport))
+        return self.deltas.pop(0) if self.deltas else []
+
+
+def test_cursor_follows_server_timestamps_with_overlap():
+    client = FakeClient()
+    engine = OddsSyncEngine(client, [("Bet365", "football")], overlap=5)
+
+    client.deltas = [[update(1, "Bet365", T0), update(2, "Bet365", T0 + 30)]]
+    started = time.time()
+    assert engine.poll_once() == 2
+    since = client.calls[0][0]
+    assert started - 61 <= since <= started - 59
+    assert engine.cursor_store.get("Bet365", "football") == T0 + 30
+
+    engine.poll_once()
+    assert client.calls[1] == (T0 + 25, "Bet365", "football")
+
+
+def test_merge_is_idempotent_and_removes_empty_books():
+    changes = []
+    client = FakeClient()
+    engine = OddsSyncEngine(
+        client,
+        [("Bet365", "football")],
+        on_change=lambda *change: changes.append(change),
+    )
+
+    client.deltas = [
+        [update(1, "Bet365", T0, home=2.0)],
+        # The overlapping window returns the same version again
+        [update(1, "Bet365", T0, home=2.0), update(1, "Bet365", T0 + 10, 2.5)],
+        [{"id": 1, "updatedAt": iso(T0 + 20), "bookmakers": {"Bet365": []}}],
+    ]
+    engine.poll_once()
+    assert engine.poll_once() == 1
+    assert engine.get(1)["Bet365"][0]["odds"] == [{"home": 2.5}]
+    assert engine.events["1"] == {"id": 1, "home": "A"}
+
+    engine.poll_once()
+    assert engine.get("1") == {}
+    assert [(event_id, markets == []) for event_id, _, markets in changes] == [
+        ("1", False),
+        ("1", False),
+        ("1", True),
+    ]
+
+
+def test_file_cursor_store_survives_restarts(tmp_path):
+    path = str(tmp_path / "cursors.json")
+    FileCursorStore(path).set("Bet365", "football", T0)
+    store = FileCursorStore(path)
+    assert store.get("Bet365", "football") == T0
+    assert store.get("Bet365", "tennis") is None
+    assert CursorStore().get("Bet365", "football") is None
+
+
+def test_engine_requires_dict_responses():
+    client = FakeClient()
+    client.return_models = True
+    with pytest.raises(ValueError):
+        OddsSyncEngine(client, [("Bet365", "football")])
+
+
+def test_engine_polls_the_updated_odds_endpoint(api):
+    api.default = (200, {}, [update(7, "SingBet", T0)])
+    with OddsAPIClient(api_key="key", base_url=api.url) as client:
+        engine = OddsSyncEngine(client, [("SingBet", "basketball")])
+        assert engine.poll_once() == 1
+    request = api.requests[0]
+    assert request.path == "/v3/odds/updated"
+    assert request.params["bookmaker"] == "SingBet"
+    assert request.params["sport"] == "basketball"
+    assert "SingBet" in engine.get(7)
+
+
+async def test_async_engine_polls_pairs_concurrently():
+    active = peak = 0
+
+    class AsyncClient:
+        return_models = False
+
+        async def get_updated_odds_since_timestamp(self, since, bookmaker, sport):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return [update(sport, bookmaker, T0)]
+
+    pairs = [("Bet365", str(sport)) for sport in range(6)]
+    engine = AsyncOddsSyncEngine(AsyncClient(), pairs, max_concurrency=3)
+    assert await engine.poll_once() == 6
+    assert peak == 3
+    assert sorted(engine.snapshot) == [str(sport) for sport in range(6)]
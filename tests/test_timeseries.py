@@ -0,0 +1,102 @@
+"""Tests for the ring-buffer OddsHistory."""
+
+import pytest
+
+from odds_api.timeseries import OddsHistory, market_prices, movement_prices
+
+KEY = ("1", "Bet365", "ML", None, "home")
+
+
+def filled(capacity, ticks):
+    history = OddsHistory(capacity=capacity)
+    for ts, price in ticks:
+        history.append(KEY, ts, price)
+    return history
+
+
+def test_ring_buffer_keeps_the_latest_ticks():
+    history = filled(4, [(t, 1.0 + t / 10) for t in range(1, 7)])
+    assert history.ticks == 4
+    assert history.last(KEY, 10) == [(3, 1.3), (4, 1.4), (5, 1.5), (6, 1.6)]
+    assert history.last(KEY) == [(6, 1.6)]
+    assert history.last(("2", "Bet365", "ML", None, "home")) == []
+
+
+def test_only_changes_in_order_are_recorded():
+    history = OddsHistory()
+    assert history.append(KEY, 10, 2.0)
+    assert not history.append(KEY, 11, 2.0)
+    assert not history.append(KEY, 9, 2.1)
+    assert history.dropped == 1
+    assert history.append(KEY, 12, 2.1)
+    assert history.last(KEY, 5) == [(10, 2.0), (12, 2.1)]
+    with pytest.raises(ValueError):
+        OddsHistory(capacity=0)
+
+
+@pytest.mark.parametrize("capacity", [3, 5, 100])
+def test_queries_across_the_wrap_point(capacity):
+    prices = [2.0, 2.2, 1.9, 2.5, 2.1]
+    history = filled(capacity, [(10 * (i + 1), p) for i, p in enumerate(prices)])
+    kept = [(10 * (i + 1), p) for i, p in enumerate(prices)][-capacity:]
+    oldest = kept[0][0]
+
+    assert history.price_at(KEY, oldest - 1) is None
+    assert history.price_at(KEY, 45) == 2.5
+    assert history.price_at(KEY, 50) == 2.1
+    assert history.price_at(KEY, 1000) == 2.1
+    assert history.window(KEY, 35) == [(30, 1.9), (40, 2.5), (50, 2.1)]
+    assert history.window(KEY, 35, 45) == [(30, 1.9), (40, 2.5)]
+    # The price in effect when the window opens counts towards the range
+    assert history.max_move(KEY, window=5) == pytest.approx(0.4)
+    assert history.max_move(KEY, window=15) == pytest.approx(0.6)
+    assert history.max_move(KEY, window=25, now=40) == pytest.approx(0.6)
+
+
+def test_ingest_feed_messages_and_movements():
+    history = OddsHistory()
+    message = {
+        "type": "updated",
+        "id": 7,
+        "bookie": "Bet365",
+        "timestamp": 100,
+        "markets": [
+            {"name": "ML", "odds": [{"home": "2.0", "away": "1.8"}]},
+            {
+                "name": "Totals",
+                "updatedAt": "1970-01-01T00:01:30Z",
+                "odds": [{"hdp": "2.5", "over": 1.9, "under": 1.9}],
+            },
+        ],
+    }
+    assert history.ingest_message(message) == 4
+    assert history.ingest_message(message) == 0
+    assert history.ingest_message({"type": "deleted", "id": 7}) == 0
+    assert history.last(("7", "Bet365", "Totals", 2.5, "over")) == [(90, 1.9)]
+
+    movements = {"movements": [{"timestamp": 110, "odds": {"home": 2.1}}]}
+    assert history.ingest_movements(7, "Bet365", "ML", movements) == 1
+    assert history.last(("7", "Bet365", "ML", None, "home"), 2) == [
+        (100, 2.0),
+        (110, 2.1),
+    ]
+
+    assert len(history.keys(7)) == 4
+    history.remove_event(7)
+    assert len(history) == 0
+
+
+def test_price_parsers():
+    markets = [{"name": "Spread", "odds": [{"hdp": -1, "home": "1.9", "max": 500}]}]
+    assert list(market_prices(markets, 5)) == [("Spread", -1.0, "home", 5, 1.9)]
+
+    movements = [
+        {"timestamp": 20, "price": 2.2},
+        {"timestamp": 10, "home": 2.0, "away": "1.8"},
+        {"odds": {"home": 9.9}},
+    ]
+    assert movement_prices(movements, outcome="home") == [
+        (10, "home", 2.0),
+        (10, "away", 1.8),
+        (20, "home", 2.2),
+    ]
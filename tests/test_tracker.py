@@ -0,0 +1,108 @@
+"""Tests for the incremental OpportunityTracker."""
+
+import pytest
+
+from odds_api.tracker import OpportunityTracker
+
+pytest.importorskip("numpy")
+
+
+def message(event_id, bookmaker, timestamp, home, away, msg_type="updated"):
+    return {
+        "type": msg_type,
+        "id": event_id,
+        "bookie": bookmaker,
+        "timestamp": timestamp,
+        "markets": [{"name": "ML", "odds": [{"home": home, "away": away}]}],
+    }
+
+
+@pytest.fixture
+def tracked():
+    from odds_api.book import OddsBook
+
+    events = []
+    tracker = OpportunityTracker(
+        OddsBook(),
+        top_n=5,
+        on_enter=lambda o: events.append(("enter", o)),
+        on_exit=lambda o: events.append(("exit", o)),
+    )
+    return tracker, events
+
+
+def test_opportunity_opens_updates_and_closes(tracked):
+    tracker, events = tracked
+
+    tracker.apply(message("1", "A", 1, "2.10", "1.80"))
+    tracker.apply(message("1", "B", 1, "1.80", "2.10"))
+    assert [kind for kind, _ in events] == ["enter"]
+    (arb,) = tracker.top_arbitrage()
+    assert arb.event.id == "1"
+    assert arb.profit_percentage == pytest.approx(5.0)
+    assert {(leg.outcome, leg.bookmaker) for leg in arb.legs} == {
+        ("home", "A"),
+        ("away", "B"),
+    }
+
+    # A better price re-ranks the opportunity without re-entering it
+    events.clear()
+    tracker.apply(message("1", "B", 2, "1.80", "2.20"))
+    assert events == []
+    assert tracker.top_arbitrage()[0].profit_percentage > 5.0
+
+    tracker.apply(message("1", "B", 3, "1.80", "1.80"))
+    assert [kind for kind, _ in events] == ["exit"]
+    assert tracker.top_arbitrage() == []
+
+
+def test_deleted_bookmaker_closes_opportunity(tracked):
+    tracker, events = tracked
+    tracker.apply(message("1", "A", 1, "2.10", "1.80"))
+    tracker.apply(message("1", "B", 1, "1.80", "2.10"))
+
+    tracker.apply({"type": "deleted", "id": "1", "bookie": "B", "timestamp": 2})
+    assert [kind for kind, _ in events] == ["enter", "exit"]
+    assert tracker.top_arbitrage() == []
+
+
+def test_update_only_evaluates_changed_groups(tracked, monkeypatch):
+    tracker, _ = tracked
+    for event_id in ("1", "2", "3"):
+        tracker.apply(message(event_id, "A", 1, "2.10", "1.80"))
+        tracker.apply(message(event_id, "B", 1, "1.80", "2.10"))
+    assert len(tracker.top_arbitrage()) == 3
+
+    evaluated = []
+    prices = tracker._prices
+    monkeypatch.setattr(
+        tracker, "_prices", lambda group: evaluated.append(group) or prices(group)
+    )
+    # A draw priced on one event makes it 3-way without rescanning the others
+    tracker.apply(
+        {
+            "type": "updated",
+            "id": "2",
+            "bookie": "C",
+            "timestamp": 1,
+            "markets": [
+                {"name": "ML", "odds": [{"home": "1.5", "draw": "2.0", "away": "1.5"}]}
+            ],
+        }
+    )
+    assert evaluated == [("2", "ML", None)]
+    assert [a.event.id for a in tracker.top_arbitrage()] == ["1", "3"]
+
+
+def test_value_bets_follow_sharp_prices():
+    from odds_api.book import OddsBook
+
+    tracker = OpportunityTracker(OddsBook(), sharp="Sharp")
+    tracker.apply(message("1", "Sharp", 1, "1.95", "1.95"))
+    tracker.apply(message("1", "Soft", 1, "2.20", "1.70"))
+    (bet,) = tracker.top_value()
+    assert (bet.bookmaker, bet.outcome, bet.price) == ("Soft", "home", 2.20)
+    assert bet.expected_value == pytest.approx(10.0)
+
+    tracker.apply(message("1", "Soft", 2, "1.90", "1.90"))
+    assert tracker.top_value() == []
@@ -0,0 +1,83 @@
+"""Tests for the pluggable transports."""
+
+import socket
+
+import pytest
+
+from odds_api import AsyncOddsAPIClient, OddsAPIClient
+from odds_api.exceptions import TransportError
+from odds_api.transport import (
+    AsyncTransport,
+    RequestsTransport,
+    Response,
+    Transport,
+)
+
+EVENTS = [{"id": i, "home": f"H{i}"} for i in range(50)]
+
+
+def test_base_transports_are_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+    with pytest.raises(TypeError):
+        AsyncTransport()
+
+
+def test_custom_transport_plugs_into_the_client():
+    class Canned(Transport):
+        def __init__(self):
+            super().__init__()
+            self.sent = []
+
+        def request(self, method, url, params=None, headers=None, stream=False):
+            self.sent.append((method, url, params))
+            return Response(200, {}, b'[{"slug": "football"}]')
+
+        def prewarm(self, url, count):
+            return 0
+
+        def close(self):
+            pass
+
+    transport = Canned()
+    client = OddsAPIClient(api_key="key", base_url="http://api", transport=transport)
+    assert client.get_sports() == [{"slug": "football"}]
+    assert transport.sent == [("GET", "http://api/sports", {"apiKey": "key"})]
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_connection_errors_raise_transport_error():
+    transport = RequestsTransport(timeout=1)
+    with pytest.raises(TransportError):
+        transport.request("GET", f"http://127.0.0.1:{unused_port()}/")
+    transport.close()
+
+
+def test_httpx_transport(api):
+    pytest.importorskip("httpx")
+    from odds_api.transport import HTTPXTransport
+
+    api.default = (200, {}, EVENTS)
+    client = OddsAPIClient(api_key="key", base_url=api.url, transport=HTTPXTransport())
+    with client:
+        assert client.get_events(sport="football") == EVENTS
+        assert list(client.iter_events(sport="football")) == EVENTS
+    assert api.requests[0].params == {"apiKey": "key", "sport": "football"}
+
+
+async def test_async_httpx_transport(api):
+    pytest.importorskip("httpx")
+    from odds_api.transport import AsyncHTTPXTransport
+
+    api.default = (200, {}, EVENTS)
+    client = AsyncOddsAPIClient(
+        api_key="key", base_url=api.url, transport=AsyncHTTPXTransport()
+    )
+    async with client:
+        assert await client.get_events(sport="football") == EVENTS
+        assert [e async for e in client.iter_events(sport="football")] == EVENTS
@@ -0,0 +1,78 @@
+"""Tests for de-vigging and the local ValueScanner."""
+
+import pytest
+
+from odds_api.book import OddsBook
+
+np = pytest.importorskip("numpy")
+
+from odds_api.value import ValueScanner, devig  # noqa: E402
+
+ROWS = [[1.90, 1.90, 0.0], [2.80, 3.30, 2.60], [1.25, 4.50, 11.0]]
+
+
+def moneyline(**prices):
+    return [{"name": "ML", "odds": [prices]}]
+
+
+@pytest.mark.parametrize("method", ["multiplicative", "power", "shin"])
+def test_devig_rows_sum_to_one(method):
+    fair = devig(ROWS, method)
+    assert fair.shape == (3, 3)
+    assert fair.sum(axis=1) == pytest.approx([1.0, 1.0, 1.0])
+    assert fair[0] == pytest.approx([0.5, 0.5, 0.0])
+    # NaN and 0 both mark outcomes that are not offered
+    assert devig([[2.0, np.nan, 2.0]], method)[0] == pytest.approx([0.5, 0, 0.5])
+
+
+def test_power_and_shin_shift_margin_to_longshots():
+    multiplicative = devig(ROWS, "multiplicative")[2]
+    for method in ("power", "shin"):
+        fair = devig(ROWS, method)[2]
+        assert fair[0] > multiplicative[0]
+        assert fair[2] < multiplicative[2]
+
+
+def test_shin_without_overround_is_multiplicative():
+    prices = [[2.0, 2.1]]
+    assert devig(prices, "shin") == pytest.approx(devig(prices, "multiplicative"))
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        devig(ROWS, "additive")
+    with pytest.raises(ValueError):
+        ValueScanner(OddsBook(), method="additive")
+
+
+@pytest.fixture
+def book():
+    book = OddsBook()
+    book.replace("1", "Sharp", moneyline(home="1.90", away="1.90"))
+    book.replace("1", "Soft", moneyline(home="2.10", away="1.80"))
+    book.replace("1", "Other", moneyline(home="2.02", away="1.70"))
+    # The sharp book misses the draw of a 3-way market: no fair line
+    book.replace("2", "Sharp", moneyline(home="2.00", away="4.00"))
+    book.replace("2", "Soft", moneyline(home="3.00", draw="3.40", away="5.00"))
+    return book
+
+
+def test_scan_ranks_prices_beating_the_fair_line(book):
+    bets = ValueScanner(book, sharp="Sharp").scan()
+    assert [(b.bookmaker, b.outcome) for b in bets] == [
+        ("Soft", "home"),
+        ("Other", "home"),
+    ]
+    best = bets[0]
+    assert best.event.id == "1"
+    assert best.expected_value == pytest.approx(5.0)
+    assert best.extra == {"fairProbability": 0.5, "fairPrice": 2.0}
+
+
+def test_scan_filters(book):
+    assert len(ValueScanner(book, sharp="Sharp", min_edge=4.5).scan()) == 1
+    assert len(ValueScanner(book, sharp="Sharp").scan(top=1)) == 1
+    (bet,) = ValueScanner(book, sharp="Sharp", bookmakers=["Other"]).scan()
+    assert bet.price == 2.02
+    assert ValueScanner(book, sharp="Sharp", markets=["Spread"]).scan() == []
+    assert ValueScanner(book, sharp="Pinnacle").scan() == []